@@ -5,9 +5,11 @@ Enhanced with PMI-CPMAI pattern classification and initiative matching
 """
 from typing import Dict, Any, List
 import json
+import orjson
 from openai import OpenAI
 from app.agents.base_agent import BaseAgent
 from app.core.config import settings
+from app.core.openai_client import get_openai_client, run_openai_call
 
 
 def _extract_json_from_text(text: str) -> dict:
@@ -18,7 +20,7 @@ def _extract_json_from_text(text: str) -> dict:
 
     # Fast-path
     try:
-        return json.loads(text)
+        return orjson.loads(text)
     except Exception:
         pass
 
@@ -31,7 +33,7 @@ def _extract_json_from_text(text: str) -> dict:
             if candidate.lower().startswith("json"):
                 candidate = candidate[4:].strip()
             try:
-                return json.loads(candidate)
+                return orjson.loads(candidate)
             except Exception:
                 continue
 
@@ -40,7 +42,7 @@ def _extract_json_from_text(text: str) -> dict:
     end = text.rfind("}")
     if start != -1 and end != -1 and end > start:
         candidate = text[start : end + 1]
-        return json.loads(candidate)
+        return orjson.loads(candidate)
 
     raise ValueError("Failed to parse JSON from model response")
 
@@ -59,7 +61,7 @@ class AIProjectManagerAgent(BaseAgent):
         BaseAgent requires a configured OpenAI client + model, so we default them
         from application settings.
         """
-        client = openai_client or OpenAI(api_key=settings.openai_api_key)
+        client = openai_client or get_openai_client()
         super().__init__(client, model or settings.OPENAI_MODEL)
 
     # PMI-CPMAI Seven Patterns
@@ -130,12 +132,13 @@ Analyze this problem and respond in JSON format:
             # Some models (or older OpenAI library combos) can error on response_format.
             # We try strict JSON first, then fall back to plain text + robust parsing.
             try:
-                response = self.client.chat.completions.create(
+                response = await run_openai_call(
+                    self.client.chat.completions.create,
                     **api_params,
                     response_format={"type": "json_object"}
                 )
             except Exception:
-                response = self.client.chat.completions.create(**api_params)
+                response = await run_openai_call(self.client.chat.completions.create, **api_params)
 
             content = response.choices[0].message.content
             result = _extract_json_from_text(content)
@@ -231,12 +234,13 @@ Generate 3-5 use cases, ordered by alignment score (highest first).
             }
 
             try:
-                response = self.client.chat.completions.create(
+                response = await run_openai_call(
+                    self.client.chat.completions.create,
                     **api_params,
                     response_format={"type": "json_object"}
                 )
             except Exception:
-                response = self.client.chat.completions.create(**api_params)
+                response = await run_openai_call(self.client.chat.completions.create, **api_params)
 
             content = response.choices[0].message.content
             result = _extract_json_from_text(content)
@@ -336,12 +340,13 @@ Respond in JSON format:
             }
 
             try:
-                response = self.client.chat.completions.create(
+                response = await run_openai_call(
+                    self.client.chat.completions.create,
                     **api_params,
                     response_format={"type": "json_object"}
                 )
             except Exception:
-                response = self.client.chat.completions.create(**api_params)
+                response = await run_openai_call(self.client.chat.completions.create, **api_params)
 
             content = response.choices[0].message.content
             result = _extract_json_from_text(content)
@@ -9,9 +9,12 @@ Provides shared functionality for all AI agents including:
 - Confidence score validation
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 from openai import OpenAI
 import logging
+import orjson
+
+from app.core.openai_client import run_openai_call
 
 logger = logging.getLogger(__name__)
 
@@ -45,23 +48,50 @@ class BaseAgent:
         self.model = model
         self.agent_name = self.__class__.__name__
     
+    def _build_messages(self, prompt: str, system_message: Optional[str] = None) -> list:
+        """Build a chat message list from a user prompt and optional system message."""
+        messages = []
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
     async def _call_openai(
         self,
-        messages: list,
+        messages: Optional[list] = None,
         temperature: float = 0.5,
-        response_format: Optional[Dict[str, str]] = None
-    ) -> str:
+        response_format: Optional[Dict[str, str]] = None,
+        prompt: Optional[str] = None,
+        system_message: Optional[str] = None
+    ) -> Any:
         """
         Make a call to OpenAI API with error handling and logging.
         
+        Agents either pass a full ``messages`` list, or a ``prompt`` with an
+        optional ``system_message``. The prompt form returns the standard
+        success/error response dict (``data`` holds the raw content string).
+        
         Args:
             messages: List of message dictionaries with role and content
             temperature: Sampling temperature (0.0-1.0)
             response_format: Optional response format (e.g., {"type": "json_object"})
+            prompt: User prompt (used when messages is not given)
+            system_message: Optional system message for the prompt form
             
         Returns:
-            String response content from the API
+            String response content from the API, or a response dict for the prompt form
         """
+        if messages is None:
+            try:
+                content = await self._call_openai(
+                    messages=self._build_messages(prompt, system_message),
+                    temperature=temperature,
+                    response_format=response_format
+                )
+            except Exception as e:
+                return self._handle_error(e)
+            return self._format_success_response(content)
+        
         try:
             logger.info(f"{self.agent_name}: Making OpenAI API call")
             
@@ -77,7 +107,7 @@ class BaseAgent:
                 api_params["response_format"] = response_format
             
             # Make API call
-            response = self.client.chat.completions.create(**api_params)
+            response = await run_openai_call(self.client.chat.completions.create, **api_params)
             
             # Extract content
             content = response.choices[0].message.content
@@ -90,6 +120,51 @@ class BaseAgent:
             logger.error(f"{self.agent_name}: OpenAI API call failed - {str(e)}")
             raise
     
+    def _stream_openai(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.5,
+        response_format: Optional[Dict[str, str]] = None
+    ) -> Iterator[str]:
+        """
+        Start a streaming chat completion and return an iterator of content deltas.
+        
+        The request is sent before this returns, so configuration and
+        connection errors raise here rather than mid-stream.
+        
+        Args:
+            prompt: User prompt
+            system_message: Optional system message
+            temperature: Sampling temperature (0.0-1.0)
+            response_format: Optional response format (e.g., {"type": "json_object"})
+            
+        Returns:
+            Iterator yielding response text chunks as they are generated
+        """
+        logger.info(f"{self.agent_name}: Making streaming OpenAI API call")
+        
+        api_params = {
+            "model": self.model,
+            "messages": self._build_messages(prompt, system_message),
+            "temperature": temperature,
+            "stream": True
+        }
+        if response_format:
+            api_params["response_format"] = response_format
+        
+        try:
+            stream = self.client.chat.completions.create(**api_params)
+        except Exception as e:
+            logger.error(f"{self.agent_name}: OpenAI API call failed - {str(e)}")
+            raise
+        
+        return (
+            chunk.choices[0].delta.content
+            for chunk in stream
+            if chunk.choices and chunk.choices[0].delta.content
+        )
+    
     def _handle_error(self, exception: Exception) -> Dict[str, Any]:
         """
         Handle errors gracefully and return structured error response.
@@ -216,12 +291,10 @@ class BaseAgent:
         Returns:
             Parsed JSON dictionary
         """
-        import json
-        
         # Try direct JSON parse first
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
             pass
         
         # Try to extract JSON from markdown code blocks
@@ -230,19 +303,19 @@ class BaseAgent:
             end = content.find("```", start)
             if end != -1:
                 json_str = content[start:end].strip()
-                return json.loads(json_str)
+                return orjson.loads(json_str)
         elif "```" in content:
             start = content.find("```") + 3
             end = content.find("```", start)
             if end != -1:
                 json_str = content[start:end].strip()
-                return json.loads(json_str)
+                return orjson.loads(json_str)
         
         # Try to find JSON object in the content
         start = content.find("{")
         end = content.rfind("}")
         if start != -1 and end != -1:
             json_str = content[start:end+1]
-            return json.loads(json_str)
+            return orjson.loads(json_str)
         
         raise ValueError(f"Could not parse JSON from response: {content[:200]}")
@@ -17,7 +17,7 @@ Guardrails:
 - Source-linked reasoning
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
 from .base_agent import BaseAgent
 
 
@@ -50,6 +50,32 @@ class ExecutiveAgent(BaseAgent):
         Returns:
             Dictionary with narrative, key points, and chart recommendations
         """
+        return await self._call_openai(
+            **self._executive_narrative_request(portfolio_data, report_type, audience, include_charts, tone)
+        )
+    
+    def stream_executive_narrative(
+        self,
+        portfolio_data: Dict[str, Any],
+        report_type: str,
+        audience: str = "board",
+        include_charts: bool = True,
+        tone: str = "professional"
+    ) -> Iterator[str]:
+        """Streaming variant of generate_executive_narrative; yields raw JSON text chunks."""
+        return self._stream_openai(
+            **self._executive_narrative_request(portfolio_data, report_type, audience, include_charts, tone)
+        )
+    
+    def _executive_narrative_request(
+        self,
+        portfolio_data: Dict[str, Any],
+        report_type: str,
+        audience: str,
+        include_charts: bool,
+        tone: str
+    ) -> Dict[str, Any]:
+        """Build the OpenAI request for generate_executive_narrative."""
         prompt = f"""
         As a Chief AI Officer preparing a {report_type} for the {audience}, create a compelling executive narrative:
         
@@ -100,14 +126,12 @@ class ExecutiveAgent(BaseAgent):
         
         system_message = "You are a Chief AI Officer creating executive communications. Be concise, data-driven, and board-appropriate."
         
-        result = await self._call_openai(
-            prompt=prompt,
-            system_message=system_message,
-            temperature=0.6,
-            response_format={"type": "json_object"}
-        )
-        
-        return result
+        return {
+            "prompt": prompt,
+            "system_message": system_message,
+            "temperature": 0.6,
+            "response_format": {"type": "json_object"}
+        }
     
     async def explain_trade_offs(
         self,
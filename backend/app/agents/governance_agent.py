@@ -17,7 +17,7 @@ Guardrails:
 - Source-linked explanations
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from .base_agent import BaseAgent
 
 
@@ -47,6 +47,24 @@ class GovernanceAgent(BaseAgent):
         Returns:
             Dictionary with completeness assessment and missing artifacts
         """
+        return await self._call_openai(**self._compliance_check_request(initiative_data, evidence_documents, risk_tier))
+    
+    def stream_compliance_completeness(
+        self, 
+        initiative_data: Dict[str, Any],
+        evidence_documents: List[Dict[str, Any]],
+        risk_tier: str
+    ) -> Iterator[str]:
+        """Streaming variant of check_compliance_completeness; yields raw JSON text chunks."""
+        return self._stream_openai(**self._compliance_check_request(initiative_data, evidence_documents, risk_tier))
+    
+    def _compliance_check_request(
+        self, 
+        initiative_data: Dict[str, Any],
+        evidence_documents: List[Dict[str, Any]],
+        risk_tier: str
+    ) -> Dict[str, Any]:
+        """Build the OpenAI request for check_compliance_completeness."""
         prompt = f"""
         As a Compliance Agent, assess the completeness of governance artifacts for this AI initiative:
         
@@ -128,14 +146,12 @@ class GovernanceAgent(BaseAgent):
         
         system_message = "You are a Compliance Agent specializing in AI governance. You provide recommendations but NEVER approve initiatives. All approvals require human decision-making."
         
-        result = await self._call_openai(
-            prompt=prompt,
-            system_message=system_message,
-            temperature=0.3,
-            response_format={"type": "json_object"}
-        )
-        
-        return result
+        return {
+            "prompt": prompt,
+            "system_message": system_message,
+            "temperature": 0.3,
+            "response_format": {"type": "json_object"}
+        }
     
     async def map_regulations(
         self, 
@@ -255,6 +271,22 @@ class GovernanceAgent(BaseAgent):
         Returns:
             Dictionary with drafted risk statements and recommendations
         """
+        return await self._call_openai(**self._risk_statement_request(risk_data, initiative_data))
+    
+    def stream_risk_statement(
+        self, 
+        risk_data: Dict[str, Any],
+        initiative_data: Dict[str, Any]
+    ) -> Iterator[str]:
+        """Streaming variant of draft_risk_statement; yields raw JSON text chunks."""
+        return self._stream_openai(**self._risk_statement_request(risk_data, initiative_data))
+    
+    def _risk_statement_request(
+        self, 
+        risk_data: Dict[str, Any],
+        initiative_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the OpenAI request for draft_risk_statement."""
         prompt = f"""
         As a Risk Advisor Agent, draft clear and actionable risk statements for this AI initiative:
         
@@ -325,14 +357,12 @@ class GovernanceAgent(BaseAgent):
         
         system_message = "You are a Risk Advisor Agent specializing in AI risk management. You provide risk analysis but NEVER approve risk acceptance. All risk decisions require human approval."
         
-        result = await self._call_openai(
-            prompt=prompt,
-            system_message=system_message,
-            temperature=0.4,
-            response_format={"type": "json_object"}
-        )
-        
-        return result
+        return {
+            "prompt": prompt,
+            "system_message": system_message,
+            "temperature": 0.4,
+            "response_format": {"type": "json_object"}
+        }
     
     async def recommend_risk_controls(
         self, 
@@ -458,6 +488,22 @@ class GovernanceAgent(BaseAgent):
         Returns:
             Dictionary with model card template and pre-filled sections
         """
+        return await self._call_openai(**self._model_card_request(initiative_data, model_details))
+    
+    def stream_model_card(
+        self, 
+        initiative_data: Dict[str, Any],
+        model_details: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """Streaming variant of generate_model_card; yields raw JSON text chunks."""
+        return self._stream_openai(**self._model_card_request(initiative_data, model_details))
+    
+    def _model_card_request(
+        self, 
+        initiative_data: Dict[str, Any],
+        model_details: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build the OpenAI request for generate_model_card."""
         prompt = f"""
         Generate a Model Card template following Google's Model Card framework for this AI initiative:
         
@@ -555,11 +601,9 @@ class GovernanceAgent(BaseAgent):
         
         system_message = "You are an AI documentation specialist helping create Model Cards following Google's framework."
         
-        result = await self._call_openai(
-            prompt=prompt,
-            system_message=system_message,
-            temperature=0.3,
-            response_format={"type": "json_object"}
-        )
-        
-        return result
+        return {
+            "prompt": prompt,
+            "system_message": system_message,
+            "temperature": 0.3,
+            "response_format": {"type": "json_object"}
+        }
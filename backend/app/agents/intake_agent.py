@@ -16,8 +16,10 @@ Guardrails:
 - Never auto-approves initiatives
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from openai import OpenAI
 from .base_agent import BaseAgent
+from .prompt_batcher import PromptBatcher
 
 
 class IntakeAgent(BaseAgent):
@@ -27,14 +29,36 @@ class IntakeAgent(BaseAgent):
     This agent helps users convert free-form text into structured
     initiative data, identifies missing information, and detects
     potential duplicates.
+    
+    Parsing, missing-field detection and classification requests that
+    arrive together are batched into shared API calls.
     """
     
-    async def parse_unstructured_intake(self, text: str) -> Dict[str, Any]:
+    def __init__(self, openai_client: OpenAI, model: str):
+        super().__init__(openai_client, model)
+        self._parse_batcher = PromptBatcher(
+            self,
+            system_message="You are an AI initiative intake specialist who extracts structured data from unstructured text.",
+            temperature=0.3
+        )
+        self._missing_fields_batcher = PromptBatcher(
+            self,
+            system_message="You are an AI intake specialist helping users complete initiative forms.",
+            temperature=0.5
+        )
+        self._classify_batcher = PromptBatcher(
+            self,
+            system_message="You are an AI classification expert specializing in enterprise AI initiatives.",
+            temperature=0.4
+        )
+    
+    async def parse_unstructured_intake(self, text: str, user_id: Optional[int] = None) -> Dict[str, Any]:
         """
         Parse unstructured text into structured initiative data.
         
         Args:
             text: Unstructured description of an AI initiative
+            user_id: Requesting user; only their own requests share a batched call
             
         Returns:
             Dictionary with extracted structured data
@@ -60,23 +84,15 @@ class IntakeAgent(BaseAgent):
         If a field cannot be determined from the text, set it to null.
         """
         
-        system_message = "You are an AI initiative intake specialist who extracts structured data from unstructured text."
-        
-        result = await self._call_openai(
-            prompt=prompt,
-            system_message=system_message,
-            temperature=0.3,
-            response_format={"type": "json_object"}
-        )
-        
-        return result
+        return await self._parse_batcher.submit(prompt, caller=user_id)
     
-    async def detect_missing_fields(self, initiative_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def detect_missing_fields(self, initiative_data: Dict[str, Any], user_id: Optional[int] = None) -> Dict[str, Any]:
         """
         Detect missing required fields and generate follow-up questions.
         
         Args:
             initiative_data: Partially filled initiative data
+            user_id: Requesting user; only their own requests share a batched call
             
         Returns:
             Dictionary with missing fields and suggested questions
@@ -115,23 +131,15 @@ class IntakeAgent(BaseAgent):
         }}
         """
         
-        system_message = "You are an AI intake specialist helping users complete initiative forms."
-        
-        result = await self._call_openai(
-            prompt=prompt,
-            system_message=system_message,
-            temperature=0.5,
-            response_format={"type": "json_object"}
-        )
-        
-        return result
+        return await self._missing_fields_batcher.submit(prompt, caller=user_id)
     
-    async def classify_use_case(self, initiative_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def classify_use_case(self, initiative_data: Dict[str, Any], user_id: Optional[int] = None) -> Dict[str, Any]:
         """
         Automatically classify the AI use case based on description and details.
         
         Args:
             initiative_data: Initiative data to classify
+            user_id: Requesting user; only their own requests share a batched call
             
         Returns:
             Dictionary with classification results
@@ -160,16 +168,7 @@ class IntakeAgent(BaseAgent):
         }}
         """
         
-        system_message = "You are an AI classification expert specializing in enterprise AI initiatives."
-        
-        result = await self._call_openai(
-            prompt=prompt,
-            system_message=system_message,
-            temperature=0.4,
-            response_format={"type": "json_object"}
-        )
-        
-        return result
+        return await self._classify_batcher.submit(prompt, caller=user_id)
     
     async def find_similar_initiatives(
         self, 
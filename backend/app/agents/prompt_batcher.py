@@ -0,0 +1,159 @@
+"""
+Prompt Batcher
+
+Coalesces same-shaped agent prompts that arrive close together into a
+single chat completion.
+
+Requests for one batcher share the agent, system message and temperature,
+so N concurrent requests can be answered by one call that returns a JSON
+list of N results. Only requests from the same caller (user) are merged,
+so one user's data never ends up in the context that answers another's.
+A lone request is sent unchanged, and a batched reply
+that cannot be split back into per-request results falls back to one call
+per request, so callers always get the same response dict as
+``BaseAgent._call_openai``.
+"""
+
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+import asyncio
+import logging
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class PromptBatcher:
+    """
+    Micro-batching queue for one kind of agent prompt.
+
+    Callers ``await submit(prompt, caller)``; a worker task drains up to
+    ``max_batch`` prompts, waiting at most ``max_wait`` seconds after the
+    first one for others to arrive, and answers each caller's prompts with
+    one API call. Prompts submitted without a caller are answered alone.
+    """
+
+    def __init__(
+        self,
+        agent,
+        system_message: str,
+        temperature: float,
+        max_batch: int = 16,
+        max_wait: float = 0.05
+    ):
+        self.agent = agent
+        self.system_message = system_message
+        self.temperature = temperature
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Tasks answering batches, referenced until done so they are not collected
+        self._answering: Set[asyncio.Task] = set()
+
+    async def submit(self, prompt: str, caller: Optional[Hashable] = None) -> Dict[str, Any]:
+        """Queue a prompt and wait for its response dict."""
+        future = asyncio.get_running_loop().create_future()
+        await self._get_queue().put((prompt, caller, future))
+        return await future
+
+    def _get_queue(self) -> asyncio.Queue:
+        """Return the request queue, starting its worker on the current loop if needed."""
+        loop = asyncio.get_running_loop()
+        worker = self._worker
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue):
+        """Collect queued prompts into batches and answer them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[str, Optional[Hashable], asyncio.Future]] = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Answer each caller's prompts in a separate task so the next
+            # batch can start collecting
+            groups: Dict[Hashable, List[Tuple[str, asyncio.Future]]] = {}
+            for prompt, caller, future in batch:
+                key = caller if caller is not None else object()
+                groups.setdefault(key, []).append((prompt, future))
+            for group in groups.values():
+                task = loop.create_task(self._answer(group))
+                self._answering.add(task)
+                task.add_done_callback(self._answered)
+
+    def _answered(self, task: asyncio.Task):
+        self._answering.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"{self.agent.agent_name}: Answering a batch failed - {task.exception()}")
+
+    async def _answer(self, batch: List[Tuple[str, asyncio.Future]]):
+        """Resolve every future in the batch with its response dict."""
+        prompts = [prompt for prompt, _ in batch]
+        try:
+            if len(prompts) == 1:
+                results = [await self._call_single(prompts[0])]
+            else:
+                results = await self._call_batch(prompts)
+        except Exception as e:
+            results = [self.agent._handle_error(e)] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _call_single(self, prompt: str) -> Dict[str, Any]:
+        return await self.agent._call_openai(
+            prompt=prompt,
+            system_message=self.system_message,
+            temperature=self.temperature,
+            response_format={"type": "json_object"}
+        )
+
+    async def _call_batch(self, prompts: List[str]) -> List[Dict[str, Any]]:
+        """Answer several prompts with one call, falling back to one call each."""
+        sections = "\n\n".join(
+            f"### Request {i}\n{prompt.strip()}" for i, prompt in enumerate(prompts, 1)
+        )
+        batch_prompt = (
+            f"You will receive {len(prompts)} independent requests. Answer each one "
+            "exactly as if it had been sent on its own, following its instructions "
+            "and JSON structure.\n\n"
+            f"{sections}\n\n"
+            'Return a JSON object {"results": [...]} whose list holds one JSON '
+            "object per request, in the same order as the requests."
+        )
+
+        try:
+            content = await self.agent._call_openai(
+                messages=self.agent._build_messages(batch_prompt, self.system_message),
+                temperature=self.temperature,
+                response_format={"type": "json_object"}
+            )
+            results = orjson.loads(content).get("results")
+            if (
+                isinstance(results, list)
+                and len(results) == len(prompts)
+                and all(isinstance(item, dict) for item in results)
+            ):
+                return [
+                    self.agent._format_success_response(orjson.dumps(item).decode())
+                    for item in results
+                ]
+            logger.warning(
+                f"{self.agent.agent_name}: Batched response did not match "
+                f"{len(prompts)} requests, retrying individually"
+            )
+        except (orjson.JSONDecodeError, AttributeError) as e:
+            logger.warning(f"{self.agent.agent_name}: Could not split batched response ({e}), retrying individually")
+
+        return list(await asyncio.gather(*(self._call_single(prompt) for prompt in prompts)))
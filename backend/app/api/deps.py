@@ -2,12 +2,15 @@ from typing import Generator, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db
 from app.core.config import settings
 from app.core.security import decode_token
 from app.models.user import User
+from app.models.initiative import Initiative
 from app.schemas.user import TokenPayload
+from app.services.scoring_service import ScoringService
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
@@ -71,3 +74,24 @@ def get_current_superuser(
             detail="Not enough privileges"
         )
     return current_user
+
+
+def get_initiative_or_404(
+    initiative_id: int,
+    db: Session = Depends(get_db),
+) -> Initiative:
+    """Get initiative by ID or raise 404."""
+    initiative = db.get(Initiative, initiative_id)
+    if not initiative:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Initiative not found"
+        )
+    return initiative
+
+
+def get_scoring_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> ScoringService:
+    """Get a scoring service bound to the request's async session."""
+    return ScoringService(db)
@@ -8,6 +8,7 @@ from typing import List, Optional
 from datetime import datetime
 
 from app.api.deps import get_db, get_current_user
+from app.core.openai_client import get_openai_client
 from app.models.user import User
 from app.schemas.ai_project import (
     # Business Understanding
@@ -75,11 +76,9 @@ async def classify_ai_pattern(
     try:
         from app.services.openai_service import openai_service
         # Use the openai_service which has the client and model configured
-        from openai import OpenAI
         from app.core.config import settings
         
-        client = OpenAI(api_key=settings.openai_api_key)
-        agent = AIProjectManagerAgent(client, settings.OPENAI_MODEL)
+        agent = AIProjectManagerAgent(get_openai_client(), settings.OPENAI_MODEL)
         result = await agent.classify_ai_pattern(business_problem)
         return result
     except Exception as e:
@@ -223,11 +222,9 @@ async def recommend_best_initiative(
     Step 4 of PMI-CPMAI workflow.
     """
     try:
-        from openai import OpenAI
         from app.core.config import settings
         
-        client = OpenAI(api_key=settings.openai_api_key)
-        agent = AIProjectManagerAgent(client, settings.OPENAI_MODEL)
+        agent = AIProjectManagerAgent(get_openai_client(), settings.OPENAI_MODEL)
         result = await agent.recommend_best_initiative(
             business_problem=business_problem,
             ai_pattern=ai_pattern,
@@ -364,7 +361,7 @@ async def generate_tactical_use_cases(
             raise HTTPException(status_code=422, detail="ai_pattern is required")
 
         # Get initiative details
-        initiative = db.query(Initiative).filter(Initiative.id == initiative_id).first()
+        initiative = db.get(Initiative, initiative_id)
         if not initiative:
             raise HTTPException(status_code=404, detail="Initiative not found")
         
@@ -419,15 +416,13 @@ async def generate_tactical_use_cases(
         }
         
         # Generate use cases using AI
-        from openai import OpenAI
         from app.core.config import settings
 
         # Hard fail early if API key is missing rather than returning confusing "NoneType" errors.
         if not getattr(settings, "openai_api_key", None):
             raise HTTPException(status_code=500, detail="OPENAI_API_KEY is not configured")
 
-        client = OpenAI(api_key=settings.openai_api_key)
-        agent = AIProjectManagerAgent(client, settings.OPENAI_MODEL)
+        agent = AIProjectManagerAgent(get_openai_client(), settings.OPENAI_MODEL)
 
         result = await agent.generate_tactical_use_cases(
             business_problem=business_problem,
@@ -78,7 +78,7 @@ async def upload_attachment(
     Upload a file attachment for an initiative.
     """
     # Verify initiative exists
-    initiative = db.query(Initiative).filter(Initiative.id == initiative_id).first()
+    initiative = db.get(Initiative, initiative_id)
     if not initiative:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -147,7 +147,7 @@ def create_link_attachment(
     Create a link attachment (URL) for an initiative.
     """
     # Verify initiative exists
-    initiative = db.query(Initiative).filter(Initiative.id == attachment_in.initiative_id).first()
+    initiative = db.get(Initiative, attachment_in.initiative_id)
     if not initiative:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -187,7 +187,7 @@ def get_initiative_attachments(
     Get all attachments for an initiative.
     """
     # Verify initiative exists
-    initiative = db.query(Initiative).filter(Initiative.id == initiative_id).first()
+    initiative = db.get(Initiative, initiative_id)
     if not initiative:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,8 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.api.deps import get_db, get_current_user
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from app.api.deps import get_db, get_current_user, get_initiative_or_404
+from app.api.responses import orm_list_response
 from app.models.user import User
+from app.models.initiative import Initiative
+from app.models.risk import Risk
 from app.models.governance import ApprovalDecision
 from app.schemas.governance import (
     # Workflow schemas
@@ -25,10 +30,93 @@ from app.schemas.governance import (
 )
 from app.services.governance_service import GovernanceService
 from app.services.openai_service import openai_service
-import json
+from app.core.cache import TTLCache
+from app.core.database import run_in_new_session
+from app.core.openai_client import iterate_openai_stream, run_openai_call
+import asyncio
+import hashlib
+import orjson
 
 router = APIRouter()
 
+# Compliance check results, one entry per initiative. Each entry carries the
+# fingerprint of the snapshot it was computed from, so a changed initiative,
+# evidence set or risk tier is recomputed instead of served stale.
+_compliance_cache = TTLCache(ttl_seconds=3600, maxsize=512)
+
+
+# Compliance checks currently running, so concurrent identical requests
+# share one agent call instead of each starting their own. Each task runs
+# the whole check independently of the request that started it.
+_compliance_inflight: Dict[Tuple[int, str], asyncio.Task] = {}
+
+
+async def _stream_agent_json(start_stream: Callable[[], Iterator[str]]) -> StreamingResponse:
+    """
+    Relay an agent's JSON output to the client as it is generated.
+    
+    The body is the same JSON document the buffered endpoints returned, so
+    clients that read the whole response keep working. Errors raised while
+    starting the stream surface as a 500 before any bytes are sent. The
+    request is opened on the OpenAI thread pool, so the event loop keeps
+    serving other requests until the first token arrives, and the rest of
+    the response is read there as well.
+    """
+    try:
+        chunks = await run_openai_call(start_stream)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return StreamingResponse(
+        iterate_openai_stream(chunks),
+        media_type="application/json",
+        headers={"Content-Encoding": "identity"}
+    )
+
+
+async def _run_compliance_check(
+    start_stream: Callable[[], Iterator[str]],
+    chunks: asyncio.Queue,
+    initiative_id: int,
+    fingerprint: str
+) -> dict:
+    """
+    Run a compliance check to completion, cache its result and return it.
+    
+    Each text chunk is also put on ``chunks`` as it arrives, for the
+    request that started the check to relay.
+    """
+    loop = asyncio.get_running_loop()
+    
+    def relay() -> str:
+        parts = []
+        for chunk in start_stream():
+            parts.append(chunk)
+            loop.call_soon_threadsafe(chunks.put_nowait, chunk)
+        return "".join(parts)
+    
+    data = orjson.loads(await run_openai_call(relay))
+    _compliance_cache.set(initiative_id, (fingerprint, data))
+    return data
+
+
+def _finish_compliance_check(key: Tuple[int, str], task: asyncio.Task, chunks: asyncio.Queue) -> None:
+    if _compliance_inflight.get(key) is task:
+        del _compliance_inflight[key]
+    # Chunks put by the worker thread are already queued ahead of this
+    chunks.put_nowait(None)
+    if not task.cancelled():
+        # Mark a failure as retrieved in case every caller has gone away
+        task.exception()
+
+
+def _compliance_fingerprint(initiative, evidence_docs, risk_tier: str) -> str:
+    """Hash the inputs of a compliance check."""
+    digest = hashlib.sha256(f"{initiative.id}|{initiative.updated_at}|{risk_tier}".encode())
+    for doc in sorted(evidence_docs, key=lambda d: d.id):
+        digest.update(f"|{doc.id}:{doc.updated_at}".encode())
+    return digest.hexdigest()
+
 
 # ============================================================================
 # Governance Workflow Endpoints
@@ -231,7 +319,7 @@ async def get_initiative_evidence(
 ):
     """Get all evidence documents for an initiative"""
     evidence = GovernanceService.get_initiative_evidence(db, initiative_id)
-    return evidence
+    return orm_list_response(EvidenceDocumentResponse, evidence)
 
 
 @router.put("/evidence/{evidence_id}", response_model=EvidenceDocumentResponse)
@@ -285,7 +373,7 @@ async def get_risk_mitigations(
 ):
     """Get all mitigations for a risk"""
     mitigations = GovernanceService.get_risk_mitigations(db, risk_id)
-    return mitigations
+    return orm_list_response(RiskMitigationResponse, mitigations)
 
 
 @router.put("/mitigations/{mitigation_id}", response_model=RiskMitigationResponse)
@@ -326,7 +414,7 @@ async def get_policies(
 ):
     """Get policies with optional filters"""
     policies = GovernanceService.get_policies(db, policy_type, status)
-    return policies
+    return orm_list_response(PolicyResponse, policies)
 
 
 @router.get("/policies/{policy_id}", response_model=PolicyResponse)
@@ -392,7 +480,7 @@ async def get_compliance_requirements(
 ):
     """Get compliance requirements with optional filter"""
     requirements = GovernanceService.get_compliance_requirements(db, regulation)
-    return requirements
+    return orm_list_response(ComplianceRequirementResponse, requirements)
 
 
 @router.put("/compliance/{requirement_id}", response_model=ComplianceRequirementResponse)
@@ -423,28 +511,23 @@ async def check_compliance(
     Compliance Agent: Check completeness of governance artifacts.
     IMPORTANT: This agent NEVER auto-approves - it only provides recommendations.
     """
-    from app.models.initiative import Initiative
-    
-    # Get initiative
-    initiative = db.query(Initiative).filter(Initiative.id == request.initiative_id).first()
-    if not initiative:
-        raise HTTPException(status_code=404, detail="Initiative not found")
-    
-    # Get evidence documents
-    evidence_docs = GovernanceService.get_initiative_evidence(db, request.initiative_id)
-    
-    # Get workflow to determine risk tier
-    workflow = GovernanceService.get_workflow_by_initiative(db, request.initiative_id)
+    # Get initiative, evidence documents and workflow (for the risk tier)
+    # concurrently, the latter two on sessions of their own
+    initiative, evidence_docs, workflow = await asyncio.gather(
+        run_in_threadpool(get_initiative_or_404, request.initiative_id, db),
+        run_in_threadpool(run_in_new_session, GovernanceService.get_initiative_evidence, request.initiative_id),
+        run_in_threadpool(run_in_new_session, GovernanceService.get_workflow_by_initiative, request.initiative_id)
+    )
     risk_tier = workflow.risk_tier if workflow else "medium"
     
+    # Serve the previous result if nothing it depends on has changed
+    fingerprint = _compliance_fingerprint(initiative, evidence_docs, risk_tier)
+    cached = _compliance_cache.get(initiative.id)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+    
     # Prepare data for AI
-    initiative_data = {
-        "title": initiative.title,
-        "description": initiative.description,
-        "ai_type": initiative.ai_type.value if initiative.ai_type else None,
-        "strategic_domain": initiative.strategic_domain,
-        "data_sources": initiative.data_sources
-    }
+    initiative_data = GovernanceService.initiative_agent_data(initiative)
     
     evidence_list = [
         {
@@ -456,44 +539,60 @@ async def check_compliance(
         for doc in evidence_docs
     ]
     
-    # Call AI agent
-    result = await openai_service.check_compliance_completeness(
-        initiative_data=initiative_data,
-        evidence_documents=evidence_list,
-        risk_tier=risk_tier
-    )
+    # Wait for an identical check that is already running; if it fails,
+    # fall through and run our own
+    key = (initiative.id, fingerprint)
+    inflight = _compliance_inflight.get(key)
+    if inflight is not None:
+        try:
+            # Shielded so one caller disconnecting does not cancel the shared check
+            return await asyncio.shield(inflight)
+        except Exception:
+            pass
     
-    if not result["success"]:
-        raise HTTPException(status_code=500, detail=result["error"])
+    # Call AI agent in a task of its own, so the check finishes (and its
+    # waiters are released) even if this client goes away; its output is
+    # streamed to this client as it is generated
+    chunks: asyncio.Queue = asyncio.Queue()
+    inflight = asyncio.ensure_future(_run_compliance_check(
+        lambda: openai_service.stream_compliance_completeness(
+            initiative_data=initiative_data,
+            evidence_documents=evidence_list,
+            risk_tier=risk_tier
+        ),
+        chunks,
+        initiative.id,
+        fingerprint
+    ))
+    _compliance_inflight[key] = inflight
+    inflight.add_done_callback(lambda done: _finish_compliance_check(key, done, chunks))
+    
+    # Errors before any output surface as a 500
+    first = await chunks.get()
+    if first is None:
+        if inflight.cancelled() or inflight.exception() is None:
+            raise HTTPException(status_code=500, detail="Compliance check returned no output")
+        raise HTTPException(status_code=500, detail=str(inflight.exception()))
     
-    return json.loads(result["data"])
+    async def relay():
+        chunk = first
+        while chunk is not None:
+            yield chunk
+            chunk = await chunks.get()
+    
+    return StreamingResponse(relay(), media_type="application/json", headers={"Content-Encoding": "identity"})
 
 
 @router.post("/ai/compliance/map-regulations")
 async def map_regulations(
-    initiative_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    initiative: Initiative = Depends(get_initiative_or_404)
 ):
     """
     Compliance Agent: Map initiative to applicable regulations.
     """
-    from app.models.initiative import Initiative
-    
-    # Get initiative
-    initiative = db.query(Initiative).filter(Initiative.id == initiative_id).first()
-    if not initiative:
-        raise HTTPException(status_code=404, detail="Initiative not found")
-    
     # Prepare data for AI
-    initiative_data = {
-        "title": initiative.title,
-        "description": initiative.description,
-        "ai_type": initiative.ai_type.value if initiative.ai_type else None,
-        "strategic_domain": initiative.strategic_domain,
-        "business_function": initiative.business_function,
-        "data_sources": initiative.data_sources
-    }
+    initiative_data = GovernanceService.initiative_agent_data(initiative)
     
     # Call AI agent
     result = await openai_service.map_regulations(initiative_data=initiative_data)
@@ -501,7 +600,7 @@ async def map_regulations(
     if not result["success"]:
         raise HTTPException(status_code=500, detail=result["error"])
     
-    return json.loads(result["data"])
+    return orjson.loads(result["data"])
 
 
 # ============================================================================
@@ -518,20 +617,10 @@ async def draft_risk_statement(
     Risk Advisor Agent: Draft clear, actionable risk statements.
     IMPORTANT: This agent NEVER auto-approves - recommendations require human review.
     """
-    from app.models.initiative import Initiative
-    from app.models.risk import Risk
-    
     # Get initiative
     if request.initiative_id:
-        initiative = db.query(Initiative).filter(Initiative.id == request.initiative_id).first()
-        if not initiative:
-            raise HTTPException(status_code=404, detail="Initiative not found")
-        
-        initiative_data = {
-            "title": initiative.title,
-            "description": initiative.description,
-            "ai_type": initiative.ai_type.value if initiative.ai_type else None
-        }
+        initiative = get_initiative_or_404(request.initiative_id, db)
+        initiative_data = GovernanceService.initiative_agent_data(initiative)
     else:
         initiative_data = {
             "title": "New Initiative",
@@ -546,16 +635,13 @@ async def draft_risk_statement(
         "severity": "high"
     }
     
-    # Call AI agent
-    result = await openai_service.draft_risk_statement(
-        risk_data=risk_data,
-        initiative_data=initiative_data
+    # Call AI agent, streaming its output as it is generated
+    return await _stream_agent_json(
+        lambda: openai_service.stream_risk_statement(
+            risk_data=risk_data,
+            initiative_data=initiative_data
+        )
     )
-    
-    if not result["success"]:
-        raise HTTPException(status_code=500, detail=result["error"])
-    
-    return json.loads(result["data"])
 
 
 @router.post("/ai/risk/recommend-controls")
@@ -568,16 +654,13 @@ async def recommend_risk_controls(
     Risk Advisor Agent: Recommend mitigation controls for identified risks.
     IMPORTANT: Recommendations require human approval before implementation.
     """
-    from app.models.risk import Risk
-    from app.models.initiative import Initiative
-    
     # Get risk
-    risk = db.query(Risk).filter(Risk.id == risk_id).first()
+    risk = db.get(Risk, risk_id)
     if not risk:
         raise HTTPException(status_code=404, detail="Risk not found")
     
     # Get initiative
-    initiative = db.query(Initiative).filter(Initiative.id == risk.initiative_id).first()
+    initiative = db.get(Initiative, risk.initiative_id)
     
     # Prepare data for AI
     risk_data = {
@@ -590,11 +673,10 @@ async def recommend_risk_controls(
         "risk_score": risk.risk_score
     }
     
-    initiative_data = {
-        "title": initiative.title if initiative else "",
-        "ai_type": initiative.ai_type.value if initiative and initiative.ai_type else None,
-        "technologies": initiative.technologies if initiative else []
-    }
+    if initiative:
+        initiative_data = GovernanceService.initiative_agent_data(initiative)
+    else:
+        initiative_data = {"title": "", "ai_type": None, "technologies": []}
     
     # Call AI agent
     result = await openai_service.recommend_risk_controls(
@@ -605,7 +687,7 @@ async def recommend_risk_controls(
     if not result["success"]:
         raise HTTPException(status_code=500, detail=result["error"])
     
-    return json.loads(result["data"])
+    return orjson.loads(result["data"])
 
 
 # ============================================================================
@@ -621,34 +703,21 @@ async def generate_model_card(
     """
     Generate a model card template following Google's Model Card framework.
     """
-    from app.models.initiative import Initiative
-    
     # Get initiative
-    initiative = db.query(Initiative).filter(Initiative.id == request.initiative_id).first()
-    if not initiative:
-        raise HTTPException(status_code=404, detail="Initiative not found")
+    initiative = get_initiative_or_404(request.initiative_id, db)
     
     # Prepare data for AI
-    initiative_data = {
-        "title": initiative.title,
-        "description": initiative.description,
-        "ai_type": initiative.ai_type.value if initiative.ai_type else None,
-        "business_objective": initiative.business_objective,
-        "technologies": initiative.technologies
-    }
+    initiative_data = GovernanceService.initiative_agent_data(initiative)
     
     model_details = {
         "name": request.model_name,
         "type": request.model_type
     } if request.model_name else None
     
-    # Call AI agent
-    result = await openai_service.generate_model_card(
-        initiative_data=initiative_data,
-        model_details=model_details
+    # Call AI agent, streaming its output as it is generated
+    return await _stream_agent_json(
+        lambda: openai_service.stream_model_card(
+            initiative_data=initiative_data,
+            model_details=model_details
+        )
     )
-    
-    if not result["success"]:
-        raise HTTPException(status_code=500, detail=result["error"])
-    
-    return json.loads(result["data"])
@@ -1,32 +1,58 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.core.database import get_db
-from app.api.deps import get_current_active_user
+from app.api.deps import get_current_active_user, get_initiative_or_404
+from app.api.responses import orm_list_response
 from app.models.user import User
 from app.models.initiative import Initiative
 from app.schemas.initiative import InitiativeCreate, InitiativeUpdate, Initiative as InitiativeSchema
 from app.services.openai_service import openai_service
 from app.services.semantic_search_service import semantic_search_service
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+async def _refresh_initiative_embedding(initiative_data: dict) -> None:
+    """Regenerate an initiative's embedding after the response has been sent."""
+    try:
+        await semantic_search_service.add_or_update_initiative_embedding(initiative_data)
+    except Exception as e:
+        # Log error; the initiative itself has already been saved
+        logger.warning(f"Failed to update embedding for initiative {initiative_data['id']}: {e}", exc_info=True)
+
+
 @router.get("/", response_model=List[InitiativeSchema])
 def list_initiatives(
     skip: int = 0,
     limit: int = 100,
+    owner_id: Optional[int] = None,
+    after_id: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """List all initiatives."""
-    initiatives = db.query(Initiative).offset(skip).limit(limit).all()
-    return initiatives
+    """
+    List initiatives ordered by ID.
+    
+    Pass the last ID of the previous page as `after_id` to page by key
+    instead of offset (preferred for deep pages).
+    """
+    query = db.query(Initiative)
+    if owner_id is not None:
+        query = query.filter(Initiative.owner_id == owner_id)
+    if after_id is not None:
+        query = query.filter(Initiative.id > after_id)
+    initiatives = query.order_by(Initiative.id).offset(skip).limit(limit).all()
+    return orm_list_response(InitiativeSchema, initiatives)
 
 
 @router.post("/", response_model=InitiativeSchema, status_code=status.HTTP_201_CREATED)
 async def create_initiative(
     initiative_in: InitiativeCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -39,55 +65,38 @@ async def create_initiative(
     db.commit()
     db.refresh(initiative)
     
-    # Generate embedding for the new initiative
-    try:
-        initiative_data = {
-            "id": initiative.id,
-            "title": initiative.title,
-            "description": initiative.description,
-            "business_objective": initiative.business_objective or "",
-            "ai_pattern": "",  # Will be populated when user goes through PMI-CPMAI workflow
-            "status": ""
-        }
-        await semantic_search_service.add_or_update_initiative_embedding(initiative_data)
-    except Exception as e:
-        # Log error but don't fail the initiative creation
-        print(f"Warning: Failed to generate embedding for initiative {initiative.id}: {str(e)}")
+    # Generate embedding for the new initiative once the response is sent
+    initiative_data = {
+        "id": initiative.id,
+        "title": initiative.title,
+        "description": initiative.description,
+        "business_objective": initiative.business_objective or "",
+        "ai_pattern": "",  # Will be populated when user goes through PMI-CPMAI workflow
+        "status": ""
+    }
+    background_tasks.add_task(_refresh_initiative_embedding, initiative_data)
     
     return initiative
 
 
 @router.get("/{initiative_id}", response_model=InitiativeSchema)
 def get_initiative(
-    initiative_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    initiative: Initiative = Depends(get_initiative_or_404)
 ):
     """Get initiative by ID."""
-    initiative = db.query(Initiative).filter(Initiative.id == initiative_id).first()
-    if not initiative:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Initiative not found"
-        )
     return initiative
 
 
 @router.put("/{initiative_id}", response_model=InitiativeSchema)
 async def update_initiative(
-    initiative_id: int,
     initiative_in: InitiativeUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    initiative: Initiative = Depends(get_initiative_or_404)
 ):
     """Update an initiative."""
-    initiative = db.query(Initiative).filter(Initiative.id == initiative_id).first()
-    if not initiative:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Initiative not found"
-        )
-    
     # Update fields
     update_data = initiative_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
@@ -96,38 +105,27 @@ async def update_initiative(
     db.commit()
     db.refresh(initiative)
     
-    # Regenerate embedding for the updated initiative
-    try:
-        initiative_data = {
-            "id": initiative.id,
-            "title": initiative.title,
-            "description": initiative.description,
-            "business_objective": initiative.business_objective or "",
-            "ai_pattern": "",  # Will be populated when user goes through PMI-CPMAI workflow
-            "status": ""
-        }
-        await semantic_search_service.add_or_update_initiative_embedding(initiative_data)
-    except Exception as e:
-        # Log error but don't fail the initiative update
-        print(f"Warning: Failed to update embedding for initiative {initiative.id}: {str(e)}")
+    # Regenerate embedding for the updated initiative once the response is sent
+    initiative_data = {
+        "id": initiative.id,
+        "title": initiative.title,
+        "description": initiative.description,
+        "business_objective": initiative.business_objective or "",
+        "ai_pattern": "",  # Will be populated when user goes through PMI-CPMAI workflow
+        "status": ""
+    }
+    background_tasks.add_task(_refresh_initiative_embedding, initiative_data)
     
     return initiative
 
 
 @router.delete("/{initiative_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_initiative(
-    initiative_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    initiative: Initiative = Depends(get_initiative_or_404)
 ):
     """Delete an initiative."""
-    initiative = db.query(Initiative).filter(Initiative.id == initiative_id).first()
-    if not initiative:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Initiative not found"
-        )
-    
     db.delete(initiative)
     db.commit()
     return None
@@ -135,18 +133,10 @@ def delete_initiative(
 
 @router.post("/{initiative_id}/analyze-risks")
 async def analyze_initiative_risks(
-    initiative_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    initiative: Initiative = Depends(get_initiative_or_404)
 ):
     """Use OpenAI to analyze and suggest risks for an initiative."""
-    initiative = db.query(Initiative).filter(Initiative.id == initiative_id).first()
-    if not initiative:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Initiative not found"
-        )
-    
     # Prepare initiative data for analysis
     initiative_data = {
         "title": initiative.title,
@@ -163,18 +153,10 @@ async def analyze_initiative_risks(
 
 @router.post("/{initiative_id}/calculate-priority")
 async def calculate_initiative_priority(
-    initiative_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    initiative: Initiative = Depends(get_initiative_or_404)
 ):
     """Use OpenAI to help calculate initiative priority."""
-    initiative = db.query(Initiative).filter(Initiative.id == initiative_id).first()
-    if not initiative:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Initiative not found"
-        )
-    
     # Prepare initiative data
     initiative_data = {
         "title": initiative.title,
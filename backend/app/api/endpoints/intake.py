@@ -1,8 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, case, or_, select
+from itertools import chain, zip_longest
 from typing import List
-import json
-from app.core.database import get_db
+import orjson
+import logging
+import re
+from app.core.cache import TTLCache
+from app.core.database import get_async_db, get_db, safe_select
 from app.api.deps import get_current_active_user
 from app.models.user import User
 from app.models.initiative import Initiative
@@ -21,9 +28,18 @@ from app.schemas.intake import (
     IntakeFormTemplate as IntakeFormTemplateSchema
 )
 from app.services.openai_service import openai_service
+from app.services.semantic_search_service import semantic_search_service
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Number of existing initiatives shortlisted for the LLM duplicate check
+_SIMILAR_CANDIDATES = 20
+
+# Active templates keyed by (business_unit, ai_type) filter; cleared on any template write
+_templates_cache = TTLCache(ttl_seconds=300, maxsize=128)
+
 
 @router.post("/parse-text", response_model=ParseTextResponse)
 async def parse_unstructured_text(
@@ -33,14 +49,14 @@ async def parse_unstructured_text(
     """
     Parse unstructured text into structured initiative data using AI.
     """
-    result = await openai_service.parse_unstructured_intake(request.text)
+    result = await openai_service.parse_unstructured_intake(request.text, user_id=current_user.id)
     
     if result["success"]:
         # Parse the JSON string response
         try:
-            data = json.loads(result["data"])
+            data = orjson.loads(result["data"])
             return ParseTextResponse(success=True, data=data)
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return ParseTextResponse(success=True, data={"raw": result["data"]})
 
     # Surface AI/provider errors to the client with an actionable message.
@@ -59,18 +75,12 @@ async def validate_intake_data(
     """
     Validate intake data and detect missing fields using AI.
     """
-    result = await openai_service.detect_missing_fields(request.initiative_data)
+    result = await openai_service.detect_missing_fields(request.initiative_data, user_id=current_user.id)
     
     if result["success"]:
         try:
-            data = json.loads(result["data"])
-            return ValidateIntakeResponse(
-                success=True,
-                missing_fields=data.get("missing_fields", []),
-                completeness_score=data.get("completeness_score", 0),
-                suggestions=data.get("suggestions")
-            )
-        except json.JSONDecodeError:
+            return ValidateIntakeResponse.model_validate_json(result["data"])
+        except ValidationError:
             return ValidateIntakeResponse(
                 success=False,
                 missing_fields=[],
@@ -98,19 +108,12 @@ async def classify_use_case(
         "technologies": request.technologies or []
     }
     
-    result = await openai_service.classify_use_case(initiative_data)
+    result = await openai_service.classify_use_case(initiative_data, user_id=current_user.id)
     
     if result["success"]:
         try:
-            data = json.loads(result["data"])
-            return ClassifyUseCaseResponse(
-                success=True,
-                ai_type=data.get("ai_type"),
-                strategic_domain=data.get("strategic_domain"),
-                business_function=data.get("business_function"),
-                risk_tier=data.get("risk_tier")
-            )
-        except json.JSONDecodeError:
+            return ClassifyUseCaseResponse.model_validate_json(result["data"])
+        except ValidationError:
             return ClassifyUseCaseResponse(success=False, error="Failed to parse classification")
 
     raise HTTPException(
@@ -119,6 +122,59 @@ async def classify_use_case(
     )
 
 
+async def _similar_candidates(db: Session, request: FindSimilarRequest) -> List[Row]:
+    """
+    Pick the existing initiatives most likely to overlap with the request.
+    
+    Merges two shortlists: the closest stored initiative embeddings, and
+    the initiatives whose title or description shares a keyword with the
+    request title (then the most recent ones). The second covers
+    initiatives that have no embedding yet. Only the columns the prompt
+    needs are selected, without building ORM objects.
+    """
+    query = select(
+        Initiative.id,
+        Initiative.title,
+        Initiative.description,
+        Initiative.business_objective,
+        Initiative.ai_type_value.label("ai_type"),
+        Initiative.technologies
+    )
+    
+    query_text = "\n".join(filter(None, [request.title, request.description, request.business_objective]))
+    try:
+        matches = await semantic_search_service.find_similar_initiatives(
+            query_text, top_k=_SIMILAR_CANDIDATES, min_similarity=0.0
+        )
+    except Exception as e:
+        logger.warning(f"Semantic shortlist unavailable, falling back to keyword match: {e}")
+        matches = []
+    
+    semantic_rows = []
+    if matches:
+        rank = {match["initiative_id"]: i for i, match in enumerate(matches)}
+        semantic_rows = sorted(db.execute(query.where(Initiative.id.in_(rank))).all(), key=lambda row: rank[row.id])
+    
+    keyword_query = query
+    keywords = [word for word in re.findall(r"\w+", request.title.lower()) if len(word) > 3][:8]
+    if keywords:
+        keyword_match = or_(*(
+            or_(Initiative.title.ilike(f"%{word}%"), Initiative.description.ilike(f"%{word}%"))
+            for word in keywords
+        ))
+        keyword_query = keyword_query.order_by(case((keyword_match, 1), else_=0).desc())
+    keyword_rows = db.execute(keyword_query.order_by(Initiative.id.desc()).limit(_SIMILAR_CANDIDATES)).all()
+    
+    # Alternate between the two shortlists so new or not yet indexed
+    # initiatives keep a place next to the semantic matches
+    candidates, seen = [], set()
+    for row in chain.from_iterable(zip_longest(semantic_rows, keyword_rows)):
+        if row is not None and row.id not in seen:
+            seen.add(row.id)
+            candidates.append(row)
+    return candidates[:_SIMILAR_CANDIDATES]
+
+
 @router.post("/similar")
 async def find_similar_initiatives(
     request: FindSimilarRequest,
@@ -128,20 +184,13 @@ async def find_similar_initiatives(
     """
     Find similar existing initiatives to detect duplicates or collaboration opportunities.
     """
-    # Get all existing initiatives
-    existing_initiatives = db.query(Initiative).all()
+    # Shortlist candidates instead of sending every initiative to the LLM
+    existing_initiatives = await _similar_candidates(db, request)
     
     # Convert to dict format for AI analysis
     initiatives_data = [
-        {
-            "id": init.id,
-            "title": init.title,
-            "description": init.description,
-            "business_objective": init.business_objective,
-            "ai_type": init.ai_type.value if init.ai_type else None,
-            "technologies": init.technologies or []
-        }
-        for init in existing_initiatives
+        {**row._mapping, "technologies": row.technologies or []}
+        for row in existing_initiatives
     ]
     
     new_initiative_data = {
@@ -156,12 +205,12 @@ async def find_similar_initiatives(
     
     if result["success"]:
         try:
-            data = json.loads(result["data"])
+            data = orjson.loads(result["data"])
             return {
                 "success": True,
                 "similar_initiatives": data.get("similar_initiatives", [])
             }
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
                 detail="Failed to parse similarity results"
@@ -174,31 +223,37 @@ async def find_similar_initiatives(
 
 
 @router.get("/templates", response_model=List[IntakeFormTemplateSchema])
-def get_form_templates(
+async def get_form_templates(
     business_unit: str = None,
     ai_type: str = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Get intake form templates, optionally filtered by business unit or AI type.
     """
-    query = db.query(IntakeFormTemplate).filter(IntakeFormTemplate.is_active == True)
+    cache_key = (business_unit, ai_type)
+    templates = _templates_cache.get(cache_key)
+    if templates is not None:
+        return templates
+    
+    query = safe_select(IntakeFormTemplate).where(IntakeFormTemplate.is_active == True)
     
     if business_unit:
-        query = query.filter(IntakeFormTemplate.business_unit == business_unit)
+        query = query.where(IntakeFormTemplate.business_unit == business_unit)
     
     if ai_type:
-        query = query.filter(IntakeFormTemplate.ai_type == ai_type)
+        query = query.where(IntakeFormTemplate.ai_type == ai_type)
     
-    templates = query.all()
+    templates = [IntakeFormTemplateSchema.model_validate(t) for t in (await db.scalars(query)).all()]
+    _templates_cache.set(cache_key, templates)
     return templates
 
 
 @router.post("/templates", response_model=IntakeFormTemplateSchema, status_code=status.HTTP_201_CREATED)
-def create_form_template(
+async def create_form_template(
     template_in: IntakeFormTemplateCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -208,22 +263,22 @@ def create_form_template(
     
     template = IntakeFormTemplate(**template_in.model_dump())
     db.add(template)
-    db.commit()
-    db.refresh(template)
+    await db.commit()
+    _templates_cache.clear()
     return template
 
 
 @router.put("/templates/{template_id}", response_model=IntakeFormTemplateSchema)
-def update_form_template(
+async def update_form_template(
     template_id: int,
     template_in: IntakeFormTemplateUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Update an existing intake form template.
     """
-    template = db.query(IntakeFormTemplate).filter(IntakeFormTemplate.id == template_id).first()
+    template = await db.get(IntakeFormTemplate, template_id)
     if not template:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -235,27 +290,28 @@ def update_form_template(
     for field, value in update_data.items():
         setattr(template, field, value)
     
-    db.commit()
-    db.refresh(template)
+    await db.commit()
+    _templates_cache.clear()
     return template
 
 
 @router.delete("/templates/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_form_template(
+async def delete_form_template(
     template_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Delete an intake form template.
     """
-    template = db.query(IntakeFormTemplate).filter(IntakeFormTemplate.id == template_id).first()
+    template = await db.get(IntakeFormTemplate, template_id)
     if not template:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Template not found"
         )
     
-    db.delete(template)
-    db.commit()
+    await db.delete(template)
+    await db.commit()
+    _templates_cache.clear()
     return None
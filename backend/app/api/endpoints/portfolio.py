@@ -1,68 +1,82 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, case, func, select, update
 from typing import List, Optional, Dict, Any
 from app.api.deps import get_db, get_current_user
+from app.core.database import AsyncSessionLocal, commit_detached, get_async_db, insert_returning
 from app.models.user import User
 from app.models.initiative import Initiative, AIType
-from app.models.scoring import InitiativeScore, InitiativeComparison, ScenarioSimulation
+from app.models.scoring import InitiativeScore, InitiativeComparison, ScenarioSimulation, ScoringModelVersion, SimulationStatus
 from app.schemas.scoring import (
     PortfolioBalanceResponse,
     ComparisonRequest,
     InitiativeComparison as InitiativeComparisonSchema,
     SimulatePortfolioRequest,
     ScenarioSimulation as ScenarioSimulationSchema,
+    ScenarioSimulationStatus,
     ScenarioSimulationCreate,
     ScenarioSimulationUpdate
 )
-from app.services.scoring_service import ScoringService
+from app.services.scoring_service import ACTIVE_SCORING_MODEL
 from app.services.openai_service import openai_service
-import json
+import logging
+import orjson
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
-@router.get("/balance", response_model=PortfolioBalanceResponse)
-def get_portfolio_balance(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
-    """Get portfolio balance and composition analysis."""
-    # Get all initiatives
-    initiatives = db.query(Initiative).all()
-    total_initiatives = len(initiatives)
-    
-    # Count by AI type
-    by_ai_type = {}
-    for ai_type in AIType:
-        count = db.query(Initiative).filter(Initiative.ai_type == ai_type).count()
-        by_ai_type[ai_type.value] = count
-    
-    # Count by risk tier (using risk_score as proxy)
-    by_risk_tier = {
-        "low": db.query(Initiative).filter(Initiative.risk_score <= 3).count(),
-        "medium": db.query(Initiative).filter(Initiative.risk_score > 3, Initiative.risk_score <= 7).count(),
-        "high": db.query(Initiative).filter(Initiative.risk_score > 7).count()
-    }
-    
-    # Count by strategic domain
-    domains = db.query(Initiative.strategic_domain, func.count(Initiative.id)).group_by(
-        Initiative.strategic_domain
-    ).all()
-    by_strategic_domain = {domain: count for domain, count in domains if domain}
+async def compute_portfolio_balance(db: AsyncSession) -> PortfolioBalanceResponse:
+    """
+    Aggregate portfolio composition and financials.
+    
+    Everything comes from one scan of initiatives grouped by strategic
+    domain: each group carries its counts, budget/ROI sums, risk tiers
+    (using risk_score as proxy) and per-AI-type counts as conditional sums,
+    and the portfolio totals are added up from the groups.
+    """
+    ai_types = list(AIType)
+    groups = (await db.execute(
+        select(
+            Initiative.strategic_domain,
+            func.count(Initiative.id),
+            func.sum(Initiative.budget_allocated),
+            func.sum(Initiative.expected_roi),
+            func.count(Initiative.expected_roi),
+            func.sum(case((Initiative.risk_score <= 3, 1), else_=0)),
+            func.sum(case((and_(Initiative.risk_score > 3, Initiative.risk_score <= 7), 1), else_=0)),
+            func.sum(case((Initiative.risk_score > 7, 1), else_=0)),
+            *(func.sum(case((Initiative.ai_type == ai_type, 1), else_=0)) for ai_type in ai_types)
+        ).group_by(Initiative.strategic_domain)
+    )).all()
+    
+    total_initiatives = 0
+    total_budget = 0.0
+    roi_sum = 0.0
+    roi_count = 0
+    by_risk_tier = {"low": 0, "medium": 0, "high": 0}
+    by_ai_type = {ai_type.value: 0 for ai_type in ai_types}
+    by_strategic_domain: Dict[str, int] = {}
+    
+    for domain, count, budget, roi, roi_n, low_risk, medium_risk, high_risk, *type_counts in groups:
+        total_initiatives += count
+        total_budget += budget or 0.0
+        roi_sum += roi or 0.0
+        roi_count += roi_n
+        by_risk_tier["low"] += low_risk or 0
+        by_risk_tier["medium"] += medium_risk or 0
+        by_risk_tier["high"] += high_risk or 0
+        for ai_type, type_count in zip(ai_types, type_counts):
+            by_ai_type[ai_type.value] += type_count or 0
+        if domain:
+            by_strategic_domain[domain] = count
     
     # Status was removed from initiatives; keep key for backwards-compatible response shape.
     by_status: Dict[str, int] = {}
     
-    # Calculate financial metrics
-    total_budget = db.query(func.sum(Initiative.budget_allocated)).scalar() or 0.0
-    
-    # Calculate average expected ROI
-    avg_roi = db.query(func.avg(Initiative.expected_roi)).filter(
-        Initiative.expected_roi.isnot(None)
-    ).scalar() or 0.0
-    
     return PortfolioBalanceResponse(
         total_initiatives=total_initiatives,
         by_ai_type=by_ai_type,
@@ -70,30 +84,31 @@ def get_portfolio_balance(
         by_strategic_domain=by_strategic_domain,
         by_status=by_status,
         total_budget=float(total_budget),
-        total_expected_roi=float(avg_roi),
+        total_expected_roi=float(roi_sum / roi_count) if roi_count else 0.0,
         recommendations=[]
     )
 
 
+@router.get("/balance", response_model=PortfolioBalanceResponse)
+async def get_portfolio_balance(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get portfolio balance and composition analysis."""
+    return await compute_portfolio_balance(db)
+
+
 @router.post("/balance/analyze")
 async def analyze_portfolio_balance(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get AI-powered portfolio balance analysis and recommendations."""
-    # Get portfolio data
-    balance = get_portfolio_balance(db, current_user)
+    # Get portfolio data once; the AI prompt is built from the same object
+    balance = await compute_portfolio_balance(db)
     
     # Get AI analysis
-    portfolio_data = {
-        "total_initiatives": balance.total_initiatives,
-        "by_ai_type": balance.by_ai_type,
-        "by_risk_tier": balance.by_risk_tier,
-        "by_strategic_domain": balance.by_strategic_domain,
-        "by_status": balance.by_status,
-        "total_budget": balance.total_budget,
-        "total_expected_roi": balance.total_expected_roi
-    }
+    portfolio_data = balance.model_dump(exclude={"recommendations"})
     
     ai_result = await openai_service.analyze_portfolio_balance(portfolio_data)
     
@@ -103,7 +118,7 @@ async def analyze_portfolio_balance(
             detail=f"AI analysis failed: {ai_result.get('error')}"
         )
     
-    analysis = json.loads(ai_result["data"])
+    analysis = orjson.loads(ai_result["data"])
     
     return {
         "portfolio_balance": balance,
@@ -118,35 +133,36 @@ async def compare_initiatives(
     current_user: User = Depends(get_current_user)
 ):
     """Compare two initiatives and explain ranking differences."""
-    # Get initiatives
-    initiative_a = db.query(Initiative).filter(Initiative.id == request.initiative_a_id).first()
-    initiative_b = db.query(Initiative).filter(Initiative.id == request.initiative_b_id).first()
+    model_id = db.scalar(ACTIVE_SCORING_MODEL.with_only_columns(ScoringModelVersion.id))
     
-    if not initiative_a or not initiative_b:
+    if not model_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="One or both initiatives not found"
+            detail="No active scoring model found"
         )
     
-    # Get scores
-    scoring_service = ScoringService(db)
-    model = scoring_service.get_active_scoring_model()
+    # Get both initiatives with their scores under the active model in one query
+    rows = {
+        initiative.id: (initiative, score)
+        for initiative, score in db.query(Initiative, InitiativeScore).outerjoin(
+            InitiativeScore,
+            and_(
+                InitiativeScore.initiative_id == Initiative.id,
+                InitiativeScore.model_version_id == model_id
+            )
+        ).filter(
+            Initiative.id.in_([request.initiative_a_id, request.initiative_b_id])
+        ).all()
+    }
     
-    if not model:
+    if request.initiative_a_id not in rows or request.initiative_b_id not in rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="No active scoring model found"
+            detail="One or both initiatives not found"
         )
     
-    score_a = db.query(InitiativeScore).filter(
-        InitiativeScore.initiative_id == request.initiative_a_id,
-        InitiativeScore.model_version_id == model.id
-    ).first()
-    
-    score_b = db.query(InitiativeScore).filter(
-        InitiativeScore.initiative_id == request.initiative_b_id,
-        InitiativeScore.model_version_id == model.id
-    ).first()
+    initiative_a, score_a = rows[request.initiative_a_id]
+    initiative_b, score_b = rows[request.initiative_b_id]
     
     if not score_a or not score_b:
         raise HTTPException(
@@ -196,7 +212,7 @@ async def compare_initiatives(
             detail=f"AI comparison failed: {ai_result.get('error')}"
         )
     
-    comparison_data = json.loads(ai_result["data"])
+    comparison_data = orjson.loads(ai_result["data"])
     
     # Determine winner
     winner_id = request.initiative_a_id if comparison_data.get("winner") == "A" else request.initiative_b_id
@@ -217,72 +233,71 @@ async def compare_initiatives(
         existing_comparison.recommendation = comparison_data.get("recommendation")
         existing_comparison.compared_at = datetime.utcnow()
         existing_comparison.compared_by_id = current_user.id
-        comparison = existing_comparison
-    else:
-        comparison = InitiativeComparison(
-            initiative_a_id=request.initiative_a_id,
-            initiative_b_id=request.initiative_b_id,
-            winner_id=winner_id,
-            score_difference=score_difference,
-            dimension_comparison=comparison_data.get("dimension_comparison"),
-            key_differentiators=comparison_data.get("key_differentiators", []),
-            justification=comparison_data.get("justification"),
-            recommendation=comparison_data.get("recommendation"),
-            compared_by_id=current_user.id
-        )
-        db.add(comparison)
-    
-    db.commit()
-    db.refresh(comparison)
-    
-    return comparison
+        return commit_detached(db, existing_comparison)
+    
+    return insert_returning(db, InitiativeComparison, {
+        "initiative_a_id": request.initiative_a_id,
+        "initiative_b_id": request.initiative_b_id,
+        "winner_id": winner_id,
+        "score_difference": score_difference,
+        "dimension_comparison": comparison_data.get("dimension_comparison"),
+        "key_differentiators": comparison_data.get("key_differentiators", []),
+        "justification": comparison_data.get("justification"),
+        "recommendation": comparison_data.get("recommendation"),
+        "compared_by_id": current_user.id
+    })
 
 
-@router.post("/simulate", response_model=ScenarioSimulationSchema)
+@router.post("/simulate", response_model=ScenarioSimulationSchema, status_code=status.HTTP_202_ACCEPTED)
 async def simulate_portfolio_scenario(
     request: SimulatePortfolioRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Run portfolio optimization scenario simulation."""
-    # Get initiatives to consider
-    if request.initiative_ids:
-        initiatives = db.query(Initiative).filter(Initiative.id.in_(request.initiative_ids)).all()
-    else:
-        # Status was removed; consider all initiatives
-        initiatives = db.query(Initiative).all()
+    """
+    Queue a portfolio optimization scenario simulation.
     
-    # Get scores for initiatives
-    scoring_service = ScoringService(db)
-    model = scoring_service.get_active_scoring_model()
+    The simulation is saved with status "queued" and optimized once the
+    response has been sent; poll /simulations/{id}/status until it is
+    "done" (or "error").
+    """
+    model_id = db.scalar(ACTIVE_SCORING_MODEL.with_only_columns(ScoringModelVersion.id))
     
-    if not model:
+    if not model_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No active scoring model found"
         )
     
+    # Get initiatives to consider together with their scores in one query;
+    # initiatives without a score under the active model are skipped.
+    # Status was removed; with no ids given, consider all initiatives.
+    query = select(
+        Initiative.id,
+        Initiative.title,
+        InitiativeScore.overall_score,
+        InitiativeScore.value_score,
+        InitiativeScore.feasibility_score,
+        InitiativeScore.risk_score,
+        func.coalesce(Initiative.budget_allocated, 0).label("budget"),
+        func.coalesce(Initiative.expected_roi, 0).label("expected_roi"),
+        Initiative.ai_type_value.label("ai_type")
+    ).join(
+        InitiativeScore,
+        and_(
+            InitiativeScore.initiative_id == Initiative.id,
+            InitiativeScore.model_version_id == model_id
+        )
+    )
+    if request.initiative_ids:
+        query = query.where(Initiative.id.in_(request.initiative_ids))
+    
     # Prepare initiative data with scores
-    initiatives_data = []
-    for initiative in initiatives:
-        score = db.query(InitiativeScore).filter(
-            InitiativeScore.initiative_id == initiative.id,
-            InitiativeScore.model_version_id == model.id
-        ).first()
-        
-        if score:
-            initiatives_data.append({
-                "id": initiative.id,
-                "title": initiative.title,
-                "overall_score": score.overall_score,
-                "value_score": score.value_score,
-                "feasibility_score": score.feasibility_score,
-                "risk_score": score.risk_score,
-                "budget": initiative.budget_allocated or 0,
-                "expected_roi": initiative.expected_roi or 0,
-                "ai_type": initiative.ai_type.value if initiative.ai_type else None,
-                "status": ""
-            })
+    initiatives_data = [
+        {**row._mapping, "status": ""}
+        for row in db.execute(query.order_by(Initiative.id)).all()
+    ]
     
     # Prepare constraints
     constraints = {
@@ -293,26 +308,55 @@ async def simulate_portfolio_scenario(
         "target_portfolio_mix": request.scenario.target_portfolio_mix
     }
     
-    # Get AI optimization
-    ai_result = await openai_service.optimize_portfolio_scenario(initiatives_data, constraints)
+    # Save the request now; results are filled in by the background job
+    simulation = insert_returning(db, ScenarioSimulation, {
+        "name": request.scenario.name,
+        "description": request.scenario.description,
+        "budget_constraint": request.scenario.budget_constraint,
+        "capacity_constraint": request.scenario.capacity_constraint,
+        "timeline_constraint": request.scenario.timeline_constraint,
+        "target_portfolio_mix": request.scenario.target_portfolio_mix,
+        "risk_tolerance": request.scenario.risk_tolerance,
+        "status": SimulationStatus.QUEUED,
+        "created_by_id": current_user.id
+    })
+    background_tasks.add_task(_run_scenario_optimization, simulation.id, initiatives_data, constraints)
     
-    if not ai_result.get("success"):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"AI optimization failed: {ai_result.get('error')}"
+    return simulation
+
+
+async def _set_simulation_fields(simulation_id: int, **values) -> None:
+    """Update a scenario simulation row in a session of its own."""
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(ScenarioSimulation)
+            .where(ScenarioSimulation.id == simulation_id)
+            .values(**values, updated_at=datetime.utcnow())
         )
-    
-    optimization_data = json.loads(ai_result["data"])
-    
-    # Create scenario simulation record
-    simulation = ScenarioSimulation(
-        name=request.scenario.name,
-        description=request.scenario.description,
-        budget_constraint=request.scenario.budget_constraint,
-        capacity_constraint=request.scenario.capacity_constraint,
-        timeline_constraint=request.scenario.timeline_constraint,
-        target_portfolio_mix=request.scenario.target_portfolio_mix,
-        risk_tolerance=request.scenario.risk_tolerance,
+        await db.commit()
+
+
+async def _run_scenario_optimization(
+    simulation_id: int,
+    initiatives_data: List[Dict[str, Any]],
+    constraints: Dict[str, Any]
+) -> None:
+    """Optimize a queued scenario simulation and store the results on it."""
+    await _set_simulation_fields(simulation_id, status=SimulationStatus.RUNNING)
+    
+    try:
+        ai_result = await openai_service.optimize_portfolio_scenario(initiatives_data, constraints)
+        if not ai_result.get("success"):
+            raise RuntimeError(f"AI optimization failed: {ai_result.get('error')}")
+        optimization_data = orjson.loads(ai_result["data"])
+    except Exception as e:
+        logger.warning(f"Scenario simulation {simulation_id} failed: {e}")
+        await _set_simulation_fields(simulation_id, status=SimulationStatus.ERROR, error_message=str(e))
+        return
+    
+    await _set_simulation_fields(
+        simulation_id,
+        status=SimulationStatus.DONE,
         selected_initiatives=optimization_data.get("selected_initiative_ids", []),
         total_budget_allocated=optimization_data.get("total_budget"),
         total_expected_roi=optimization_data.get("total_expected_roi"),
@@ -320,41 +364,57 @@ async def simulate_portfolio_scenario(
         risk_distribution=optimization_data.get("risk_distribution"),
         optimization_strategy=optimization_data.get("optimization_strategy"),
         trade_offs=optimization_data.get("trade_offs", []),
-        alternative_scenarios=optimization_data.get("alternative_scenarios", []),
-        created_by_id=current_user.id
+        alternative_scenarios=optimization_data.get("alternative_scenarios", [])
     )
-    
-    db.add(simulation)
-    db.commit()
-    db.refresh(simulation)
-    
-    return simulation
+
+
+async def fail_interrupted_simulations() -> None:
+    """
+    Mark simulations a previous server process left queued or running as failed.
+    
+    Their background tasks died with that process, so they would otherwise
+    never finish. Runs at startup; assumes a single server process, as the
+    background tasks themselves do.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(ScenarioSimulation)
+            .where(ScenarioSimulation.status.in_([SimulationStatus.QUEUED, SimulationStatus.RUNNING]))
+            .values(
+                status=SimulationStatus.ERROR,
+                error_message="Interrupted by a server restart; please run the simulation again",
+                updated_at=datetime.utcnow()
+            )
+        )
+        await db.commit()
+    if result.rowcount:
+        logger.warning(f"Marked {result.rowcount} interrupted scenario simulations as failed")
 
 
 @router.get("/simulations", response_model=List[ScenarioSimulationSchema])
-def get_scenario_simulations(
+async def get_scenario_simulations(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all saved scenario simulations."""
-    simulations = db.query(ScenarioSimulation).order_by(
-        ScenarioSimulation.created_at.desc()
-    ).offset(skip).limit(limit).all()
+    simulations = (await db.scalars(
+        select(ScenarioSimulation).order_by(
+            ScenarioSimulation.created_at.desc()
+        ).offset(skip).limit(limit)
+    )).all()
     return simulations
 
 
 @router.get("/simulations/{simulation_id}", response_model=ScenarioSimulationSchema)
-def get_scenario_simulation(
+async def get_scenario_simulation(
     simulation_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific scenario simulation."""
-    simulation = db.query(ScenarioSimulation).filter(
-        ScenarioSimulation.id == simulation_id
-    ).first()
+    simulation = await db.get(ScenarioSimulation, simulation_id)
     
     if not simulation:
         raise HTTPException(
@@ -365,17 +425,40 @@ def get_scenario_simulation(
     return simulation
 
 
+@router.get("/simulations/{simulation_id}/status", response_model=ScenarioSimulationStatus)
+async def get_scenario_simulation_status(
+    simulation_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get the optimization status of a scenario simulation."""
+    row = (await db.execute(
+        select(
+            ScenarioSimulation.id,
+            ScenarioSimulation.status,
+            ScenarioSimulation.error_message,
+            ScenarioSimulation.updated_at
+        ).where(ScenarioSimulation.id == simulation_id)
+    )).first()
+    
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Scenario simulation not found"
+        )
+    
+    return row
+
+
 @router.put("/simulations/{simulation_id}", response_model=ScenarioSimulationSchema)
-def update_scenario_simulation(
+async def update_scenario_simulation(
     simulation_id: int,
     simulation_in: ScenarioSimulationUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Update a scenario simulation."""
-    simulation = db.query(ScenarioSimulation).filter(
-        ScenarioSimulation.id == simulation_id
-    ).first()
+    simulation = await db.get(ScenarioSimulation, simulation_id)
     
     if not simulation:
         raise HTTPException(
@@ -383,27 +466,26 @@ def update_scenario_simulation(
             detail="Scenario simulation not found"
         )
     
-    update_data = simulation_in.dict(exclude_unset=True)
+    update_data = simulation_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(simulation, field, value)
     
     simulation.updated_at = datetime.utcnow()
     
-    db.commit()
-    db.refresh(simulation)
+    # The session does not expire on commit and every column is set in
+    # Python, so the object already matches the stored row
+    await db.commit()
     return simulation
 
 
 @router.delete("/simulations/{simulation_id}")
-def delete_scenario_simulation(
+async def delete_scenario_simulation(
     simulation_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Delete a scenario simulation."""
-    simulation = db.query(ScenarioSimulation).filter(
-        ScenarioSimulation.id == simulation_id
-    ).first()
+    simulation = await db.get(ScenarioSimulation, simulation_id)
     
     if not simulation:
         raise HTTPException(
@@ -411,6 +493,6 @@ def delete_scenario_simulation(
             detail="Scenario simulation not found"
         )
     
-    db.delete(simulation)
-    db.commit()
+    await db.delete(simulation)
+    await db.commit()
     return {"message": "Scenario simulation deleted successfully"}
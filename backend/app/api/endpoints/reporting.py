@@ -1,20 +1,31 @@
 """
 API endpoints for Module 6 - CAIO & Board Reporting
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session, raiseload
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
+import asyncio
+import base64
+import binascii
+import orjson
 
 from app.api.deps import get_db, get_current_user
+from app.api.responses import agent_response, etag_json_response, orm_list_response
+from app.core.database import run_in_new_session
+from app.core.json_stream import StreamingJsonParser
+from app.core.openai_client import iterate_openai_stream, run_openai_call
 from app.models.user import User
-from app.models.reporting import ReportType, ExportFormat
+from app.models.reporting import BoardReport as BoardReportModel, ReportType, ExportFormat
 from app.schemas.reporting import (
     # Dashboard schemas
     ValuePipelineData, DeliveredValueData, RiskExposureData,
-    StageDistributionData, BottleneckData, PortfolioHealthData,
+    StageDistributionData, BottleneckData, PortfolioHealthData, DashboardOverview,
     # Report schemas
-    BoardReport, BoardReportCreate, BoardReportUpdate,
+    BoardReport, BoardReportSummary, BoardReportCreate, BoardReportUpdate,
     StrategyBrief, StrategyBriefCreate, StrategyBriefUpdate,
     QuarterlyReport, QuarterlyReportCreate, QuarterlyReportUpdate,
     # AI Agent schemas
@@ -27,16 +38,36 @@ from app.schemas.reporting import (
     GenerateBoardSlidesRequest, GenerateStrategyBriefRequest,
     GenerateQuarterlyReportRequest
 )
-from app.services.reporting_service import reporting_service
+from app.services.reporting_service import reporting_service, cached_dashboard, report_cache, DASHBOARD_CALCULATIONS
 from app.services.openai_service import openai_service
 
 router = APIRouter()
 
 
+def _cached_dashboard_in_new_session(name: str):
+    """Same as cached_dashboard, on a session of its own (safe to run concurrently)."""
+    return run_in_new_session(lambda db: cached_dashboard(name, db))
+
+
 # ============================================================================
 # Dashboard Endpoints
 # ============================================================================
 
+@router.get("/dashboards/overview", response_model=DashboardOverview)
+async def get_dashboards_overview(
+    current_user: User = Depends(get_current_user)
+):
+    """Get all dashboards at once, calculating any uncached ones concurrently"""
+    try:
+        results = await asyncio.gather(*(
+            run_in_threadpool(_cached_dashboard_in_new_session, name)
+            for name in DASHBOARD_CALCULATIONS
+        ))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return DashboardOverview(**dict(zip(DASHBOARD_CALCULATIONS, results)))
+
+
 @router.get("/dashboards/value-pipeline", response_model=ValuePipelineData)
 async def get_value_pipeline_dashboard(
     db: Session = Depends(get_db),
@@ -44,7 +75,7 @@ async def get_value_pipeline_dashboard(
 ):
     """Get value pipeline dashboard data"""
     try:
-        return reporting_service.calculate_value_pipeline(db)
+        return cached_dashboard("value_pipeline", db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -56,7 +87,7 @@ async def get_delivered_value_dashboard(
 ):
     """Get delivered value dashboard data"""
     try:
-        return reporting_service.calculate_delivered_value(db)
+        return cached_dashboard("delivered_value", db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -68,7 +99,7 @@ async def get_risk_exposure_dashboard(
 ):
     """Get risk exposure dashboard data"""
     try:
-        return reporting_service.calculate_risk_exposure(db)
+        return cached_dashboard("risk_exposure", db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -80,7 +111,7 @@ async def get_stage_distribution_dashboard(
 ):
     """Get stage distribution dashboard data"""
     try:
-        return reporting_service.calculate_stage_distribution(db)
+        return cached_dashboard("stage_distribution", db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -92,7 +123,7 @@ async def get_bottlenecks_dashboard(
 ):
     """Get bottleneck analysis dashboard data"""
     try:
-        return reporting_service.identify_bottlenecks(db)
+        return cached_dashboard("bottlenecks", db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -104,7 +135,7 @@ async def get_portfolio_health_dashboard(
 ):
     """Get portfolio health dashboard data"""
     try:
-        return reporting_service.calculate_portfolio_health(db)
+        return cached_dashboard("portfolio_health", db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -175,25 +206,76 @@ async def generate_quarterly_report(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/reports", response_model=List[BoardReport])
+def _encode_report_cursor(report) -> str:
+    """Opaque cursor pointing just past ``report`` in the newest-first listing."""
+    return base64.urlsafe_b64encode(f"{report.created_at.isoformat()}|{report.id}".encode()).decode()
+
+
+def _decode_report_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, report_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(report_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _report_page(
+    db: Session,
+    report_type: Optional[ReportType],
+    skip: int,
+    limit: int,
+    position: Optional[Tuple[datetime, int]]
+) -> Tuple[bytes, Optional[str]]:
+    """Serialized page of reports, newest first, and the cursor for the next page."""
+    # Select only the listing columns: rows come back as plain tuples and the
+    # report bodies (narrative, report_data, ...) are never loaded
+    query = db.query(*(getattr(BoardReportModel, name) for name in BoardReportSummary.model_fields))
+    
+    if report_type:
+        query = query.filter(BoardReportModel.report_type == report_type)
+    if position:
+        query = query.filter(tuple_(BoardReportModel.created_at, BoardReportModel.id) < position)
+    
+    # One row past the page tells whether another page exists, without a COUNT
+    rows = query.order_by(
+        BoardReportModel.created_at.desc(), BoardReportModel.id.desc()
+    ).offset(skip).limit(limit + 1).all()
+    reports, has_more = rows[:limit], len(rows) > limit
+    
+    next_cursor = _encode_report_cursor(reports[-1]) if has_more and reports else None
+    return orm_list_response(BoardReportSummary, reports).body, next_cursor
+
+
+@router.get("/reports", response_model=List[BoardReportSummary])
 async def list_reports(
     report_type: Optional[ReportType] = None,
-    skip: int = 0,
+    skip: int = Query(0, description="Deprecated: use cursor for deep pages"),
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List all reports"""
+    """
+    List reports, newest first.
+    
+    Entries carry the report metadata only; fetch /reports/{report_id} for
+    the full report. When more reports follow, the X-Next-Cursor response
+    header holds the cursor for the next page; pass it back as `cursor` to
+    page by key instead of offset. No header means this is the last page.
+    """
+    position = _decode_report_cursor(cursor) if cursor else None
     try:
-        from app.models.reporting import BoardReport as BoardReportModel
-        
-        query = db.query(BoardReportModel)
+        key = ("page", report_type, skip, limit, cursor)
+        page = report_cache.get(key)
+        if page is None:
+            page = _report_page(db, report_type, skip, limit, position)
+            report_cache.set(key, page)
         
-        if report_type:
-            query = query.filter(BoardReportModel.report_type == report_type)
-        
-        reports = query.order_by(BoardReportModel.created_at.desc()).offset(skip).limit(limit).all()
-        return reports
+        body, next_cursor = page
+        response = Response(content=body, media_type="application/json")
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -206,11 +288,14 @@ async def get_report(
 ):
     """Get a specific report"""
     try:
-        from app.models.reporting import BoardReport as BoardReportModel
-        
-        report = db.query(BoardReportModel).filter(BoardReportModel.id == report_id).first()
-        if not report:
-            raise HTTPException(status_code=404, detail="Report not found")
+        key = ("report", report_id)
+        report = report_cache.get(key)
+        if report is None:
+            row = db.get(BoardReportModel, report_id, options=[raiseload("*")])
+            if not row:
+                raise HTTPException(status_code=404, detail="Report not found")
+            report = BoardReport.model_validate(row)
+            report_cache.set(key, report)
         
         return report
     except HTTPException:
@@ -223,38 +308,85 @@ async def get_report(
 # AI Agent Endpoints
 # ============================================================================
 
+def _sse_event(data: Any, event: Optional[str] = None) -> bytes:
+    """Encode one Server-Sent Event."""
+    prefix = f"event: {event}\n".encode() if event else b""
+    return prefix + b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _stream_agent_events(
+    start_stream: Callable[[], Iterator[str]],
+    build_result: Callable[[Dict[str, Any]], Dict[str, Any]]
+) -> StreamingResponse:
+    """
+    Relay an agent's JSON output as Server-Sent Events while it is generated.
+    
+    Each top-level field (and each entry of a top-level list) is sent as a
+    ``{"path": [...], "value": ...}`` event as soon as it is complete. A final
+    ``done`` event carries build_result(document), the same body the buffered
+    endpoint returns; failures mid-stream end with an ``error`` event.
+    Errors raised while starting the stream surface as a 500 before any
+    bytes are sent. The request is opened and read on the OpenAI thread
+    pool, so the event loop keeps serving other requests while it streams.
+    """
+    try:
+        chunks = await run_openai_call(start_stream)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    async def relay():
+        parser = StreamingJsonParser()
+        try:
+            async for chunk in iterate_openai_stream(chunks):
+                for path, value in parser.feed(chunk):
+                    if path:
+                        yield _sse_event({"path": path, "value": value})
+                    else:
+                        yield _sse_event(build_result(value), event="done")
+                        return
+            yield _sse_event({"detail": "AI response ended before the JSON document was complete"}, event="error")
+        except Exception as e:
+            yield _sse_event({"detail": str(e)}, event="error")
+    
+    return StreamingResponse(
+        relay(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "Content-Encoding": "identity", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.post("/ai/generate-narrative", response_model=GenerateNarrativeResponse)
 async def generate_executive_narrative(
     request: GenerateNarrativeRequest,
     current_user: User = Depends(get_current_user)
 ):
     """Generate executive narrative with AI"""
-    try:
-        result = await openai_service.generate_executive_narrative(
+    result = await openai_service.generate_executive_narrative(
+        portfolio_data=request.portfolio_data,
+        report_type=request.report_type.value,
+        audience=request.audience,
+        include_charts=request.include_charts,
+        tone=request.tone
+    )
+    return agent_response(result, GenerateNarrativeResponse)
+
+
+@router.post("/ai/generate-narrative/stream")
+async def stream_executive_narrative(
+    request: GenerateNarrativeRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """Stream an executive narrative as Server-Sent Events while it is generated"""
+    return await _stream_agent_events(
+        lambda: openai_service.stream_executive_narrative(
             portfolio_data=request.portfolio_data,
             report_type=request.report_type.value,
             audience=request.audience,
             include_charts=request.include_charts,
             tone=request.tone
-        )
-        
-        if not result.get("success"):
-            raise HTTPException(status_code=500, detail=result.get("error"))
-        
-        import json
-        data = json.loads(result["data"])
-        
-        return GenerateNarrativeResponse(
-            narrative=data.get("narrative", ""),
-            key_points=data.get("key_points", []),
-            chart_recommendations=data.get("chart_recommendations", []),
-            confidence_score=data.get("confidence_score", 0.0),
-            word_count=data.get("word_count", 0)
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        ),
+        lambda data: GenerateNarrativeResponse.model_validate(data).model_dump()
+    )
 
 
 @router.post("/ai/explain-tradeoffs", response_model=ExplainTradeoffsResponse)
@@ -263,29 +395,12 @@ async def explain_portfolio_tradeoffs(
     current_user: User = Depends(get_current_user)
 ):
     """Explain portfolio trade-offs with AI"""
-    try:
-        result = await openai_service.explain_trade_offs(
-            decision_context=request.decision_context,
-            alternatives=request.alternatives,
-            constraints=request.constraints
-        )
-        
-        if not result.get("success"):
-            raise HTTPException(status_code=500, detail=result.get("error"))
-        
-        import json
-        data = json.loads(result["data"])
-        
-        return ExplainTradeoffsResponse(
-            explanation=data.get("explanation", ""),
-            key_tradeoffs=data.get("key_tradeoffs", []),
-            recommendation=data.get("recommendation", ""),
-            confidence_score=data.get("confidence_score", 0.0)
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await openai_service.explain_trade_offs(
+        decision_context=request.decision_context,
+        alternatives=request.alternatives,
+        constraints=request.constraints
+    )
+    return agent_response(result, ExplainTradeoffsResponse)
 
 
 @router.post("/ai/talking-points", response_model=GenerateTalkingPointsResponse)
@@ -294,28 +409,12 @@ async def generate_talking_points(
     current_user: User = Depends(get_current_user)
 ):
     """Generate talking points with AI"""
-    try:
-        result = await openai_service.prepare_talking_points(
-            report_data=request.report_data,
-            audience=request.audience,
-            max_points=request.max_points
-        )
-        
-        if not result.get("success"):
-            raise HTTPException(status_code=500, detail=result.get("error"))
-        
-        import json
-        data = json.loads(result["data"])
-        
-        return GenerateTalkingPointsResponse(
-            talking_points=data.get("talking_points", []),
-            supporting_data=data.get("supporting_data", {}),
-            anticipated_questions=data.get("anticipated_questions", [])
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await openai_service.prepare_talking_points(
+        report_data=request.report_data,
+        audience=request.audience,
+        max_points=request.max_points
+    )
+    return agent_response(result, GenerateTalkingPointsResponse)
 
 
 @router.post("/ai/board-summary", response_model=GenerateBoardSummaryResponse)
@@ -324,31 +423,13 @@ async def generate_board_summary(
     current_user: User = Depends(get_current_user)
 ):
     """Generate board summary with AI"""
-    try:
-        result = await openai_service.generate_board_summary(
-            portfolio_data=request.portfolio_data,
-            period_start=request.period_start.isoformat(),
-            period_end=request.period_end.isoformat(),
-            max_paragraphs=request.max_paragraphs
-        )
-        
-        if not result.get("success"):
-            raise HTTPException(status_code=500, detail=result.get("error"))
-        
-        import json
-        data = json.loads(result["data"])
-        
-        return GenerateBoardSummaryResponse(
-            summary=data.get("summary", ""),
-            highlights=data.get("highlights", []),
-            concerns=data.get("concerns", []),
-            recommendations=data.get("recommendations", []),
-            confidence_score=data.get("confidence_score", 0.0)
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await openai_service.generate_board_summary(
+        portfolio_data=request.portfolio_data,
+        period_start=request.period_start.isoformat(),
+        period_end=request.period_end.isoformat(),
+        max_paragraphs=request.max_paragraphs
+    )
+    return agent_response(result, GenerateBoardSummaryResponse)
 
 
 @router.post("/ai/recommendations", response_model=GenerateRecommendationsResponse)
@@ -357,29 +438,12 @@ async def generate_strategic_recommendations(
     current_user: User = Depends(get_current_user)
 ):
     """Generate strategic recommendations with AI"""
-    try:
-        result = await openai_service.generate_strategic_recommendations(
-            portfolio_analysis=request.portfolio_analysis,
-            trends=request.trends,
-            gaps=request.gaps
-        )
-        
-        if not result.get("success"):
-            raise HTTPException(status_code=500, detail=result.get("error"))
-        
-        import json
-        data = json.loads(result["data"])
-        
-        return GenerateRecommendationsResponse(
-            recommendations=data.get("recommendations", []),
-            rationale=data.get("rationale", {}),
-            priority_order=data.get("priority_order", []),
-            estimated_impact=data.get("estimated_impact", {})
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await openai_service.generate_strategic_recommendations(
+        portfolio_analysis=request.portfolio_analysis,
+        trends=request.trends,
+        gaps=request.gaps
+    )
+    return agent_response(result, GenerateRecommendationsResponse)
 
 
 # ============================================================================
@@ -388,21 +452,20 @@ async def generate_strategic_recommendations(
 
 @router.get("/metrics/portfolio")
 async def get_portfolio_metrics(
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get portfolio-level metrics"""
+    """Get portfolio-level metrics, calculating any uncached ones concurrently"""
     try:
-        portfolio_health = reporting_service.calculate_portfolio_health(db)
-        value_pipeline = reporting_service.calculate_value_pipeline(db)
-        delivered_value = reporting_service.calculate_delivered_value(db)
-        risk_exposure = reporting_service.calculate_risk_exposure(db)
+        portfolio_health, value_pipeline, delivered_value, risk_exposure = await asyncio.gather(*(
+            run_in_threadpool(_cached_dashboard_in_new_session, name)
+            for name in ("portfolio_health", "value_pipeline", "delivered_value", "risk_exposure")
+        ))
         
         return {
-            "portfolio_health": portfolio_health.dict(),
-            "value_pipeline": value_pipeline.dict(),
-            "delivered_value": delivered_value.dict(),
-            "risk_exposure": risk_exposure.dict()
+            "portfolio_health": portfolio_health.model_dump(),
+            "value_pipeline": value_pipeline.model_dump(),
+            "delivered_value": delivered_value.model_dump(),
+            "risk_exposure": risk_exposure.model_dump()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -410,14 +473,20 @@ async def get_portfolio_metrics(
 
 @router.get("/metrics/trends")
 async def get_metrics_trends(
+    request: Request,
     period_days: int = Query(90, description="Number of days to analyze"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get metrics trends over time"""
+    """
+    Get metrics trends over time.
+    
+    Served with an ETag; polling clients that send it back as If-None-Match
+    get a 304 while the trends are unchanged.
+    """
     try:
         # Mock implementation - would need historical data
-        return {
+        return etag_json_response(request, {
             "period_days": period_days,
             "trends": {
                 "portfolio_health": [
@@ -431,22 +500,28 @@ async def get_metrics_trends(
                     {"date": "2024-03-01", "value": 2000000}
                 ]
             }
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/metrics/benchmarks")
 async def get_metrics_benchmarks(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get benchmark comparisons"""
+    """
+    Get benchmark comparisons.
+    
+    Built from the cached portfolio health dashboard and served with an
+    ETag, so polling clients get a 304 until the portfolio changes.
+    """
     try:
-        portfolio_health = reporting_service.calculate_portfolio_health(db)
+        portfolio_health = cached_dashboard("portfolio_health", db)
         
         # Mock benchmarks - would come from industry data
-        return {
+        return etag_json_response(request, {
             "portfolio_health_score": {
                 "current": portfolio_health.health_score,
                 "industry_average": 75.0,
@@ -459,6 +534,6 @@ async def get_metrics_benchmarks(
                 "top_quartile": 40.0,
                 "comparison": "above_average" if portfolio_health.average_roi > 25 else "below_average"
             }
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,12 +1,15 @@
 """
 Roadmap and Dependency Management API Endpoints for Module 3
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List, Optional
-import json
+import asyncio
 
 from app.api.deps import get_db, get_current_user
+from app.api.responses import agent_response
+from app.core.database import run_in_new_session
 from app.models.user import User
 from app.models.roadmap import RoadmapTimeline, InitiativeDependency, ResourceAllocation, StageGate
 from app.schemas.roadmap import (
@@ -39,13 +42,23 @@ async def create_roadmap_timeline(
 
 @router.get("/timelines", response_model=List[RoadmapTimelineResponse])
 async def get_roadmap_timelines(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all roadmap timelines"""
-    return RoadmapService.get_all_roadmap_timelines(db, skip, limit)
+    """
+    Get roadmap timelines in id order.
+    
+    When more timelines follow, the X-Next-Cursor response header holds the
+    cursor for the next page; pass it back as `cursor`.
+    """
+    timelines, has_more = RoadmapService.get_all_roadmap_timelines(db, skip, limit, after_id=cursor)
+    if has_more and timelines:
+        response.headers["X-Next-Cursor"] = str(timelines[-1].id)
+    return timelines
 
 
 @router.get("/timelines/{roadmap_id}", response_model=RoadmapTimelineResponse)
@@ -273,22 +286,27 @@ async def suggest_initiative_sequencing(
     """
     Use AI to suggest optimal initiative sequencing based on dependencies and constraints.
     """
-    try:
-        result = await openai_service.suggest_initiative_sequencing(
-            initiatives=request.initiatives,
-            dependencies=request.dependencies,
-            constraints=request.constraints
-        )
-        
-        if not result.get("success"):
-            raise HTTPException(status_code=500, detail=result.get("error"))
-        
-        data = json.loads(result["data"])
-        return InitiativeSequencingResponse(**data)
-    except json.JSONDecodeError as e:
-        raise HTTPException(status_code=500, detail=f"Failed to parse AI response: {str(e)}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await openai_service.suggest_initiative_sequencing(
+        initiatives=request.initiatives,
+        dependencies=request.dependencies,
+        constraints=request.constraints
+    )
+    return agent_response(result, InitiativeSequencingResponse)
+
+
+def _bottleneck_roadmap_data(db: Session, roadmap_id: Optional[int]) -> dict:
+    """Roadmap summary sent to the bottleneck detector (empty without a roadmap)."""
+    if not roadmap_id:
+        return {}
+    roadmap = RoadmapService.get_roadmap_timeline(db, roadmap_id)
+    if not roadmap:
+        return {}
+    return {
+        "id": roadmap.id,
+        "name": roadmap.name,
+        "start_date": str(roadmap.start_date),
+        "end_date": str(roadmap.end_date)
+    }
 
 
 @router.post("/ai/detect-bottlenecks", response_model=BottleneckDetectionResponse)
@@ -300,61 +318,22 @@ async def detect_roadmap_bottlenecks(
     """
     Use AI to detect bottlenecks in the roadmap (resource conflicts, dependency chains, etc.).
     """
-    try:
-        # Get roadmap data
-        roadmap_data = {}
-        if roadmap_id:
-            roadmap = RoadmapService.get_roadmap_timeline(db, roadmap_id)
-            if roadmap:
-                roadmap_data = {
-                    "id": roadmap.id,
-                    "name": roadmap.name,
-                    "start_date": str(roadmap.start_date),
-                    "end_date": str(roadmap.end_date)
-                }
-        
-        # Get resource allocations
-        resource_allocations = RoadmapService.get_resource_allocations(db)
-        allocations_data = [
-            {
-                "id": r.id,
-                "initiative_id": r.initiative_id,
-                "resource_type": r.resource_type,
-                "resource_name": r.resource_name,
-                "allocated_amount": r.allocated_amount,
-                "start_date": str(r.start_date),
-                "end_date": str(r.end_date)
-            }
-            for r in resource_allocations
-        ]
-        
-        # Get dependency graph
-        dep_graph = RoadmapService.get_dependency_graph(db, roadmap_id)
-        dependencies_data = [
-            {
-                "from_initiative_id": edge.from_initiative_id,
-                "to_initiative_id": edge.to_initiative_id,
-                "dependency_type": edge.dependency_type,
-                "is_blocking": edge.is_blocking
-            }
-            for edge in dep_graph.get("edges", [])
-        ]
-        
-        result = await openai_service.detect_roadmap_bottlenecks(
-            roadmap_data=roadmap_data,
-            resource_allocations=allocations_data,
-            dependencies=dependencies_data
-        )
-        
-        if not result.get("success"):
-            raise HTTPException(status_code=500, detail=result.get("error"))
-        
-        data = json.loads(result["data"])
-        return BottleneckDetectionResponse(**data)
-    except json.JSONDecodeError as e:
-        raise HTTPException(status_code=500, detail=f"Failed to parse AI response: {str(e)}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    # Roadmap, allocations and dependencies are independent reads; fetch
+    # them concurrently, each on a session of its own. Rows stay one dict
+    # each: the model reads a self-describing record per allocation more
+    # reliably than parallel column lists, and these tables are small
+    roadmap_data,allocations_data, dependencies_data = await asyncio.gather(
+        run_in_threadpool(run_in_new_session, _bottleneck_roadmap_data, roadmap_id),
+        run_in_threadpool(run_in_new_session, RoadmapService.get_allocations_as_dicts),
+        run_in_threadpool(run_in_new_session, RoadmapService.get_dependency_edges_as_dicts, roadmap_id)
+    )
+    
+    result = await openai_service.detect_roadmap_bottlenecks(
+        roadmap_data=roadmap_data,
+        resource_allocations=allocations_data,
+        dependencies=dependencies_data
+    )
+    return agent_response(result, BottleneckDetectionResponse)
 
 
 @router.post("/ai/validate-timeline", response_model=TimelineFeasibilityResponse)
@@ -366,22 +345,12 @@ async def validate_timeline_feasibility(
     """
     Use AI to validate if a proposed timeline is realistic.
     """
-    try:
-        result = await openai_service.validate_timeline_feasibility(
-            initiative_data=request.initiative_data,
-            proposed_timeline=request.proposed_timeline,
-            historical_data=request.historical_data
-        )
-        
-        if not result.get("success"):
-            raise HTTPException(status_code=500, detail=result.get("error"))
-        
-        data = json.loads(result["data"])
-        return TimelineFeasibilityResponse(**data)
-    except json.JSONDecodeError as e:
-        raise HTTPException(status_code=500, detail=f"Failed to parse AI response: {str(e)}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await openai_service.validate_timeline_feasibility(
+        initiative_data=request.initiative_data,
+        proposed_timeline=request.proposed_timeline,
+        historical_data=request.historical_data
+    )
+    return agent_response(result, TimelineFeasibilityResponse)
 
 
 @router.post("/ai/resolve-dependency", response_model=DependencyResolutionResponse)
@@ -393,19 +362,9 @@ async def recommend_dependency_resolution(
     """
     Use AI to recommend strategies to resolve or work around a dependency.
     """
-    try:
-        result = await openai_service.recommend_dependency_resolution(
-            dependency_data=request.dependency_data,
-            initiative_a=request.initiative_a,
-            initiative_b=request.initiative_b
-        )
-        
-        if not result.get("success"):
-            raise HTTPException(status_code=500, detail=result.get("error"))
-        
-        data = json.loads(result["data"])
-        return DependencyResolutionResponse(**data)
-    except json.JSONDecodeError as e:
-        raise HTTPException(status_code=500, detail=f"Failed to parse AI response: {str(e)}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await openai_service.recommend_dependency_resolution(
+        dependency_data=request.dependency_data,
+        initiative_a=request.initiative_a,
+        initiative_b=request.initiative_b
+    )
+    return agent_response(result, DependencyResolutionResponse)
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 from typing import List, Optional
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_current_user, get_scoring_service
+from app.api.responses import orm_list_response, orm_stream_response
+from app.core.database import AsyncSessionLocal, get_async_db, safe_select
 from app.models.user import User
 from app.models.scoring import (
     ScoringModelVersion, ScoringDimension, ScoringCriteria, InitiativeScore
@@ -9,6 +13,7 @@ from app.models.scoring import (
 from app.schemas.scoring import (
     ScoringModelVersion as ScoringModelVersionSchema,
     ScoringModelVersionCreate,
+    ScoringModelVersionSummary,
     ScoringModelVersionUpdate,
     ScoringDimension as ScoringDimensionSchema,
     ScoringDimensionCreate,
@@ -21,33 +26,82 @@ from app.schemas.scoring import (
     CalculateScoreResponse,
     RankingResponse
 )
-from app.services.scoring_service import ScoringService
+from app.services.scoring_service import ScoringService, WITH_DIMENSIONS
 from datetime import datetime
 
 router = APIRouter()
 
 
+async def _get_or_404(db: AsyncSession, model, object_id: int, detail: str, *eager):
+    """
+    Load ``model`` by primary key with ``eager`` loader options, or raise 404.
+    
+    Relationships not in ``eager`` raise on access, as with safe_select.
+    """
+    obj = await db.get(model, object_id, options=(*eager, raiseload("*")))
+    if not obj:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail
+        )
+    return obj
+
+
+async def _update_or_404(db: AsyncSession, model, object_id: int, values: dict, detail: str, *eager):
+    """
+    Apply ``values`` to a row with a single UPDATE, commit and return the row.
+    
+    The row is not loaded first: UPDATE ... RETURNING hands back the updated
+    object (plus ``eager`` relationships); on databases without it (MySQL)
+    the row is read after the UPDATE. Raises 404 if no row matched.
+    """
+    if not values:
+        return await _get_or_404(db, model, object_id, detail, *eager)
+    
+    statement = update(model).where(model.id == object_id).values(**values)
+    options = (*eager, raiseload("*"))
+    if db.get_bind().dialect.update_returning:
+        obj = (await db.scalars(statement.returning(model).options(*options))).one_or_none()
+    elif (await db.execute(statement)).rowcount:
+        obj = await db.get(model, object_id, options=options)
+    else:
+        obj = None
+    
+    if obj is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail
+        )
+    await db.commit()
+    return obj
+
+
 # Scoring Model Version Endpoints
-@router.get("/models", response_model=List[ScoringModelVersionSchema])
-def get_scoring_models(
+@router.get("/models", response_model=List[ScoringModelVersionSummary])
+async def get_scoring_models(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all scoring model versions."""
-    models = db.query(ScoringModelVersion).offset(skip).limit(limit).all()
-    return models
+    """Get all scoring model versions (dimensions are served by GET /models/{model_id})."""
+    models = (await db.execute(select(
+        ScoringModelVersion.id,
+        ScoringModelVersion.name,
+        ScoringModelVersion.version,
+        ScoringModelVersion.is_active,
+        ScoringModelVersion.activated_at
+    ).order_by(ScoringModelVersion.id).offset(skip).limit(limit))).mappings().all()
+    return orm_list_response(ScoringModelVersionSummary, models)
 
 
 @router.get("/models/active", response_model=ScoringModelVersionSchema)
-def get_active_scoring_model(
-    db: Session = Depends(get_db),
+async def get_active_scoring_model(
+    scoring_service: ScoringService = Depends(get_scoring_service),
     current_user: User = Depends(get_current_user)
 ):
     """Get the currently active scoring model."""
-    scoring_service = ScoringService(db)
-    model = scoring_service.get_active_scoring_model()
+    model = await scoring_service.get_active_scoring_model()
     if not model:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -56,10 +110,20 @@ def get_active_scoring_model(
     return model
 
 
+@router.get("/models/{model_id}", response_model=ScoringModelVersionSchema)
+async def get_scoring_model(
+    model_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get a scoring model version with its dimensions and criteria."""
+    return await _get_or_404(db, ScoringModelVersion, model_id, "Scoring model not found", WITH_DIMENSIONS)
+
+
 @router.post("/models", response_model=ScoringModelVersionSchema)
-def create_scoring_model(
+async def create_scoring_model(
     model_in: ScoringModelVersionCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Create a new scoring model version."""
@@ -75,111 +139,110 @@ def create_scoring_model(
         created_by_id=current_user.id
     )
     db.add(model)
-    db.flush()
+    await db.flush()
     
-    # Create dimensions if provided
+    # Dimensions and criteria are inserted with one executemany each, so the
+    # statement count does not grow with the size of the model (the ORM
+    # needs a statement per row on MySQL, which cannot return their ids)
     if model_in.dimensions:
-        for dim_data in model_in.dimensions:
-            dimension = ScoringDimension(
-                model_version_id=model.id,
-                dimension_type=dim_data.dimension_type,
-                name=dim_data.name,
-                description=dim_data.description,
-                weight=dim_data.weight,
-                color=dim_data.color,
-                icon=dim_data.icon,
-                order=dim_data.order
-            )
-            db.add(dimension)
-            db.flush()
-            
-            # Create criteria if provided
-            if dim_data.criteria:
-                for crit_data in dim_data.criteria:
-                    criteria = ScoringCriteria(
-                        dimension_id=dimension.id,
-                        name=crit_data.name,
-                        description=crit_data.description,
-                        criteria_type=crit_data.criteria_type,
-                        weight=crit_data.weight,
-                        min_value=crit_data.min_value,
-                        max_value=crit_data.max_value,
-                        is_inverted=crit_data.is_inverted,
-                        calculation_formula=crit_data.calculation_formula,
-                        data_source_field=crit_data.data_source_field,
-                        order=crit_data.order,
-                        help_text=crit_data.help_text
-                    )
-                    db.add(criteria)
+        await db.execute(insert(ScoringDimension), [
+            {
+                "model_version_id": model.id,
+                "dimension_type": dim_data.dimension_type,
+                "name": dim_data.name,
+                "description": dim_data.description,
+                "weight": dim_data.weight,
+                "color": dim_data.color,
+                "icon": dim_data.icon,
+                "order": dim_data.order
+            }
+            for dim_data in model_in.dimensions
+        ])
+        
+        # Auto-increment ids follow the row order of a multi-row insert
+        dimension_ids = (await db.scalars(
+            select(ScoringDimension.id).where(
+                ScoringDimension.model_version_id == model.id
+            ).order_by(ScoringDimension.id)
+        )).all()
+        
+        criteria_rows = [
+            {
+                "dimension_id": dimension_id,
+                "name": crit_data.name,
+                "description": crit_data.description,
+                "criteria_type": crit_data.criteria_type,
+                "weight": crit_data.weight,
+                "min_value": crit_data.min_value,
+                "max_value": crit_data.max_value,
+                "is_inverted": crit_data.is_inverted,
+                "calculation_formula": crit_data.calculation_formula,
+                "data_source_field": crit_data.data_source_field,
+                "order": crit_data.order,
+                "help_text": crit_data.help_text
+            }
+            for dimension_id, dim_data in zip(dimension_ids, model_in.dimensions)
+            for crit_data in dim_data.criteria or []
+        ]
+        if criteria_rows:
+            await db.execute(insert(ScoringCriteria), criteria_rows)
     
-    db.commit()
-    db.refresh(model)
-    return model
+    await db.commit()
+    
+    # Load the inserted dimensions and criteria onto the model for the response
+    return await db.get(
+        ScoringModelVersion, model.id, options=[WITH_DIMENSIONS, raiseload("*")], populate_existing=True
+    )
 
 
 @router.put("/models/{model_id}", response_model=ScoringModelVersionSchema)
-def update_scoring_model(
+async def update_scoring_model(
     model_id: int,
     model_in: ScoringModelVersionUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Update a scoring model version."""
-    model = db.query(ScoringModelVersion).filter(ScoringModelVersion.id == model_id).first()
-    if not model:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Scoring model not found"
-        )
-    
-    update_data = model_in.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(model, field, value)
-    
-    db.commit()
-    db.refresh(model)
-    return model
+    return await _update_or_404(
+        db, ScoringModelVersion, model_id, model_in.model_dump(exclude_unset=True),
+        "Scoring model not found", WITH_DIMENSIONS
+    )
 
 
 @router.put("/models/{model_id}/activate", response_model=ScoringModelVersionSchema)
-def activate_scoring_model(
+async def activate_scoring_model(
     model_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Activate a scoring model version (deactivates all others)."""
-    model = db.query(ScoringModelVersion).filter(ScoringModelVersion.id == model_id).first()
-    if not model:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Scoring model not found"
-        )
+    model = await _get_or_404(db, ScoringModelVersion, model_id, "Scoring model not found", WITH_DIMENSIONS)
     
-    # Deactivate all other models
-    db.query(ScoringModelVersion).update({"is_active": False})
+    # Deactivate the other active model; only rows that are active are touched
+    await db.execute(
+        update(ScoringModelVersion).where(
+            ScoringModelVersion.is_active == True,
+            ScoringModelVersion.id != model_id
+        ).values(is_active=False)
+    )
     
     # Activate this model
     model.is_active = True
     model.activated_at = datetime.utcnow()
     
-    db.commit()
-    db.refresh(model)
+    await db.commit()
     return model
 
 
 @router.delete("/models/{model_id}")
-def delete_scoring_model(
+async def delete_scoring_model(
     model_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Delete a scoring model version."""
-    model = db.query(ScoringModelVersion).filter(ScoringModelVersion.id == model_id).first()
-    if not model:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Scoring model not found"
-        )
+    # Dimensions and criteria are deleted by the ORM cascade, which needs them loaded
+    model = await _get_or_404(db, ScoringModelVersion, model_id, "Scoring model not found", WITH_DIMENSIONS)
     
     if model.is_active:
         raise HTTPException(
@@ -187,111 +250,84 @@ def delete_scoring_model(
             detail="Cannot delete active scoring model"
         )
     
-    db.delete(model)
-    db.commit()
+    await db.delete(model)
+    await db.commit()
     return {"message": "Scoring model deleted successfully"}
 
 
 # Scoring Dimension Endpoints
 @router.get("/dimensions", response_model=List[ScoringDimensionSchema])
-def get_scoring_dimensions(
+async def get_scoring_dimensions(
     model_version_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get scoring dimensions, optionally filtered by model version."""
-    query = db.query(ScoringDimension)
+    query = safe_select(ScoringDimension, selectinload(ScoringDimension.criteria))
     if model_version_id:
-        query = query.filter(ScoringDimension.model_version_id == model_version_id)
-    return query.all()
+        query = query.where(ScoringDimension.model_version_id == model_version_id)
+    return orm_list_response(ScoringDimensionSchema, (await db.scalars(query)).all())
 
 
 @router.post("/dimensions", response_model=ScoringDimensionSchema)
-def create_scoring_dimension(
+async def create_scoring_dimension(
     dimension_in: ScoringDimensionCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Create a new scoring dimension."""
-    dimension = ScoringDimension(**dimension_in.dict(exclude={"criteria"}))
+    dimension = ScoringDimension(**dimension_in.model_dump(exclude={"criteria"}), criteria=[])
     db.add(dimension)
-    db.flush()
     
     # Create criteria if provided
     if dimension_in.criteria:
         for crit_data in dimension_in.criteria:
-            criteria = ScoringCriteria(
-                dimension_id=dimension.id,
-                **crit_data.dict()
-            )
-            db.add(criteria)
+            dimension.criteria.append(ScoringCriteria(**crit_data.model_dump()))
     
-    db.commit()
-    db.refresh(dimension)
+    await db.commit()
     return dimension
 
 
 @router.put("/dimensions/{dimension_id}", response_model=ScoringDimensionSchema)
-def update_scoring_dimension(
+async def update_scoring_dimension(
     dimension_id: int,
     dimension_in: ScoringDimensionUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Update a scoring dimension."""
-    dimension = db.query(ScoringDimension).filter(ScoringDimension.id == dimension_id).first()
-    if not dimension:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Scoring dimension not found"
-        )
-    
-    update_data = dimension_in.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(dimension, field, value)
-    
-    db.commit()
-    db.refresh(dimension)
-    return dimension
+    return await _update_or_404(
+        db, ScoringDimension, dimension_id, dimension_in.model_dump(exclude_unset=True),
+        "Scoring dimension not found", selectinload(ScoringDimension.criteria)
+    )
 
 
 # Scoring Criteria Endpoints
 @router.post("/criteria", response_model=ScoringCriteriaSchema)
-def create_scoring_criteria(
+async def create_scoring_criteria(
     criteria_in: ScoringCriteriaCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Create a new scoring criteria."""
-    criteria = ScoringCriteria(**criteria_in.dict())
+    criteria = ScoringCriteria(**criteria_in.model_dump())
     db.add(criteria)
-    db.commit()
-    db.refresh(criteria)
+    await db.commit()
     return criteria
 
 
 @router.put("/criteria/{criteria_id}", response_model=ScoringCriteriaSchema)
-def update_scoring_criteria(
+async def update_scoring_criteria(
     criteria_id: int,
     criteria_in: ScoringCriteriaUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Update a scoring criteria."""
-    criteria = db.query(ScoringCriteria).filter(ScoringCriteria.id == criteria_id).first()
-    if not criteria:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Scoring criteria not found"
-        )
-    
-    update_data = criteria_in.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(criteria, field, value)
-    
-    db.commit()
-    db.refresh(criteria)
-    return criteria
+    return await _update_or_404(
+        db, ScoringCriteria, criteria_id, criteria_in.model_dump(exclude_unset=True),
+        "Scoring criteria not found"
+    )
 
 
 # Initiative Scoring Endpoints
@@ -299,12 +335,10 @@ def update_scoring_criteria(
 async def calculate_initiative_score(
     initiative_id: int,
     request: Optional[CalculateScoreRequest] = None,
-    db: Session = Depends(get_db),
+    scoring_service: ScoringService = Depends(get_scoring_service),
     current_user: User = Depends(get_current_user)
 ):
     """Calculate score for a specific initiative."""
-    scoring_service = ScoringService(db)
-    
     try:
         use_ai = request.use_ai if request else True
         manual_scores = request.manual_scores if request else None
@@ -336,11 +370,10 @@ async def calculate_initiative_score(
 @router.post("/calculate-all")
 async def calculate_all_scores(
     use_ai: bool = True,
-    db: Session = Depends(get_db),
+    scoring_service: ScoringService = Depends(get_scoring_service),
     current_user: User = Depends(get_current_user)
 ):
     """Recalculate scores for all initiatives."""
-    scoring_service = ScoringService(db)
     results = await scoring_service.calculate_all_scores(current_user.id, use_ai)
     
     success_count = sum(1 for r in results if r["success"])
@@ -351,26 +384,27 @@ async def calculate_all_scores(
 
 
 @router.get("/initiative/{initiative_id}/history", response_model=List[InitiativeScoreSchema])
-def get_initiative_score_history(
+async def get_initiative_score_history(
     initiative_id: int,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get score history for an initiative."""
-    scoring_service = ScoringService(db)
-    history = scoring_service.get_initiative_score_history(initiative_id)
-    return history
+    async def history():
+        async with AsyncSessionLocal() as db:
+            async for score in ScoringService(db).get_initiative_score_history(initiative_id):
+                yield score
+    
+    return orm_stream_response(InitiativeScoreSchema, history())
 
 
 @router.get("/initiative/{initiative_id}/current", response_model=InitiativeScoreSchema)
-def get_current_initiative_score(
+async def get_current_initiative_score(
     initiative_id: int,
-    db: Session = Depends(get_db),
+    scoring_service: ScoringService = Depends(get_scoring_service),
     current_user: User = Depends(get_current_user)
 ):
     """Get current score for an initiative."""
-    scoring_service = ScoringService(db)
-    model = scoring_service.get_active_scoring_model()
+    model = await scoring_service.get_active_scoring_model()
     
     if not model:
         raise HTTPException(
@@ -378,10 +412,10 @@ def get_current_initiative_score(
             detail="No active scoring model found"
         )
     
-    score = db.query(InitiativeScore).filter(
+    score = (await scoring_service.db.scalars(safe_select(InitiativeScore).where(
         InitiativeScore.initiative_id == initiative_id,
         InitiativeScore.model_version_id == model.id
-    ).first()
+    ))).first()
     
     if not score:
         raise HTTPException(
@@ -393,12 +427,11 @@ def get_current_initiative_score(
 
 
 @router.get("/rankings", response_model=List[RankingResponse])
-def get_portfolio_rankings(
+async def get_portfolio_rankings(
     limit: Optional[int] = None,
-    db: Session = Depends(get_db),
+    scoring_service: ScoringService = Depends(get_scoring_service),
     current_user: User = Depends(get_current_user)
 ):
     """Get ranked list of all initiatives."""
-    scoring_service = ScoringService(db)
-    rankings = scoring_service.get_portfolio_rankings(limit=limit)
-    return rankings
+    rankings = await scoring_service.get_portfolio_rankings(limit=limit)
+    return orm_list_response(RankingResponse, rankings)
@@ -0,0 +1,91 @@
+"""
+Response helpers for endpoints that return ORM collections, agent output
+or pollable JSON.
+"""
+
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterable, List, Type, TypeVar
+import hashlib
+
+import orjson
+from fastapi import HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+def orm_list_response(schema: Type[BaseModel], rows: Iterable[Any]) -> Response:
+    """
+    Serialize ORM rows to a JSON array through `schema` in a single pass.
+    
+    Returning a Response skips FastAPI's response_model re-validation and
+    jsonable_encoder step; keep response_model on the route so the OpenAPI
+    schema is unchanged.
+    """
+    adapter = _list_adapter(schema)
+    items = adapter.validate_python(list(rows), from_attributes=True)
+    return Response(content=adapter.dump_json(items), media_type="application/json")
+
+
+def orm_stream_response(schema: Type[BaseModel], rows: AsyncIterator[Any]) -> StreamingResponse:
+    """
+    Stream ORM rows as a JSON array, serializing each through `schema` as it
+    arrives.
+    
+    Only the rows currently being fetched are held in memory. `rows` is
+    consumed after the endpoint returns, when the request's dependencies
+    (including its database session) have already been closed, so it must
+    read through a session of its own.
+    """
+    async def body():
+        yield b"["
+        first = True
+        async for row in rows:
+            item = schema.model_validate(row).model_dump_json().encode()
+            yield item if first else b"," + item
+            first = False
+        yield b"]"
+    
+    return StreamingResponse(body(), media_type="application/json")
+
+
+def agent_response(result: Dict[str, Any], schema: Type[ModelT]) -> ModelT:
+    """
+    Validate a successful agent result's JSON output as `schema`.
+    
+    A failed agent call, or output that does not match the schema, is
+    raised as a 500 carrying the agent's error or the validation message.
+    """
+    if not result.get("success"):
+        raise HTTPException(status_code=500, detail=result.get("error"))
+    try:
+        return schema.model_validate_json(result["data"])
+    except ValidationError as e:
+        raise HTTPException(status_code=500, detail=f"Failed to parse AI response: {e}")
+
+
+def etag_json_response(request: Request, content: Any) -> Response:
+    """
+    Serialize `content` to JSON with a strong ETag derived from the body.
+    
+    When the request's If-None-Match already names that ETag an empty 304 is
+    returned instead, so clients polling unchanged data skip the download.
+    Cache-Control makes browsers revalidate on every request rather than
+    reuse a stale copy.
+    """
+    body = orjson.dumps(content)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,118 @@
+"""
+Lightweight in-process caching helpers.
+
+Entries live in the memory of a single worker process and expire after a
+fixed TTL, so this is suited to results that are expensive to compute but
+safe to serve slightly stale (AI agent output, dashboard aggregates).
+
+Caches derived from database rows can be registered with
+invalidate_on_write, which clears them whenever a transaction that wrote
+one of their source models commits.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class TTLCache:
+    """Bounded in-memory cache with per-entry expiry (least recently used evicted first)."""
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by clear(), so a value computed before an invalidation can be dropped
+        self.generation = 0
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing/expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Store value under key, evicting the oldest entries past maxsize.
+        
+        If generation is given and the cache has been cleared since it was
+        read, the value may predate the invalidation and is not stored.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove key if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+            self.generation += 1
+
+
+# Each registered cache with the models it is derived from
+_CACHE_SOURCE_MODELS: List[Tuple[TTLCache, Tuple[type, ...]]] = []
+
+
+def invalidate_on_write(cache: TTLCache, *models: type) -> None:
+    """
+    Clear `cache` whenever a transaction that wrote any of `models` commits.
+    
+    Covers ORM flushes and ORM-enabled insert/update/delete statements on
+    sync and async sessions alike; other worker processes only see the
+    change once their entries expire.
+    """
+    _CACHE_SOURCE_MODELS.append((cache, models))
+
+
+def _mark_stale_caches(session, classes) -> None:
+    stale = session.info.setdefault("stale_caches", set())
+    for index, (_, models) in enumerate(_CACHE_SOURCE_MODELS):
+        if any(issubclass(cls, models) for cls in classes):
+            stale.add(index)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_cached_writes(session, flush_context):
+    """Remember which caches this transaction wrote source rows for."""
+    _mark_stale_caches(session, {type(obj) for obj in session.new | session.dirty | session.deleted})
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_cached_statements(orm_execute_state):
+    """Same as _track_cached_writes, for ORM insert/update/delete statements."""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            _mark_stale_caches(orm_execute_state.session, (mapper.class_,))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_caches(session):
+    for index in session.info.pop("stale_caches", ()):
+        _CACHE_SOURCE_MODELS[index][0].clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_cached_writes(session):
+    session.info.pop("stale_caches", None)
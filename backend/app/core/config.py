@@ -1,6 +1,5 @@
 from pydantic_settings import BaseSettings
 from typing import List
-import json
 
 
 class Settings(BaseSettings):
@@ -20,11 +19,13 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
     # CORS
-    BACKEND_CORS_ORIGINS: str = '["http://localhost:3000","http://localhost:3001","http://localhost:8000"]'
+    # Set as a JSON array in the environment; pydantic-settings parses it
+    # once when the settings load
+    BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:3001", "http://localhost:8000"]
 
     @property
     def cors_origins(self) -> List[str]:
-        return json.loads(self.BACKEND_CORS_ORIGINS)
+        return self.BACKEND_CORS_ORIGINS
 
     # OpenAI
     # The app should use OPEN_API_KEY in .env. We keep OPENAI_API_KEY as a
@@ -32,6 +33,10 @@ class Settings(BaseSettings):
     OPEN_API_KEY: str
     OPENAI_API_KEY: str | None = None
     OPENAI_MODEL: str = "gpt-4-turbo-preview"
+    # Upper bound on OpenAI requests in flight at once (process-wide)
+    OPENAI_MAX_CONCURRENT_REQUESTS: int = 32
+    # Retries with exponential backoff on 429/5xx/connection errors
+    OPENAI_MAX_RETRIES: int = 5
 
     @property
     def openai_api_key(self) -> str:
@@ -1,23 +1,54 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert, make_url, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import raiseload, sessionmaker
 from app.core.config import settings
 
 # Create database engine
+_url = make_url(settings.DATABASE_URL)
+
+# psycopg2 sends executemany UPDATEs/DELETEs row by row unless batch mode is
+# on (bulk INSERTs already go out as multi-row VALUES). PyMySQL rewrites
+# executemany INSERTs into multi-row statements by itself.
+_EXECUTEMANY_OPTIONS = {
+    "psycopg2": {"executemany_mode": "values_plus_batch", "executemany_batch_page_size": 500},
+}
+
 engine = create_engine(
-    settings.DATABASE_URL,
+    _url,
     pool_pre_ping=True,
     pool_recycle=3600,
-    echo=settings.ENVIRONMENT == "development"
+    echo=settings.ENVIRONMENT == "development",
+    **_EXECUTEMANY_OPTIONS.get(_url.get_driver_name(), {})
 )
 
+_IS_SQLITE = settings.DATABASE_URL.startswith("sqlite")
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets readers carry on while a write commits (the sync and async
+    # engines share the file), and with WAL synchronous=NORMAL stays
+    # crash-safe while syncing far less often than the default FULL
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+if _IS_SQLITE:
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
 # Ensure schema is up to date for local development when using SQLite.
 # This is a lightweight fallback in lieu of migrations.
 # It adds missing columns without dropping data.
-if settings.DATABASE_URL.startswith("sqlite"):
+if _IS_SQLITE:
     from sqlalchemy import text
 
     with engine.begin() as conn:
+        # sqlite3 does not open a transaction for DDL on its own, so without
+        # this every ALTER/CREATE INDEX below would commit (and sync) separately
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        
         # Check if initiatives table exists first
         table_exists = conn.execute(
             text("SELECT name FROM sqlite_master WHERE type='table' AND name='initiatives'")
@@ -40,9 +71,97 @@ if settings.DATABASE_URL.startswith("sqlite"):
             _add_col("data_sources", "JSON")
             _add_col("stakeholders", "JSON")
 
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_initiatives_owner_id_id ON initiatives (owner_id, id)"
+            ))
+
+        simulation_cols = {
+            row[1]
+            for row in conn.execute(text("PRAGMA table_info(scenario_simulations)"))
+        }
+        # Keep in sync with ScenarioSimulation model (backend/app/models/scoring.py)
+        if simulation_cols and "status" not in simulation_cols:
+            conn.execute(text("ALTER TABLE scenario_simulations ADD COLUMN status VARCHAR(7)"))
+            conn.execute(text("ALTER TABLE scenario_simulations ADD COLUMN error_message TEXT"))
+            # Simulations saved before optimization moved to the background had already finished
+            conn.execute(text("UPDATE scenario_simulations SET status = 'DONE'"))
+
+        # Composite lookup indexes declared in the models' __table_args__
+        existing_tables = {
+            row[0]
+            for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'"))
+        }
+        if "initiative_scores" in existing_tables:
+            score_indexes = {
+                row[1]: bool(row[2])
+                for row in conn.execute(text("PRAGMA index_list(initiative_scores)"))
+            }
+            if not score_indexes.get("ix_initiative_scores_initiative_id_model_version_id"):
+                # Score upserts need this index to be unique. Older databases
+                # may hold several scores per initiative and model (or a
+                # plain index under this name): keep the latest score only
+                conn.execute(text(
+                    "DELETE FROM initiative_scores WHERE id NOT IN ("
+                    "SELECT MAX(id) FROM initiative_scores GROUP BY initiative_id, model_version_id)"
+                ))
+                conn.execute(text("DROP INDEX IF EXISTS ix_initiative_scores_initiative_id_model_version_id"))
+                conn.execute(text(
+                    "CREATE UNIQUE INDEX ix_initiative_scores_initiative_id_model_version_id "
+                    "ON initiative_scores (initiative_id, model_version_id)"
+                ))
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_initiative_scores_model_version_id_overall_score "
+                "ON initiative_scores (model_version_id, overall_score)"
+            ))
+        if "scoring_model_versions" in existing_tables:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_scoring_model_versions_is_active "
+                "ON scoring_model_versions (is_active)"
+            ))
+        if "initiative_comparisons" in existing_tables:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_initiative_comparisons_initiative_a_id_initiative_b_id "
+                "ON initiative_comparisons (initiative_a_id, initiative_b_id)"
+            ))
+        if "intake_form_templates" in existing_tables:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_intake_form_templates_active_unit_type "
+                "ON intake_form_templates (is_active, business_unit, ai_type)"
+            ))
+        if "board_reports" in existing_tables:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_board_reports_created_at_id ON board_reports (created_at, id)"
+            ))
+        if "initiatives" in existing_tables:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_initiatives_owner_id_id ON initiatives (owner_id, id)"
+            ))
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine on the same database for endpoints that use AsyncSession.
+# Sync drivers in DATABASE_URL are swapped for their asyncio counterparts.
+_ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+_async_url = _url.set(drivername=_ASYNC_DRIVERS.get(_url.get_backend_name(), _url.drivername))
+
+async_engine = create_async_engine(
+    _async_url,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    echo=settings.ENVIRONMENT == "development",
+    **({} if _async_url.get_backend_name() == "sqlite" else {"pool_size": 20, "max_overflow": 40})
+)
+
+if _IS_SQLITE:
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Create base class for models
 Base = declarative_base()
 
@@ -54,3 +173,76 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Dependency to get an async database session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def run_in_new_session(fn, *args, **kwargs):
+    """
+    Call ``fn(db, *args, **kwargs)`` with a short-lived session of its own.
+    
+    Lets independent queries run concurrently (e.g. in worker threads via
+    ``run_in_threadpool``) on separate connections. Returned ORM objects are
+    detached once the session closes, so only read attributes they loaded.
+    """
+    db = SessionLocal()
+    try:
+        return fn(db, *args, **kwargs)
+    finally:
+        db.close()
+
+
+def safe_query(db, model, *eager):
+    """
+    Start a ``db.query(model)`` that refuses to lazy-load relationships.
+    
+    Any relationship not listed in ``eager`` (e.g. ``selectinload(Risk.mitigations)``)
+    raises on access instead of silently issuing one query per row, so list
+    endpoints that only read columns cannot regress into N+1 queries.
+    """
+    return db.query(model).options(*eager, raiseload("*"))
+
+
+def safe_select(model, *eager):
+    """``select(model)`` counterpart of ``safe_query`` for ``AsyncSession``."""
+    return select(model).options(*eager, raiseload("*"))
+
+
+def commit_detached(db, obj):
+    """
+    Flush and commit ``obj`` without expiring it, and return it.
+    
+    The object is detached before the commit, so it keeps the values the
+    flush wrote and reading its columns afterwards does not trigger the
+    follow-up SELECT that ``commit`` + ``refresh`` would. Relationships are
+    not loaded on the returned object. Only suitable for models whose
+    defaults are generated in Python rather than by the database server.
+    """
+    db.flush()
+    db.expunge(obj)
+    db.commit()
+    return obj
+
+
+def insert_returning(db, model, values: dict):
+    """
+    Insert a row, commit it and return the new (detached) object.
+    
+    Uses ``INSERT ... RETURNING`` so the object is populated from the
+    inserted row in a single statement. On databases without INSERT
+    RETURNING (MySQL) it falls back to a plain flush via ``commit_detached``,
+    which is still a single statement for models with Python-side defaults.
+    """
+    if not db.get_bind().dialect.insert_returning:
+        obj = model(**values)
+        db.add(obj)
+        return commit_detached(db, obj)
+    
+    obj = db.execute(insert(model).values(**values).returning(model)).scalar_one()
+    db.expunge(obj)
+    db.commit()
+    return obj
@@ -0,0 +1,123 @@
+"""
+Incremental JSON parsing for streamed agent output.
+
+Agents that stream a JSON object produce it a few characters at a time.
+StreamingJsonParser consumes those chunks and reports each value as soon
+as its closing character arrives, so callers can forward completed fields
+(e.g. ``narrative``, then each entry of ``key_points``) before the whole
+document has been generated.
+"""
+
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+import orjson
+
+JsonPath = Tuple[Union[str, int], ...]
+
+_WHITESPACE = " \t\r\n"
+
+
+class _Frame:
+    """An open object or array and the member currently being read."""
+
+    __slots__ = ("path", "is_object", "key", "index", "value_start")
+
+    def __init__(self, path: JsonPath, is_object: bool):
+        self.path = path
+        self.is_object = is_object
+        self.key: Optional[str] = None
+        self.index = 0
+        self.value_start: Optional[int] = None
+
+    def child_path(self) -> JsonPath:
+        return self.path + ((self.key,) if self.is_object else (self.index,))
+
+
+class StreamingJsonParser:
+    """
+    Stack-based parser that yields ``(path, value)`` for completed values.
+
+    Paths are tuples of object keys and array indexes from the root, e.g.
+    ``("key_points", 2)``. Only values at most ``max_depth`` levels deep are
+    reported; a container is reported after its members, so a client that
+    assigns each value at its path ends up with the full document.
+    """
+
+    def __init__(self, max_depth: int = 2):
+        self.max_depth = max_depth
+        self._text = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._root_start: Optional[int] = None
+        self._in_string = False
+        self._escaped = False
+        self._string_is_key = False
+        self._string_start = 0
+
+    def feed(self, chunk: str) -> Iterator[Tuple[JsonPath, Any]]:
+        """Consume a chunk of the document and yield the values it completes."""
+        self._text += chunk
+        text = self._text
+        for i in range(self._pos, len(text)):
+            char = text[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._string_is_key:
+                        self._stack[-1].key = orjson.loads(text[self._string_start:i + 1])
+                    else:
+                        yield from self._complete_value(i + 1)
+                continue
+
+            if char in _WHITESPACE or char == ":":
+                continue
+            frame = self._stack[-1] if self._stack else None
+            if char == ",":
+                yield from self._complete_scalar(i)
+                if frame is not None:
+                    frame.key = None
+                    frame.index += 1
+            elif char in "}]":
+                yield from self._complete_scalar(i)
+                self._stack.pop()
+                yield from self._complete_value(i + 1)
+            elif char == '"':
+                self._in_string = True
+                self._string_start = i
+                self._string_is_key = frame is not None and frame.is_object and frame.key is None
+                if not self._string_is_key:
+                    self._start_value(i)
+            elif char in "{[":
+                path = self._start_value(i)
+                self._stack.append(_Frame(path, char == "{"))
+            elif frame is not None and frame.value_start is None:
+                # First character of a number, true, false or null
+                self._start_value(i)
+        self._pos = len(text)
+
+    def _start_value(self, start: int) -> JsonPath:
+        if not self._stack:
+            self._root_start = start
+            return ()
+        frame = self._stack[-1]
+        frame.value_start = start
+        return frame.child_path()
+
+    def _complete_scalar(self, end: int) -> Iterator[Tuple[JsonPath, Any]]:
+        """Finish a number/literal, which only ends at the next delimiter."""
+        if self._stack and self._stack[-1].value_start is not None:
+            yield from self._complete_value(end)
+
+    def _complete_value(self, end: int) -> Iterator[Tuple[JsonPath, Any]]:
+        if not self._stack:
+            path, start = (), self._root_start
+        else:
+            frame = self._stack[-1]
+            path, start = frame.child_path(), frame.value_start
+            frame.value_start = None
+        if start is not None and len(path) <= self.max_depth:
+            yield path, orjson.loads(self._text[start:end])
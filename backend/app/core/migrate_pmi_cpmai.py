@@ -21,9 +21,9 @@ def migrate_business_understanding():
                 text("SELECT name FROM sqlite_master WHERE type='table' AND name='business_understanding'")
             ).fetchone()
         else:
-            # PostgreSQL
+            # PostgreSQL / MySQL
             table_exists = conn.execute(
-                text("SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'business_understanding')")
+                text("SELECT EXISTS (SELECT 1 FROM information_schema.tables WHERE table_name = 'business_understanding')")
             ).fetchone()
         
         if not table_exists or (isinstance(table_exists, tuple) and not table_exists[0]):
@@ -37,7 +37,7 @@ def migrate_business_understanding():
                 for row in conn.execute(text("PRAGMA table_info(business_understanding)"))
             }
         else:
-            # PostgreSQL
+            # PostgreSQL / MySQL
             result = conn.execute(
                 text("SELECT column_name FROM information_schema.columns WHERE table_name = 'business_understanding'")
             )
@@ -62,17 +62,32 @@ def migrate_business_understanding():
             ("ai_go_no_go_assessment", "JSON"),
         ]
         
-        # Add missing columns
-        for col_name, col_type in new_columns:
-            if col_name not in cols:
+        missing = [(col_name, col_type) for col_name, col_type in new_columns if col_name not in cols]
+        for col_name, _ in new_columns:
+            if col_name in cols:
+                logger.info(f"Column {col_name} already exists, skipping")
+        
+        if missing and not settings.DATABASE_URL.startswith("sqlite"):
+            # PostgreSQL and MySQL add all columns in one ALTER, taking the
+            # table lock (and, on MySQL, rebuilding the table) once
+            try:
+                logger.info(f"Adding columns: {', '.join(col_name for col_name, _ in missing)}")
+                conn.execute(text(
+                    "ALTER TABLE business_understanding "
+                    + ", ".join(f"ADD COLUMN {col_name} {col_type}" for col_name, col_type in missing)
+                ))
+                logger.info(f"✓ Added {len(missing)} columns")
+            except Exception as e:
+                logger.error(f"✗ Error adding columns: {e}")
+        else:
+            # SQLite only supports one ADD COLUMN per ALTER TABLE
+            for col_name, col_type in missing:
                 try:
                     logger.info(f"Adding column: {col_name} ({col_type})")
                     conn.execute(text(f"ALTER TABLE business_understanding ADD COLUMN {col_name} {col_type}"))
                     logger.info(f"✓ Added column: {col_name}")
                 except Exception as e:
                     logger.error(f"✗ Error adding column {col_name}: {e}")
-            else:
-                logger.info(f"Column {col_name} already exists, skipping")
         
         logger.info("Migration completed successfully!")
 
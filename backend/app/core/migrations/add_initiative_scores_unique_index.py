@@ -0,0 +1,75 @@
+"""Make `initiative_scores (initiative_id, model_version_id)` unique (MySQL / PostgreSQL).
+
+The scoring service upserts one score per initiative and model version,
+and that only works with a UNIQUE index on the pair. Databases created
+before the index was declared can hold several scores per pair, and
+`create_all` never adds indexes to an existing table. On SQLite the
+startup schema fixup in app/core/database.py does this work. This script
+does the same for MySQL and PostgreSQL: it keeps the latest score (the
+highest id) of each pair, then replaces any plain index of that name
+with the UNIQUE one.
+
+Until it has run, the scoring service falls back to select-then-write.
+
+Usage (from backend/):
+  python -m app.core.migrations.add_initiative_scores_unique_index
+"""
+
+import logging
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.core.config import settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "ix_initiative_scores_initiative_id_model_version_id"
+
+
+def migrate_initiative_scores() -> None:
+    """Remove duplicate scores and add the unique index if it is missing."""
+    engine = create_engine(settings.DATABASE_URL)
+    dialect = engine.dialect.name
+    if dialect == "sqlite":
+        logger.info("SQLite databases are migrated on startup (app/core/database.py); nothing to do.")
+        return
+
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        if not inspector.has_table("initiative_scores"):
+            logger.warning("initiative_scores table does not exist yet. It will be created on first run.")
+            return
+
+        indexes = {index["name"]: index for index in inspector.get_indexes("initiative_scores")}
+        if indexes.get(INDEX_NAME, {}).get("unique"):
+            logger.info(f"{INDEX_NAME} is already unique, skipping")
+            return
+
+        # MySQL cannot select from the table a DELETE targets, hence the derived table
+        result = conn.execute(text(
+            "DELETE FROM initiative_scores WHERE id NOT IN ("
+            "SELECT id FROM (SELECT MAX(id) AS id FROM initiative_scores "
+            "GROUP BY initiative_id, model_version_id) AS latest)"
+        ))
+        logger.info(f"Removed {result.rowcount} duplicate scores")
+
+        if INDEX_NAME in indexes and dialect == "mysql":
+            # One ALTER, so the foreign key on initiative_id is never left without an index
+            conn.execute(text(
+                f"ALTER TABLE initiative_scores DROP INDEX {INDEX_NAME}, "
+                f"ADD UNIQUE INDEX {INDEX_NAME} (initiative_id, model_version_id)"
+            ))
+        else:
+            if INDEX_NAME in indexes:
+                conn.execute(text(f"DROP INDEX {INDEX_NAME}"))
+            conn.execute(text(
+                f"CREATE UNIQUE INDEX {INDEX_NAME} ON initiative_scores (initiative_id, model_version_id)"
+            ))
+        logger.info(f"✓ Created unique index {INDEX_NAME}")
+
+
+if __name__ == "__main__":
+    logger.info("Starting initiative score index migration...")
+    migrate_initiative_scores()
+    logger.info("Migration finished!")
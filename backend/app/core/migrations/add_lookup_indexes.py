@@ -0,0 +1,74 @@
+"""Add the composite lookup indexes declared in the models (MySQL / PostgreSQL).
+
+Several models declare indexes in `__table_args__` for the queries that
+page, filter and sort them. `create_all` never adds indexes to an existing
+table, so databases created before the indexes were declared still scan
+these tables. On SQLite the startup schema fixup in app/core/database.py
+creates them. This script creates the missing ones on MySQL and PostgreSQL.
+
+The unique score index is handled by add_initiative_scores_unique_index,
+which also removes duplicate scores first.
+
+Usage (from backend/):
+  python -m app.core.migrations.add_lookup_indexes
+"""
+
+import logging
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.core.config import settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Keep in sync with the __table_args__ of the models in backend/app/models/
+LOOKUP_INDEXES = {
+    "initiatives": [
+        ("ix_initiatives_owner_id_id", ("owner_id", "id")),
+    ],
+    "board_reports": [
+        ("ix_board_reports_created_at_id", ("created_at", "id")),
+    ],
+    "scoring_model_versions": [
+        ("ix_scoring_model_versions_is_active", ("is_active",)),
+    ],
+    "initiative_scores": [
+        ("ix_initiative_scores_model_version_id_overall_score", ("model_version_id", "overall_score")),
+    ],
+    "initiative_comparisons": [
+        ("ix_initiative_comparisons_initiative_a_id_initiative_b_id", ("initiative_a_id", "initiative_b_id")),
+    ],
+    "intake_form_templates": [
+        ("ix_intake_form_templates_active_unit_type", ("is_active", "business_unit", "ai_type")),
+    ],
+}
+
+
+def migrate_lookup_indexes() -> None:
+    """Create each lookup index whose table exists but lacks it."""
+    engine = create_engine(settings.DATABASE_URL)
+    if engine.dialect.name == "sqlite":
+        logger.info("SQLite databases are migrated on startup (app/core/database.py); nothing to do.")
+        return
+
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        for table, indexes in LOOKUP_INDEXES.items():
+            if not inspector.has_table(table):
+                logger.warning(f"{table} table does not exist yet. It will be created on first run.")
+                continue
+
+            existing = {index["name"] for index in inspector.get_indexes(table)}
+            for name, columns in indexes:
+                if name in existing:
+                    logger.info(f"{name} already exists, skipping")
+                    continue
+                conn.execute(text(f"CREATE INDEX {name} ON {table} ({', '.join(columns)})"))
+                logger.info(f"✓ Created index {name}")
+
+
+if __name__ == "__main__":
+    logger.info("Starting lookup index migration...")
+    migrate_lookup_indexes()
+    logger.info("Migration finished!")
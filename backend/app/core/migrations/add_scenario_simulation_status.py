@@ -0,0 +1,77 @@
+"""Add `status` and `error_message` columns to `scenario_simulations` (MySQL / PostgreSQL).
+
+Scenario optimization runs in the background, and each simulation
+records its progress in these columns. `create_all` does not add columns
+to an existing table. On SQLite the startup schema fixup in
+app/core/database.py adds them. This script does the same for MySQL and
+PostgreSQL databases created before the change.
+
+Simulations saved before the change had already finished, so they are
+marked as done.
+
+Usage (from backend/):
+  python -m app.core.migrations.add_scenario_simulation_status
+"""
+
+import logging
+
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Keep in sync with SimulationStatus (backend/app/models/scoring.py); the
+# Enum column stores member names
+STATUS_VALUES = ("QUEUED", "RUNNING", "DONE", "ERROR")
+
+
+def migrate_scenario_simulations() -> None:
+    """Add the simulation status columns if they are missing."""
+    engine = create_engine(settings.DATABASE_URL)
+    dialect = engine.dialect.name
+    if dialect == "sqlite":
+        logger.info("SQLite databases are migrated on startup (app/core/database.py); nothing to do.")
+        return
+
+    schema = "DATABASE()" if dialect == "mysql" else "current_schema()"
+    with engine.begin() as conn:
+        cols = {
+            row[0]
+            for row in conn.execute(text(
+                "SELECT column_name FROM information_schema.columns "
+                f"WHERE table_schema = {schema} AND table_name = 'scenario_simulations'"
+            ))
+        }
+        if not cols:
+            logger.warning("scenario_simulations table does not exist yet. It will be created on first run.")
+            return
+        if "status" in cols:
+            logger.info("scenario_simulations.status already exists, skipping")
+            return
+
+        values = ", ".join(f"'{value}'" for value in STATUS_VALUES)
+        if dialect == "mysql":
+            status_type = f"ENUM({values})"
+        else:
+            # SQLAlchemy's Enum maps to a named PostgreSQL enum type
+            status_type = "simulationstatus"
+            conn.execute(text(
+                "DO $$ BEGIN "
+                f"CREATE TYPE simulationstatus AS ENUM ({values}); "
+                "EXCEPTION WHEN duplicate_object THEN NULL; END $$"
+            ))
+
+        logger.info("Adding columns: status, error_message")
+        conn.execute(text(
+            f"ALTER TABLE scenario_simulations ADD COLUMN status {status_type}, ADD COLUMN error_message TEXT"
+        ))
+        conn.execute(text("UPDATE scenario_simulations SET status = 'DONE'"))
+        logger.info("✓ Added columns and marked existing simulations as done")
+
+
+if __name__ == "__main__":
+    logger.info("Starting scenario simulation status migration...")
+    migrate_scenario_simulations()
+    logger.info("Migration finished!")
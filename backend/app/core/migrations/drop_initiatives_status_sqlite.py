@@ -39,6 +39,15 @@ def migrate(db_path: str) -> None:
             print("No-op: initiatives.status does not exist")
             return
 
+        # Bulk-load settings for the table rewrite. The copy below runs in a
+        # single transaction, so the rollback journal is only kept in memory
+        # and nothing is synced until the end. Not crash-safe: back up the DB
+        # file before running this.
+        cur.execute("PRAGMA journal_mode=MEMORY")
+        cur.execute("PRAGMA synchronous=OFF")
+        cur.execute("PRAGMA cache_size=-200000")  # ~200 MB page cache
+        cur.execute("PRAGMA temp_store=MEMORY")
+
         # Define new schema (status removed)
         cur.execute("PRAGMA foreign_keys=off")
         cur.execute("BEGIN")
@@ -116,11 +125,15 @@ def migrate(db_path: str) -> None:
 
         cur.execute("DROP TABLE initiatives")
         cur.execute("ALTER TABLE initiatives_new RENAME TO initiatives")
+        # Indexes are built after the copy, in one sorted pass each
         cur.execute("CREATE INDEX IF NOT EXISTS ix_initiatives_title ON initiatives (title)")
         cur.execute("CREATE INDEX IF NOT EXISTS ix_initiatives_id ON initiatives (id)")
 
         cur.execute("COMMIT")
         cur.execute("PRAGMA foreign_keys=on")
+        # Back to the settings the app runs with (see app.core.database)
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
 
         print("OK: dropped initiatives.status")
 
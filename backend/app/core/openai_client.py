@@ -0,0 +1,78 @@
+"""
+Shared OpenAI client.
+
+Every agent, service and endpoint that talks to OpenAI uses the same client
+so requests reuse pooled HTTP/2 connections instead of paying a new TCP+TLS
+handshake per client (and per request where clients were built on demand).
+
+The client is synchronous. Async code calls it through run_openai_call,
+which runs the request on a dedicated thread pool so the event loop keeps
+serving while OpenAI responds, and concurrent calls (asyncio.gather
+fan-outs) really run in parallel. The pool size caps requests in flight;
+rate-limit (429) and server errors are retried with exponential backoff by
+the client itself, honouring OpenAI's retry-after headers.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, AsyncIterator, Callable, Iterator, TypeVar
+import asyncio
+
+import httpx
+from openai import OpenAI
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+_openai_executor = ThreadPoolExecutor(
+    max_workers=settings.OPENAI_MAX_CONCURRENT_REQUESTS,
+    thread_name_prefix="openai"
+)
+
+
+@lru_cache(maxsize=None)
+def get_openai_client() -> OpenAI:
+    """Return the process-wide OpenAI client, creating it on first use."""
+    return OpenAI(
+        api_key=settings.openai_api_key,
+        max_retries=settings.OPENAI_MAX_RETRIES,
+        http_client=httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max(100, settings.OPENAI_MAX_CONCURRENT_REQUESTS),
+                max_keepalive_connections=100,
+                # httpx drops idle connections after 5s by default; AI calls are
+                # user-driven and often further apart than that
+                keepalive_expiry=60.0
+            ),
+            timeout=httpx.Timeout(600.0, connect=5.0)
+        )
+    )
+
+
+def close_openai_client() -> None:
+    """Close the shared client's connection pool if it was created."""
+    if get_openai_client.cache_info().currsize:
+        get_openai_client().close()
+        get_openai_client.cache_clear()
+
+
+async def run_openai_call(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking OpenAI client call on the OpenAI thread pool and await it."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_openai_executor, partial(fn, *args, **kwargs))
+
+
+async def iterate_openai_stream(chunks: Iterator[T]) -> AsyncIterator[T]:
+    """
+    Yield from a streamed OpenAI response, reading it on the OpenAI thread pool.
+    
+    Each read blocks until the next chunk arrives, so it counts against the
+    pool like any other request instead of holding a default worker thread.
+    """
+    while True:
+        chunk = await run_openai_call(next, chunks, None)
+        if chunk is None:
+            return
+        yield chunk
@@ -16,7 +16,7 @@ from __future__ import annotations
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash, verify_password
 from app.models.user import User, UserRole
 
 DEFAULT_ADMIN_EMAIL = "admin@example.com"
@@ -31,7 +31,12 @@ def seed_default_admin(db: Session) -> None:
     - If admin@example.com doesn't exist: create it with password admin123.
     - If it exists:
         - Ensure it's active and superuser.
-        - If ENVIRONMENT == development: reset password to admin123.
+        - If ENVIRONMENT == development: reset password to admin123 unless
+          it already is (an unchanged account costs one bcrypt verify and
+          no write).
+
+    Outside development an existing admin never pays for bcrypt; hashing
+    only happens when a password is actually written.
 
     This makes the login credentials stable across fresh DBs, especially when
     using docker-compose (MySQL) where the sqlite `caio_platform.db` is not used.
@@ -39,14 +44,12 @@ def seed_default_admin(db: Session) -> None:
 
     user = db.query(User).filter(User.email == DEFAULT_ADMIN_EMAIL).first()
 
-    desired_hash = get_password_hash(DEFAULT_ADMIN_PASSWORD)
-
     if user is None:
         user = User(
             email=DEFAULT_ADMIN_EMAIL,
             full_name=DEFAULT_ADMIN_NAME,
             role=UserRole.CAIO,
-            hashed_password=desired_hash,
+            hashed_password=get_password_hash(DEFAULT_ADMIN_PASSWORD),
             is_active=True,
             is_superuser=True,
         )
@@ -64,8 +67,10 @@ def seed_default_admin(db: Session) -> None:
         changed = True
 
     # In dev only, normalize password to default
-    if settings.ENVIRONMENT == "development":
-        user.hashed_password = desired_hash
+    if settings.ENVIRONMENT == "development" and not verify_password(
+        DEFAULT_ADMIN_PASSWORD, user.hashed_password
+    ):
+        user.hashed_password = get_password_hash(DEFAULT_ADMIN_PASSWORD)
         changed = True
 
     if changed:
@@ -4,603 +4,674 @@ This script creates a rich dataset of initiatives and risks to populate
 the Analytics dashboard with meaningful visualizations and metrics.
 """
 
+from collections import Counter
 from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import delete, insert, select, text
 from sqlalchemy.orm import Session
-from app.models.initiative import Initiative, InitiativeStatus, InitiativePriority, AIType
+from app.core.seed import DEFAULT_ADMIN_EMAIL
+from app.models.initiative import Initiative, InitiativePriority, AIType
 from app.models.risk import Risk, RiskCategory, RiskSeverity, RiskStatus
 from app.models.user import User
 
 
-def seed_analytics_data(db: Session) -> None:
-    """Create comprehensive test data for analytics dashboard."""
+# Seeded initiatives. Dates are given as day offsets from the time of seeding
+# (negative = in the past) and resolved by seed_analytics_data.
+_INITIATIVE_TEMPLATES = (
+    {
+        "title": "Customer Service AI Chatbot",
+        "description": "Deploy GenAI-powered chatbot to handle tier-1 customer inquiries and reduce support costs by 40%",
+        "business_objective": "Improve customer satisfaction and reduce operational costs",
+        "priority": InitiativePriority.CRITICAL,
+        "ai_type": AIType.GENAI,
+        "strategic_domain": "Customer Experience",
+        "business_function": "Customer Support",
+        "budget_allocated": 2500000.0,
+        "budget_spent": 2100000.0,
+        "expected_roi": 85.0,
+        "actual_roi": 78.0,
+        "business_value_score": 9,
+        "technical_feasibility_score": 8,
+        "risk_score": 4,
+        "strategic_alignment_score": 9,
+        "start_offset_days": -180,
+        "target_offset_days": 30,
+    },
+    {
+        "title": "Predictive Maintenance System",
+        "description": "ML-based predictive maintenance for manufacturing equipment to reduce downtime",
+        "business_objective": "Minimize equipment failures and optimize maintenance schedules",
+        "priority": InitiativePriority.HIGH,
+        "ai_type": AIType.PREDICTIVE,
+        "strategic_domain": "Operations",
+        "business_function": "Manufacturing",
+        "budget_allocated": 1800000.0,
+        "budget_spent": 950000.0,
+        "expected_roi": 120.0,
+        "business_value_score": 8,
+        "technical_feasibility_score": 7,
+        "risk_score": 5,
+        "strategic_alignment_score": 8,
+        "start_offset_days": -90,
+        "target_offset_days": 120,
+    },
+    {
+        "title": "Fraud Detection AI",
+        "description": "Real-time fraud detection system using machine learning to identify suspicious transactions",
+        "business_objective": "Reduce fraud losses and improve transaction security",
+        "priority": InitiativePriority.CRITICAL,
+        "ai_type": AIType.PREDICTIVE,
+        "strategic_domain": "Risk Management",
+        "business_function": "Finance",
+        "budget_allocated": 3200000.0,
+        "budget_spent": 2950000.0,
+        "expected_roi": 150.0,
+        "actual_roi": 145.0,
+        "business_value_score": 10,
+        "technical_feasibility_score": 9,
+        "risk_score": 3,
+        "strategic_alignment_score": 10,
+        "start_offset_days": -270,
+        "target_offset_days": -30,
+    },
+    {
+        "title": "Supply Chain Optimization",
+        "description": "AI-driven supply chain optimization to reduce costs and improve delivery times",
+        "business_objective": "Optimize inventory levels and reduce logistics costs by 25%",
+        "priority": InitiativePriority.HIGH,
+        "ai_type": AIType.OPTIMIZATION,
+        "strategic_domain": "Operations",
+        "business_function": "Supply Chain",
+        "budget_allocated": 2800000.0,
+        "budget_spent": 450000.0,
+        "expected_roi": 95.0,
+        "business_value_score": 9,
+        "technical_feasibility_score": 6,
+        "risk_score": 6,
+        "strategic_alignment_score": 9,
+        "start_offset_days": -45,
+        "target_offset_days": 180,
+    },
+    {
+        "title": "HR Recruitment Automation",
+        "description": "Automate resume screening and candidate matching using AI",
+        "business_objective": "Reduce time-to-hire by 50% and improve candidate quality",
+        "priority": InitiativePriority.MEDIUM,
+        "ai_type": AIType.AUTOMATION,
+        "strategic_domain": "Human Resources",
+        "business_function": "HR",
+        "budget_allocated": 850000.0,
+        "budget_spent": 520000.0,
+        "expected_roi": 65.0,
+        "business_value_score": 7,
+        "technical_feasibility_score": 8,
+        "risk_score": 4,
+        "strategic_alignment_score": 7,
+        "start_offset_days": -60,
+        "target_offset_days": 90,
+    },
+    {
+        "title": "Marketing Campaign Optimizer",
+        "description": "AI-powered marketing campaign optimization and personalization engine",
+        "business_objective": "Increase marketing ROI by 40% through better targeting",
+        "priority": InitiativePriority.HIGH,
+        "ai_type": AIType.OPTIMIZATION,
+        "strategic_domain": "Customer Experience",
+        "business_function": "Marketing",
+        "budget_allocated": 1500000.0,
+        "budget_spent": 1350000.0,
+        "expected_roi": 110.0,
+        "actual_roi": 98.0,
+        "business_value_score": 8,
+        "technical_feasibility_score": 9,
+        "risk_score": 3,
+        "strategic_alignment_score": 8,
+        "start_offset_days": -150,
+        "target_offset_days": -15,
+    },
+    {
+        "title": "Document Intelligence System",
+        "description": "GenAI system for automated document processing and information extraction",
+        "business_objective": "Reduce manual document processing time by 70%",
+        "priority": InitiativePriority.MEDIUM,
+        "ai_type": AIType.GENAI,
+        "strategic_domain": "Operations",
+        "business_function": "Operations",
+        "budget_allocated": 1200000.0,
+        "budget_spent": 280000.0,
+        "expected_roi": 75.0,
+        "business_value_score": 7,
+        "technical_feasibility_score": 7,
+        "risk_score": 5,
+        "strategic_alignment_score": 7,
+        "start_offset_days": -30,
+        "target_offset_days": 150,
+    },
+    {
+        "title": "Sales Forecasting AI",
+        "description": "Predictive analytics for accurate sales forecasting and pipeline management",
+        "business_objective": "Improve forecast accuracy to 95% and optimize resource allocation",
+        "priority": InitiativePriority.HIGH,
+        "ai_type": AIType.PREDICTIVE,
+        "strategic_domain": "Revenue Growth",
+        "business_function": "Sales",
+        "budget_allocated": 950000.0,
+        "budget_spent": 680000.0,
+        "expected_roi": 88.0,
+        "business_value_score": 8,
+        "technical_feasibility_score": 8,
+        "risk_score": 4,
+        "strategic_alignment_score": 9,
+        "start_offset_days": -75,
+        "target_offset_days": 60,
+    },
+    {
+        "title": "Quality Control Vision System",
+        "description": "Computer vision AI for automated quality inspection in manufacturing",
+        "business_objective": "Reduce defect rate by 60% and improve inspection speed",
+        "priority": InitiativePriority.MEDIUM,
+        "ai_type": AIType.PREDICTIVE,
+        "strategic_domain": "Operations",
+        "business_function": "Manufacturing",
+        "budget_allocated": 2100000.0,
+        "budget_spent": 150000.0,
+        "expected_roi": 105.0,
+        "business_value_score": 8,
+        "technical_feasibility_score": 6,
+        "risk_score": 6,
+        "strategic_alignment_score": 8,
+        "start_offset_days": -15,
+        "target_offset_days": 240,
+    },
+    {
+        "title": "Energy Consumption Optimizer",
+        "description": "AI system to optimize building energy consumption and reduce costs",
+        "business_objective": "Reduce energy costs by 30% through intelligent optimization",
+        "priority": InitiativePriority.LOW,
+        "ai_type": AIType.OPTIMIZATION,
+        "strategic_domain": "Sustainability",
+        "business_function": "Facilities",
+        "budget_allocated": 680000.0,
+        "budget_spent": 120000.0,
+        "expected_roi": 55.0,
+        "business_value_score": 6,
+        "technical_feasibility_score": 7,
+        "risk_score": 3,
+        "strategic_alignment_score": 6,
+        "start_offset_days": -20,
+        "target_offset_days": 180,
+    },
+    {
+        "title": "Customer Churn Prediction",
+        "description": "ML model to predict customer churn and enable proactive retention",
+        "business_objective": "Reduce customer churn by 35% through early intervention",
+        "priority": InitiativePriority.CRITICAL,
+        "ai_type": AIType.PREDICTIVE,
+        "strategic_domain": "Customer Experience",
+        "business_function": "Customer Success",
+        "budget_allocated": 1350000.0,
+        "budget_spent": 1280000.0,
+        "expected_roi": 125.0,
+        "actual_roi": 118.0,
+        "business_value_score": 9,
+        "technical_feasibility_score": 8,
+        "risk_score": 3,
+        "strategic_alignment_score": 9,
+        "start_offset_days": -200,
+        "target_offset_days": -20,
+    },
+    {
+        "title": "Code Review Assistant",
+        "description": "GenAI-powered code review and security vulnerability detection",
+        "business_objective": "Improve code quality and reduce security vulnerabilities by 50%",
+        "priority": InitiativePriority.MEDIUM,
+        "ai_type": AIType.GENAI,
+        "strategic_domain": "Technology",
+        "business_function": "Engineering",
+        "budget_allocated": 750000.0,
+        "budget_spent": 480000.0,
+        "expected_roi": 70.0,
+        "business_value_score": 7,
+        "technical_feasibility_score": 9,
+        "risk_score": 4,
+        "strategic_alignment_score": 7,
+        "start_offset_days": -55,
+        "target_offset_days": 75,
+    },
+    {
+        "title": "Inventory Demand Forecasting",
+        "description": "Predictive analytics for inventory demand forecasting and optimization",
+        "business_objective": "Reduce inventory carrying costs by 25% while maintaining service levels",
+        "priority": InitiativePriority.MEDIUM,
+        "ai_type": AIType.PREDICTIVE,
+        "strategic_domain": "Operations",
+        "business_function": "Supply Chain",
+        "budget_allocated": 920000.0,
+        "budget_spent": 340000.0,
+        "expected_roi": 62.0,
+        "business_value_score": 7,
+        "technical_feasibility_score": 7,
+        "risk_score": 5,
+        "strategic_alignment_score": 6,
+        "start_offset_days": -100,
+        "target_offset_days": 200,
+    },
+    {
+        "title": "Legal Document Analysis",
+        "description": "GenAI for contract analysis and legal document review",
+        "business_objective": "Reduce legal review time by 60% and improve accuracy",
+        "priority": InitiativePriority.LOW,
+        "ai_type": AIType.GENAI,
+        "strategic_domain": "Risk Management",
+        "business_function": "Legal",
+        "budget_allocated": 1100000.0,
+        "budget_spent": 80000.0,
+        "expected_roi": 58.0,
+        "business_value_score": 6,
+        "technical_feasibility_score": 6,
+        "risk_score": 7,
+        "strategic_alignment_score": 6,
+        "start_offset_days": -10,
+        "target_offset_days": 270,
+    },
+    {
+        "title": "Price Optimization Engine",
+        "description": "Dynamic pricing optimization using AI to maximize revenue",
+        "business_objective": "Increase revenue by 15% through intelligent pricing strategies",
+        "priority": InitiativePriority.HIGH,
+        "ai_type": AIType.OPTIMIZATION,
+        "strategic_domain": "Revenue Growth",
+        "business_function": "Sales",
+        "budget_allocated": 1650000.0,
+        "budget_spent": 520000.0,
+        "expected_roi": 92.0,
+        "business_value_score": 8,
+        "technical_feasibility_score": 7,
+        "risk_score": 5,
+        "strategic_alignment_score": 8,
+        "start_offset_days": -40,
+        "target_offset_days": 140,
+    },
+    {
+        "title": "Employee Sentiment Analysis",
+        "description": "AI-powered analysis of employee feedback and sentiment tracking",
+        "business_objective": "Improve employee satisfaction and reduce turnover by 20%",
+        "priority": InitiativePriority.LOW,
+        "ai_type": AIType.PREDICTIVE,
+        "strategic_domain": "Human Resources",
+        "business_function": "HR",
+        "budget_allocated": 450000.0,
+        "budget_spent": 420000.0,
+        "expected_roi": 35.0,
+        "actual_roi": 28.0,
+        "business_value_score": 5,
+        "technical_feasibility_score": 8,
+        "risk_score": 6,
+        "strategic_alignment_score": 5,
+        "start_offset_days": -300,
+        "target_offset_days": -60,
+        "completed_offset_days": -50,
+    },
+    {
+        "title": "Network Security AI",
+        "description": "AI-based network security monitoring and threat detection",
+        "business_objective": "Detect and respond to security threats 10x faster",
+        "priority": InitiativePriority.CRITICAL,
+        "ai_type": AIType.PREDICTIVE,
+        "strategic_domain": "Risk Management",
+        "business_function": "IT Security",
+        "budget_allocated": 2900000.0,
+        "budget_spent": 2650000.0,
+        "expected_roi": 135.0,
+        "actual_roi": 130.0,
+        "business_value_score": 10,
+        "technical_feasibility_score": 8,
+        "risk_score": 2,
+        "strategic_alignment_score": 10,
+        "start_offset_days": -220,
+        "target_offset_days": -10,
+    },
+    {
+        "title": "Content Generation Platform",
+        "description": "GenAI platform for automated marketing content creation",
+        "business_objective": "Increase content production by 300% while reducing costs",
+        "priority": InitiativePriority.MEDIUM,
+        "ai_type": AIType.GENAI,
+        "strategic_domain": "Customer Experience",
+        "business_function": "Marketing",
+        "budget_allocated": 890000.0,
+        "budget_spent": 620000.0,
+        "expected_roi": 78.0,
+        "business_value_score": 7,
+        "technical_feasibility_score": 8,
+        "risk_score": 4,
+        "strategic_alignment_score": 7,
+        "start_offset_days": -65,
+        "target_offset_days": 85,
+    },
+    {
+        "title": "Warehouse Robotics Automation",
+        "description": "AI-powered warehouse robotics for automated picking and packing",
+        "business_objective": "Reduce warehouse labor costs by 45% and improve accuracy",
+        "priority": InitiativePriority.HIGH,
+        "ai_type": AIType.AUTOMATION,
+        "strategic_domain": "Operations",
+        "business_function": "Logistics",
+        "budget_allocated": 4500000.0,
+        "budget_spent": 320000.0,
+        "expected_roi": 115.0,
+        "business_value_score": 9,
+        "technical_feasibility_score": 5,
+        "risk_score": 7,
+        "strategic_alignment_score": 8,
+        "start_offset_days": -25,
+        "target_offset_days": 300,
+    },
+    {
+        "title": "Voice of Customer Analytics",
+        "description": "AI analysis of customer feedback across all channels",
+        "business_objective": "Improve product development based on customer insights",
+        "priority": InitiativePriority.LOW,
+        "ai_type": AIType.PREDICTIVE,
+        "strategic_domain": "Customer Experience",
+        "business_function": "Product",
+        "budget_allocated": 720000.0,
+        "budget_spent": 280000.0,
+        "expected_roi": 48.0,
+        "business_value_score": 6,
+        "technical_feasibility_score": 7,
+        "risk_score": 5,
+        "strategic_alignment_score": 6,
+        "start_offset_days": -80,
+        "target_offset_days": 180,
+    },
+)
+
+_DATE_OFFSET_FIELDS = {
+    "start_offset_days": "start_date",
+    "target_offset_days": "target_completion_date",
+    "completed_offset_days": "actual_completion_date",
+}
+
+
+def _resolve_dates(template: dict, now: datetime) -> dict:
+    """Turn a template's day offsets into dates relative to ``now``."""
+    initiative = {}
+    for key, value in template.items():
+        if key in _DATE_OFFSET_FIELDS:
+            initiative[_DATE_OFFSET_FIELDS[key]] = now + timedelta(days=value)
+        else:
+            initiative[key] = value
+    return initiative
+
+
+# Seeded risks, attached to the initiative with the given title
+_RISK_TEMPLATES = (
+    # High-risk initiatives
+    {
+        "initiative_title": "Supply Chain Optimization",
+        "title": "Data Integration Complexity",
+        "description": "Multiple legacy systems need integration which may cause delays",
+        "category": RiskCategory.TECHNICAL,
+        "severity": RiskSeverity.HIGH,
+        "status": RiskStatus.MITIGATING,
+        "likelihood": 4,
+        "impact": 4,
+        "risk_score": 16,  # likelihood * impact
+    },
+    {
+        "initiative_title": "Quality Control Vision System",
+        "title": "Hardware Compatibility Issues",
+        "description": "Existing camera infrastructure may not support required AI processing",
+        "category": RiskCategory.TECHNICAL,
+        "severity": RiskSeverity.HIGH,
+        "status": RiskStatus.IDENTIFIED,
+        "likelihood": 4,
+        "impact": 3,
+        "risk_score": 12,  # likelihood * impact
+    },
+    {
+        "initiative_title": "Legal Document Analysis",
+        "title": "Regulatory Compliance Risk",
+        "description": "AI-generated legal analysis may not meet regulatory standards",
+        "category": RiskCategory.COMPLIANCE,
+        "severity": RiskSeverity.CRITICAL,
+        "status": RiskStatus.ASSESSING,
+        "likelihood": 3,
+        "impact": 5,
+        "risk_score": 15,  # likelihood * impact
+    },
+    {
+        "initiative_title": "Warehouse Robotics Automation",
+        "title": "High Capital Investment Risk",
+        "description": "Significant upfront investment with uncertain ROI timeline",
+        "category": RiskCategory.BUSINESS,
+        "severity": RiskSeverity.HIGH,
+        "status": RiskStatus.IDENTIFIED,
+        "likelihood": 3,
+        "impact": 4,
+        "risk_score": 12,  # likelihood * impact
+    },
+    {
+        "initiative_title": "Customer Service AI Chatbot",
+        "title": "Customer Acceptance Risk",
+        "description": "Customers may prefer human interaction over AI chatbot",
+        "category": RiskCategory.BUSINESS,
+        "severity": RiskSeverity.MEDIUM,
+        "status": RiskStatus.MONITORING,
+        "likelihood": 3,
+        "impact": 3,
+        "risk_score": 9,  # likelihood * impact
+    },
+    {
+        "initiative_title": "Predictive Maintenance System",
+        "title": "Model Accuracy Concerns",
+        "description": "Prediction accuracy may not meet required thresholds initially",
+        "category": RiskCategory.TECHNICAL,
+        "severity": RiskSeverity.MEDIUM,
+        "status": RiskStatus.MITIGATING,
+        "likelihood": 3,
+        "impact": 3,
+        "risk_score": 9,  # likelihood * impact
+    },
+    {
+        "initiative_title": "Fraud Detection AI",
+        "title": "False Positive Rate",
+        "description": "High false positive rate could impact customer experience",
+        "category": RiskCategory.OPERATIONAL,
+        "severity": RiskSeverity.LOW,
+        "status": RiskStatus.RESOLVED,
+        "likelihood": 2,
+        "impact": 2,
+        "risk_score": 4,  # likelihood * impact
+    },
+    {
+        "initiative_title": "HR Recruitment Automation",
+        "title": "Bias in AI Screening",
+        "description": "AI model may exhibit unintended bias in candidate selection",
+        "category": RiskCategory.ETHICAL,
+        "severity": RiskSeverity.HIGH,
+        "status": RiskStatus.MITIGATING,
+        "likelihood": 3,
+        "impact": 4,
+        "risk_score": 12,  # likelihood * impact
+    },
+    {
+        "initiative_title": "Marketing Campaign Optimizer",
+        "title": "Data Privacy Compliance",
+        "description": "Personalization may raise GDPR/CCPA compliance concerns",
+        "category": RiskCategory.COMPLIANCE,
+        "severity": RiskSeverity.MEDIUM,
+        "status": RiskStatus.MONITORING,
+        "likelihood": 2,
+        "impact": 3,
+        "risk_score": 6,  # likelihood * impact
+    },
+    {
+        "initiative_title": "Sales Forecasting AI",
+        "title": "Change Management Resistance",
+        "description": "Sales team may resist adoption of AI-driven forecasting",
+        "category": RiskCategory.OPERATIONAL,
+        "severity": RiskSeverity.MEDIUM,
+        "status": RiskStatus.MITIGATING,
+        "likelihood": 3,
+        "impact": 2,
+        "risk_score": 6,  # likelihood * impact
+    },
+    {
+        "initiative_title": "Customer Churn Prediction",
+        "title": "Data Quality Issues",
+        "description": "Incomplete customer data may affect prediction accuracy",
+        "category": RiskCategory.TECHNICAL,
+        "severity": RiskSeverity.LOW,
+        "status": RiskStatus.RESOLVED,
+        "likelihood": 2,
+        "impact": 2,
+        "risk_score": 4,  # likelihood * impact
+    },
+    {
+        "initiative_title": "Price Optimization Engine",
+        "title": "Market Reaction Uncertainty",
+        "description": "Dynamic pricing may cause negative customer perception",
+        "category": RiskCategory.REPUTATIONAL,
+        "severity": RiskSeverity.MEDIUM,
+        "status": RiskStatus.ASSESSING,
+        "likelihood": 3,
+        "impact": 3,
+        "risk_score": 9,  # likelihood * impact
+    },
+)
+
+
+def _without_title(template: dict) -> dict:
+    """A risk template's columns, without the initiative it is attached by."""
+    return {key: value for key, value in template.items() if key != "initiative_title"}
+
+
+def seed_analytics_data(db: Session, admin_user_id: Optional[int] = None, force: bool = False) -> None:
+    """Create comprehensive test data for analytics dashboard.
+    
+    The initiatives are owned by ``admin_user_id``, or by the default admin
+    user when no id is given. Seeding is idempotent: initiatives and risks
+    that already exist (matched by title) are left alone. With ``force`` the
+    initiatives and risks tables are emptied first.
+    """
     
     # Get the admin user to assign as owner
-    admin_user = db.query(User).filter(User.email == "admin@example.com").first()
-    if not admin_user:
+    if admin_user_id is None:
+        admin_user_id = db.scalar(select(User.id).where(User.email == DEFAULT_ADMIN_EMAIL))
+    if admin_user_id is None:
         print("Error: Admin user not found. Please run seed_default_admin first.")
         return
     
-    # Clear existing data (optional - comment out if you want to keep existing data)
-    print("Clearing existing initiatives and risks...")
-    db.query(Risk).delete()
-    db.query(Initiative).delete()
-    db.commit()
+    is_postgresql = db.get_bind().dialect.name == "postgresql"
+    if is_postgresql:
+        # Seed data is disposable: let the commit return without waiting for
+        # the WAL flush (scoped to this transaction)
+        db.execute(text("SET LOCAL synchronous_commit = OFF"))
+    
+    # Committed together with the inserts below, so a failed seed leaves the old data.
+    if force:
+        print("Clearing existing initiatives and risks...")
+        if is_postgresql:
+            # TRUNCATE needs an exclusive lock on both tables: against a live
+            # database, fail fast instead of queueing behind (and blocking) requests
+            db.execute(text("SET LOCAL lock_timeout = '5s'"))
+            db.execute(text("SET LOCAL statement_timeout = '60s'"))
+            # One statement regardless of table size; CASCADE also empties every
+            # table that references initiatives (scores, roadmap entries, ...)
+            db.execute(text("TRUNCATE TABLE risks, initiatives RESTART IDENTITY CASCADE"))
+        else:
+            db.execute(delete(Risk))
+            db.execute(delete(Initiative))
     
     print("Creating test initiatives...")
     
-    # Define comprehensive initiative data
-    initiatives_data = [
-        {
-            "title": "Customer Service AI Chatbot",
-            "description": "Deploy GenAI-powered chatbot to handle tier-1 customer inquiries and reduce support costs by 40%",
-            "business_objective": "Improve customer satisfaction and reduce operational costs",
-            "status": InitiativeStatus.PRODUCTION,
-            "priority": InitiativePriority.CRITICAL,
-            "ai_type": AIType.GENAI,
-            "strategic_domain": "Customer Experience",
-            "business_function": "Customer Support",
-            "budget_allocated": 2500000.0,
-            "budget_spent": 2100000.0,
-            "expected_roi": 85.0,
-            "actual_roi": 78.0,
-            "business_value_score": 9,
-            "technical_feasibility_score": 8,
-            "risk_score": 4,
-            "strategic_alignment_score": 9,
-            "start_date": datetime.utcnow() - timedelta(days=180),
-            "target_completion_date": datetime.utcnow() + timedelta(days=30),
-        },
-        {
-            "title": "Predictive Maintenance System",
-            "description": "ML-based predictive maintenance for manufacturing equipment to reduce downtime",
-            "business_objective": "Minimize equipment failures and optimize maintenance schedules",
-            "status": InitiativeStatus.PILOT,
-            "priority": InitiativePriority.HIGH,
-            "ai_type": AIType.PREDICTIVE,
-            "strategic_domain": "Operations",
-            "business_function": "Manufacturing",
-            "budget_allocated": 1800000.0,
-            "budget_spent": 950000.0,
-            "expected_roi": 120.0,
-            "business_value_score": 8,
-            "technical_feasibility_score": 7,
-            "risk_score": 5,
-            "strategic_alignment_score": 8,
-            "start_date": datetime.utcnow() - timedelta(days=90),
-            "target_completion_date": datetime.utcnow() + timedelta(days=120),
-        },
-        {
-            "title": "Fraud Detection AI",
-            "description": "Real-time fraud detection system using machine learning to identify suspicious transactions",
-            "business_objective": "Reduce fraud losses and improve transaction security",
-            "status": InitiativeStatus.PRODUCTION,
-            "priority": InitiativePriority.CRITICAL,
-            "ai_type": AIType.PREDICTIVE,
-            "strategic_domain": "Risk Management",
-            "business_function": "Finance",
-            "budget_allocated": 3200000.0,
-            "budget_spent": 2950000.0,
-            "expected_roi": 150.0,
-            "actual_roi": 145.0,
-            "business_value_score": 10,
-            "technical_feasibility_score": 9,
-            "risk_score": 3,
-            "strategic_alignment_score": 10,
-            "start_date": datetime.utcnow() - timedelta(days=270),
-            "target_completion_date": datetime.utcnow() - timedelta(days=30),
-        },
-        {
-            "title": "Supply Chain Optimization",
-            "description": "AI-driven supply chain optimization to reduce costs and improve delivery times",
-            "business_objective": "Optimize inventory levels and reduce logistics costs by 25%",
-            "status": InitiativeStatus.PLANNING,
-            "priority": InitiativePriority.HIGH,
-            "ai_type": AIType.OPTIMIZATION,
-            "strategic_domain": "Operations",
-            "business_function": "Supply Chain",
-            "budget_allocated": 2800000.0,
-            "budget_spent": 450000.0,
-            "expected_roi": 95.0,
-            "business_value_score": 9,
-            "technical_feasibility_score": 6,
-            "risk_score": 6,
-            "strategic_alignment_score": 9,
-            "start_date": datetime.utcnow() - timedelta(days=45),
-            "target_completion_date": datetime.utcnow() + timedelta(days=180),
-        },
-        {
-            "title": "HR Recruitment Automation",
-            "description": "Automate resume screening and candidate matching using AI",
-            "business_objective": "Reduce time-to-hire by 50% and improve candidate quality",
-            "status": InitiativeStatus.PILOT,
-            "priority": InitiativePriority.MEDIUM,
-            "ai_type": AIType.AUTOMATION,
-            "strategic_domain": "Human Resources",
-            "business_function": "HR",
-            "budget_allocated": 850000.0,
-            "budget_spent": 520000.0,
-            "expected_roi": 65.0,
-            "business_value_score": 7,
-            "technical_feasibility_score": 8,
-            "risk_score": 4,
-            "strategic_alignment_score": 7,
-            "start_date": datetime.utcnow() - timedelta(days=60),
-            "target_completion_date": datetime.utcnow() + timedelta(days=90),
-        },
-        {
-            "title": "Marketing Campaign Optimizer",
-            "description": "AI-powered marketing campaign optimization and personalization engine",
-            "business_objective": "Increase marketing ROI by 40% through better targeting",
-            "status": InitiativeStatus.PRODUCTION,
-            "priority": InitiativePriority.HIGH,
-            "ai_type": AIType.OPTIMIZATION,
-            "strategic_domain": "Customer Experience",
-            "business_function": "Marketing",
-            "budget_allocated": 1500000.0,
-            "budget_spent": 1350000.0,
-            "expected_roi": 110.0,
-            "actual_roi": 98.0,
-            "business_value_score": 8,
-            "technical_feasibility_score": 9,
-            "risk_score": 3,
-            "strategic_alignment_score": 8,
-            "start_date": datetime.utcnow() - timedelta(days=150),
-            "target_completion_date": datetime.utcnow() - timedelta(days=15),
-        },
-        {
-            "title": "Document Intelligence System",
-            "description": "GenAI system for automated document processing and information extraction",
-            "business_objective": "Reduce manual document processing time by 70%",
-            "status": InitiativeStatus.PLANNING,
-            "priority": InitiativePriority.MEDIUM,
-            "ai_type": AIType.GENAI,
-            "strategic_domain": "Operations",
-            "business_function": "Operations",
-            "budget_allocated": 1200000.0,
-            "budget_spent": 280000.0,
-            "expected_roi": 75.0,
-            "business_value_score": 7,
-            "technical_feasibility_score": 7,
-            "risk_score": 5,
-            "strategic_alignment_score": 7,
-            "start_date": datetime.utcnow() - timedelta(days=30),
-            "target_completion_date": datetime.utcnow() + timedelta(days=150),
-        },
-        {
-            "title": "Sales Forecasting AI",
-            "description": "Predictive analytics for accurate sales forecasting and pipeline management",
-            "business_objective": "Improve forecast accuracy to 95% and optimize resource allocation",
-            "status": InitiativeStatus.PILOT,
-            "priority": InitiativePriority.HIGH,
-            "ai_type": AIType.PREDICTIVE,
-            "strategic_domain": "Revenue Growth",
-            "business_function": "Sales",
-            "budget_allocated": 950000.0,
-            "budget_spent": 680000.0,
-            "expected_roi": 88.0,
-            "business_value_score": 8,
-            "technical_feasibility_score": 8,
-            "risk_score": 4,
-            "strategic_alignment_score": 9,
-            "start_date": datetime.utcnow() - timedelta(days=75),
-            "target_completion_date": datetime.utcnow() + timedelta(days=60),
-        },
-        {
-            "title": "Quality Control Vision System",
-            "description": "Computer vision AI for automated quality inspection in manufacturing",
-            "business_objective": "Reduce defect rate by 60% and improve inspection speed",
-            "status": InitiativeStatus.IDEATION,
-            "priority": InitiativePriority.MEDIUM,
-            "ai_type": AIType.PREDICTIVE,
-            "strategic_domain": "Operations",
-            "business_function": "Manufacturing",
-            "budget_allocated": 2100000.0,
-            "budget_spent": 150000.0,
-            "expected_roi": 105.0,
-            "business_value_score": 8,
-            "technical_feasibility_score": 6,
-            "risk_score": 6,
-            "strategic_alignment_score": 8,
-            "start_date": datetime.utcnow() - timedelta(days=15),
-            "target_completion_date": datetime.utcnow() + timedelta(days=240),
-        },
-        {
-            "title": "Energy Consumption Optimizer",
-            "description": "AI system to optimize building energy consumption and reduce costs",
-            "business_objective": "Reduce energy costs by 30% through intelligent optimization",
-            "status": InitiativeStatus.PLANNING,
-            "priority": InitiativePriority.LOW,
-            "ai_type": AIType.OPTIMIZATION,
-            "strategic_domain": "Sustainability",
-            "business_function": "Facilities",
-            "budget_allocated": 680000.0,
-            "budget_spent": 120000.0,
-            "expected_roi": 55.0,
-            "business_value_score": 6,
-            "technical_feasibility_score": 7,
-            "risk_score": 3,
-            "strategic_alignment_score": 6,
-            "start_date": datetime.utcnow() - timedelta(days=20),
-            "target_completion_date": datetime.utcnow() + timedelta(days=180),
-        },
-        {
-            "title": "Customer Churn Prediction",
-            "description": "ML model to predict customer churn and enable proactive retention",
-            "business_objective": "Reduce customer churn by 35% through early intervention",
-            "status": InitiativeStatus.PRODUCTION,
-            "priority": InitiativePriority.CRITICAL,
-            "ai_type": AIType.PREDICTIVE,
-            "strategic_domain": "Customer Experience",
-            "business_function": "Customer Success",
-            "budget_allocated": 1350000.0,
-            "budget_spent": 1280000.0,
-            "expected_roi": 125.0,
-            "actual_roi": 118.0,
-            "business_value_score": 9,
-            "technical_feasibility_score": 8,
-            "risk_score": 3,
-            "strategic_alignment_score": 9,
-            "start_date": datetime.utcnow() - timedelta(days=200),
-            "target_completion_date": datetime.utcnow() - timedelta(days=20),
-        },
-        {
-            "title": "Code Review Assistant",
-            "description": "GenAI-powered code review and security vulnerability detection",
-            "business_objective": "Improve code quality and reduce security vulnerabilities by 50%",
-            "status": InitiativeStatus.PILOT,
-            "priority": InitiativePriority.MEDIUM,
-            "ai_type": AIType.GENAI,
-            "strategic_domain": "Technology",
-            "business_function": "Engineering",
-            "budget_allocated": 750000.0,
-            "budget_spent": 480000.0,
-            "expected_roi": 70.0,
-            "business_value_score": 7,
-            "technical_feasibility_score": 9,
-            "risk_score": 4,
-            "strategic_alignment_score": 7,
-            "start_date": datetime.utcnow() - timedelta(days=55),
-            "target_completion_date": datetime.utcnow() + timedelta(days=75),
-        },
-        {
-            "title": "Inventory Demand Forecasting",
-            "description": "Predictive analytics for inventory demand forecasting and optimization",
-            "business_objective": "Reduce inventory carrying costs by 25% while maintaining service levels",
-            "status": InitiativeStatus.ON_HOLD,
-            "priority": InitiativePriority.MEDIUM,
-            "ai_type": AIType.PREDICTIVE,
-            "strategic_domain": "Operations",
-            "business_function": "Supply Chain",
-            "budget_allocated": 920000.0,
-            "budget_spent": 340000.0,
-            "expected_roi": 62.0,
-            "business_value_score": 7,
-            "technical_feasibility_score": 7,
-            "risk_score": 5,
-            "strategic_alignment_score": 6,
-            "start_date": datetime.utcnow() - timedelta(days=100),
-            "target_completion_date": datetime.utcnow() + timedelta(days=200),
-        },
-        {
-            "title": "Legal Document Analysis",
-            "description": "GenAI for contract analysis and legal document review",
-            "business_objective": "Reduce legal review time by 60% and improve accuracy",
-            "status": InitiativeStatus.IDEATION,
-            "priority": InitiativePriority.LOW,
-            "ai_type": AIType.GENAI,
-            "strategic_domain": "Risk Management",
-            "business_function": "Legal",
-            "budget_allocated": 1100000.0,
-            "budget_spent": 80000.0,
-            "expected_roi": 58.0,
-            "business_value_score": 6,
-            "technical_feasibility_score": 6,
-            "risk_score": 7,
-            "strategic_alignment_score": 6,
-            "start_date": datetime.utcnow() - timedelta(days=10),
-            "target_completion_date": datetime.utcnow() + timedelta(days=270),
-        },
-        {
-            "title": "Price Optimization Engine",
-            "description": "Dynamic pricing optimization using AI to maximize revenue",
-            "business_objective": "Increase revenue by 15% through intelligent pricing strategies",
-            "status": InitiativeStatus.PLANNING,
-            "priority": InitiativePriority.HIGH,
-            "ai_type": AIType.OPTIMIZATION,
-            "strategic_domain": "Revenue Growth",
-            "business_function": "Sales",
-            "budget_allocated": 1650000.0,
-            "budget_spent": 520000.0,
-            "expected_roi": 92.0,
-            "business_value_score": 8,
-            "technical_feasibility_score": 7,
-            "risk_score": 5,
-            "strategic_alignment_score": 8,
-            "start_date": datetime.utcnow() - timedelta(days=40),
-            "target_completion_date": datetime.utcnow() + timedelta(days=140),
-        },
-        {
-            "title": "Employee Sentiment Analysis",
-            "description": "AI-powered analysis of employee feedback and sentiment tracking",
-            "business_objective": "Improve employee satisfaction and reduce turnover by 20%",
-            "status": InitiativeStatus.RETIRED,
-            "priority": InitiativePriority.LOW,
-            "ai_type": AIType.PREDICTIVE,
-            "strategic_domain": "Human Resources",
-            "business_function": "HR",
-            "budget_allocated": 450000.0,
-            "budget_spent": 420000.0,
-            "expected_roi": 35.0,
-            "actual_roi": 28.0,
-            "business_value_score": 5,
-            "technical_feasibility_score": 8,
-            "risk_score": 6,
-            "strategic_alignment_score": 5,
-            "start_date": datetime.utcnow() - timedelta(days=300),
-            "target_completion_date": datetime.utcnow() - timedelta(days=60),
-            "actual_completion_date": datetime.utcnow() - timedelta(days=50),
-        },
-        {
-            "title": "Network Security AI",
-            "description": "AI-based network security monitoring and threat detection",
-            "business_objective": "Detect and respond to security threats 10x faster",
-            "status": InitiativeStatus.PRODUCTION,
-            "priority": InitiativePriority.CRITICAL,
-            "ai_type": AIType.PREDICTIVE,
-            "strategic_domain": "Risk Management",
-            "business_function": "IT Security",
-            "budget_allocated": 2900000.0,
-            "budget_spent": 2650000.0,
-            "expected_roi": 135.0,
-            "actual_roi": 130.0,
-            "business_value_score": 10,
-            "technical_feasibility_score": 8,
-            "risk_score": 2,
-            "strategic_alignment_score": 10,
-            "start_date": datetime.utcnow() - timedelta(days=220),
-            "target_completion_date": datetime.utcnow() - timedelta(days=10),
-        },
-        {
-            "title": "Content Generation Platform",
-            "description": "GenAI platform for automated marketing content creation",
-            "business_objective": "Increase content production by 300% while reducing costs",
-            "status": InitiativeStatus.PILOT,
-            "priority": InitiativePriority.MEDIUM,
-            "ai_type": AIType.GENAI,
-            "strategic_domain": "Customer Experience",
-            "business_function": "Marketing",
-            "budget_allocated": 890000.0,
-            "budget_spent": 620000.0,
-            "expected_roi": 78.0,
-            "business_value_score": 7,
-            "technical_feasibility_score": 8,
-            "risk_score": 4,
-            "strategic_alignment_score": 7,
-            "start_date": datetime.utcnow() - timedelta(days=65),
-            "target_completion_date": datetime.utcnow() + timedelta(days=85),
-        },
-        {
-            "title": "Warehouse Robotics Automation",
-            "description": "AI-powered warehouse robotics for automated picking and packing",
-            "business_objective": "Reduce warehouse labor costs by 45% and improve accuracy",
-            "status": InitiativeStatus.IDEATION,
-            "priority": InitiativePriority.HIGH,
-            "ai_type": AIType.AUTOMATION,
-            "strategic_domain": "Operations",
-            "business_function": "Logistics",
-            "budget_allocated": 4500000.0,
-            "budget_spent": 320000.0,
-            "expected_roi": 115.0,
-            "business_value_score": 9,
-            "technical_feasibility_score": 5,
-            "risk_score": 7,
-            "strategic_alignment_score": 8,
-            "start_date": datetime.utcnow() - timedelta(days=25),
-            "target_completion_date": datetime.utcnow() + timedelta(days=300),
-        },
-        {
-            "title": "Voice of Customer Analytics",
-            "description": "AI analysis of customer feedback across all channels",
-            "business_objective": "Improve product development based on customer insights",
-            "status": InitiativeStatus.ON_HOLD,
-            "priority": InitiativePriority.LOW,
-            "ai_type": AIType.PREDICTIVE,
-            "strategic_domain": "Customer Experience",
-            "business_function": "Product",
-            "budget_allocated": 720000.0,
-            "budget_spent": 280000.0,
-            "expected_roi": 48.0,
-            "business_value_score": 6,
-            "technical_feasibility_score": 7,
-            "risk_score": 5,
-            "strategic_alignment_score": 6,
-            "start_date": datetime.utcnow() - timedelta(days=80),
-            "target_completion_date": datetime.utcnow() + timedelta(days=180),
-        },
+    # Only templates whose title is not in the table yet are inserted, in one
+    # batched INSERT; every seeded date is relative to the same instant.
+    # initiative_ids maps titles to the ids risks are attached by.
+    seeded_titles = [template["title"] for template in _INITIATIVE_TEMPLATES]
+    title_filter = Initiative.title.in_(seeded_titles)
+    initiative_ids = dict(db.execute(select(Initiative.title, Initiative.id).where(title_filter)).all())
+    existing_count = len(initiative_ids)
+    now = datetime.utcnow()
+    new_initiatives = [
+        {**_resolve_dates(template, now), "owner_id": admin_user_id}
+        for template in _INITIATIVE_TEMPLATES
+        if template["title"] not in initiative_ids
     ]
+    if new_initiatives:
+        if db.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+            # The new ids come back from the INSERT itself, in parameter order
+            result = db.execute(
+                insert(Initiative).returning(Initiative.id, sort_by_parameter_order=True),
+                new_initiatives
+            )
+            initiative_ids.update(
+                (values["title"], initiative_id)
+                for values, initiative_id in zip(new_initiatives, result.scalars())
+            )
+        else:
+            # MySQL has no INSERT ... RETURNING: read the new ids back
+            db.execute(insert(Initiative), new_initiatives)
+            initiative_ids = dict(db.execute(select(Initiative.title, Initiative.id).where(title_filter)).all())
+    print(f"Created {len(new_initiatives)} initiatives ({existing_count} already present)")
     
-    # Create initiatives
-    created_initiatives = []
-    for init_data in initiatives_data:
-        initiative = Initiative(
-            owner_id=admin_user.id,
-            **init_data
-        )
-        db.add(initiative)
-        created_initiatives.append(initiative)
-    
-    db.commit()
-    print(f"Created {len(created_initiatives)} initiatives")
-    
-    # Create risks for initiatives
+    # Create risks for initiatives, skipping those already recorded
     print("Creating risk records...")
-    risks_data = [
-        # High-risk initiatives
-        {
-            "initiative": created_initiatives[3],  # Supply Chain Optimization
-            "title": "Data Integration Complexity",
-            "description": "Multiple legacy systems need integration which may cause delays",
-            "category": RiskCategory.TECHNICAL,
-            "severity": RiskSeverity.HIGH,
-            "status": RiskStatus.MITIGATING,
-            "likelihood": 4,
-            "impact": 4,
-        },
-        {
-            "initiative": created_initiatives[8],  # Quality Control Vision System
-            "title": "Hardware Compatibility Issues",
-            "description": "Existing camera infrastructure may not support required AI processing",
-            "category": RiskCategory.TECHNICAL,
-            "severity": RiskSeverity.HIGH,
-            "status": RiskStatus.IDENTIFIED,
-            "likelihood": 4,
-            "impact": 3,
-        },
-        {
-            "initiative": created_initiatives[13],  # Legal Document Analysis
-            "title": "Regulatory Compliance Risk",
-            "description": "AI-generated legal analysis may not meet regulatory standards",
-            "category": RiskCategory.COMPLIANCE,
-            "severity": RiskSeverity.CRITICAL,
-            "status": RiskStatus.ASSESSING,
-            "likelihood": 3,
-            "impact": 5,
-        },
-        {
-            "initiative": created_initiatives[18],  # Warehouse Robotics
-            "title": "High Capital Investment Risk",
-            "description": "Significant upfront investment with uncertain ROI timeline",
-            "category": RiskCategory.BUSINESS,
-            "severity": RiskSeverity.HIGH,
-            "status": RiskStatus.IDENTIFIED,
-            "likelihood": 3,
-            "impact": 4,
-        },
-        {
-            "initiative": created_initiatives[0],  # Customer Service Chatbot
-            "title": "Customer Acceptance Risk",
-            "description": "Customers may prefer human interaction over AI chatbot",
-            "category": RiskCategory.BUSINESS,
-            "severity": RiskSeverity.MEDIUM,
-            "status": RiskStatus.MONITORING,
-            "likelihood": 3,
-            "impact": 3,
-        },
-        {
-            "initiative": created_initiatives[1],  # Predictive Maintenance
-            "title": "Model Accuracy Concerns",
-            "description": "Prediction accuracy may not meet required thresholds initially",
-            "category": RiskCategory.TECHNICAL,
-            "severity": RiskSeverity.MEDIUM,
-            "status": RiskStatus.MITIGATING,
-            "likelihood": 3,
-            "impact": 3,
-        },
-        {
-            "initiative": created_initiatives[2],  # Fraud Detection
-            "title": "False Positive Rate",
-            "description": "High false positive rate could impact customer experience",
-            "category": RiskCategory.OPERATIONAL,
-            "severity": RiskSeverity.LOW,
-            "status": RiskStatus.RESOLVED,
-            "likelihood": 2,
-            "impact": 2,
-        },
-        {
-            "initiative": created_initiatives[4],  # HR Recruitment
-            "title": "Bias in AI Screening",
-            "description": "AI model may exhibit unintended bias in candidate selection",
-            "category": RiskCategory.ETHICAL,
-            "severity": RiskSeverity.HIGH,
-            "status": RiskStatus.MITIGATING,
-            "likelihood": 3,
-            "impact": 4,
-        },
-        {
-            "initiative": created_initiatives[5],  # Marketing Campaign
-            "title": "Data Privacy Compliance",
-            "description": "Personalization may raise GDPR/CCPA compliance concerns",
-            "category": RiskCategory.COMPLIANCE,
-            "severity": RiskSeverity.MEDIUM,
-            "status": RiskStatus.MONITORING,
-            "likelihood": 2,
-            "impact": 3,
-        },
-        {
-            "initiative": created_initiatives[7],  # Sales Forecasting
-            "title": "Change Management Resistance",
-            "description": "Sales team may resist adoption of AI-driven forecasting",
-            "category": RiskCategory.OPERATIONAL,
-            "severity": RiskSeverity.MEDIUM,
-            "status": RiskStatus.MITIGATING,
-            "likelihood": 3,
-            "impact": 2,
-        },
-        {
-            "initiative": created_initiatives[10],  # Customer Churn
-            "title": "Data Quality Issues",
-            "description": "Incomplete customer data may affect prediction accuracy",
-            "category": RiskCategory.TECHNICAL,
-            "severity": RiskSeverity.LOW,
-            "status": RiskStatus.RESOLVED,
-            "likelihood": 2,
-            "impact": 2,
-        },
-        {
-            "initiative": created_initiatives[14],  # Price Optimization
-            "title": "Market Reaction Uncertainty",
-            "description": "Dynamic pricing may cause negative customer perception",
-            "category": RiskCategory.REPUTATIONAL,
-            "severity": RiskSeverity.MEDIUM,
-            "status": RiskStatus.ASSESSING,
-            "likelihood": 3,
-            "impact": 3,
-        },
-    ]
-    
-    for risk_data in risks_data:
-        initiative = risk_data.pop("initiative")
-        risk = Risk(
-            initiative_id=initiative.id,
-            risk_score=risk_data["likelihood"] * risk_data["impact"],
-            **risk_data
-        )
-        db.add(risk)
+    existing_risks = set(db.execute(
+        select(Risk.initiative_id, Risk.title).where(Risk.initiative_id.in_(initiative_ids.values()))
+    ).all())
+    new_risks = []
+    for template in _RISK_TEMPLATES:
+        initiative_id = initiative_ids[template["initiative_title"]]
+        if (initiative_id, template["title"]) not in existing_risks:
+            new_risks.append({**_without_title(template), "initiative_id": initiative_id})
+    if new_risks:
+        db.execute(insert(Risk), new_risks)
     
     db.commit()
-    print(f"Created {len(risks_data)} risk records")
+    print(f"Created {len(new_risks)} risk records")
     
-    # Print summary
-    print("\n" + "="*60)
-    print("ANALYTICS DATA SEEDING COMPLETE")
-    print("="*60)
-    print(f"Total Initiatives: {len(created_initiatives)}")
-    print(f"Total Risks: {len(risks_data)}")
-    print("\nStatus Distribution:")
-    status_counts = {}
-    for init in created_initiatives:
-        status_counts[init.status.value] = status_counts.get(init.status.value, 0) + 1
-    for status, count in sorted(status_counts.items()):
-        print(f"  {status}: {count}")
+    # Summary figures come straight from the seeded values, no queries needed
+    priority_counts = Counter(template["priority"].value for template in _INITIATIVE_TEMPLATES)
+    total_allocated = sum(template["budget_allocated"] for template in _INITIATIVE_TEMPLATES)
+    total_spent = sum(template["budget_spent"] for template in _INITIATIVE_TEMPLATES)
+    high_risk = sum(
+        1 for template in _RISK_TEMPLATES
+        if template["severity"] in (RiskSeverity.HIGH, RiskSeverity.CRITICAL)
+    )
     
-    print("\nBudget Summary:")
-    total_allocated = sum(i.budget_allocated for i in created_initiatives)
-    total_spent = sum(i.budget_spent for i in created_initiatives)
-    print(f"  Total Allocated: ${total_allocated:,.2f}")
-    print(f"  Total Spent: ${total_spent:,.2f}")
-    print(f"  Utilization: {(total_spent/total_allocated)*100:.1f}%")
-    
-    print("\nRisk Summary:")
-    high_risk = sum(1 for r in risks_data if r["severity"] in [RiskSeverity.HIGH, RiskSeverity.CRITICAL])
-    print(f"  High/Critical Risks: {high_risk}")
-    print(f"  Medium/Low Risks: {len(risks_data) - high_risk}")
-    print("="*60)
-
+    # Print summary in one write
+    print("\n".join([
+        "\n" + "="*60,
+        "ANALYTICS DATA SEEDING COMPLETE",
+        "="*60,
+        f"Total Initiatives: {len(initiative_ids)}",
+        f"Total Risks: {len(_RISK_TEMPLATES)}",
+        "\nPriority Distribution:",
+        *(f"  {priority}: {count}" for priority, count in sorted(priority_counts.items())),
+        "\nBudget Summary:",
+        f"  Total Allocated: ${total_allocated:,.2f}",
+        f"  Total Spent: ${total_spent:,.2f}",
+        f"  Utilization: {(total_spent/total_allocated)*100:.1f}%",
+        "\nRisk Summary:",
+        f"  High/Critical Risks: {high_risk}",
+        f"  Medium/Low Risks: {len(_RISK_TEMPLATES) - high_risk}",
+        "="*60,
+    ]))
 
 if __name__ == "__main__":
+    import argparse
+    
     from app.core.database import SessionLocal
+    
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--force", action="store_true", help="Delete existing initiatives and risks before seeding")
+    args = parser.parse_args()
+    
     db = SessionLocal()
     try:
-        seed_analytics_data(db)
+        seed_analytics_data(db, force=args.force)
     finally:
         db.close()
@@ -1,9 +1,21 @@
+from contextlib import asynccontextmanager
+import asyncio
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from fastapi.responses import ORJSONResponse
 from app.core.config import settings
+from app.core.openai_client import close_openai_client
 from app.core.database import Base, engine, SessionLocal
 from app.api.api import api_router
+from app.api.endpoints.portfolio import fail_interrupted_simulations
 from app.core.seed import seed_default_admin
+from app.services.reporting_service import refresh_dashboards_periodically
+from app.services.openai_service import preload_token_encoding
+
+logger = logging.getLogger(__name__)
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
@@ -16,14 +28,104 @@ try:
 finally:
     db.close()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Fetch the tokenizer now rather than on the first request that counts tokens
+    preload_token_encoding(settings.OPENAI_MODEL)
+    # Optimizations that were running when the server stopped will never finish
+    try:
+        await fail_interrupted_simulations()
+    except Exception as e:
+        logger.error(
+            f"Could not check for interrupted scenario simulations ({e}); on MySQL/PostgreSQL run "
+            "python -m app.core.migrations.add_scenario_simulation_status"
+        )
+    # Precompute reporting dashboards in the background
+    refresher = asyncio.create_task(refresh_dashboards_periodically())
+    try:
+        yield
+    finally:
+        refresher.cancel()
+        close_openai_client()
+
+
+class InternalErrorMiddleware:
+    """
+    Return unhandled exceptions as ``{"detail": "<error>"}`` with status 500.
+    
+    This is the same response endpoints give with
+    ``HTTPException(status_code=500, detail=str(e))``. Installed inside
+    CORSMiddleware so the error still carries CORS headers (Starlette's own
+    500 handler runs outside all middleware, so the browser would only see
+    an opaque CORS failure). Errors raised after a response has started,
+    e.g. mid-stream, are re-raised.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_tracking_start(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except Exception as e:
+            if response_started:
+                raise
+            logger.exception(f"Unhandled error on {scope['method']} {scope['path']}")
+            await ORJSONResponse({"detail": str(e)}, status_code=500)(scope, receive, send)
+
+
+class _StreamPassthroughGZipResponder(GZipResponder):
+    async def send_with_gzip(self, message):
+        if message["type"] == "http.response.body" and not self.started and message.get("more_body", False):
+            # Streamed body: send it as is, chunk by chunk (see StreamingGZipMiddleware)
+            self.content_encoding_set = True
+        await super().send_with_gzip(message)
+
+
+class StreamingGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware that leaves streamed responses uncompressed.
+    
+    Starlette's responder never flushes the gzip stream, so a streamed
+    body (agent JSON streams, Server-Sent Events, streamed lists) would
+    only reach the client once it ended. Responses sent in one piece are
+    compressed as before.
+    """
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = _StreamPassthroughGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
-    redirect_slashes=False
+    redirect_slashes=False,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Added before CORSMiddleware so it runs inside it
+app.add_middleware(InternalErrorMiddleware)
+
 # Set up CORS
 app.add_middleware(
     CORSMiddleware,
@@ -33,10 +135,15 @@ app.add_middleware(
     # If the app doesn't respond to OPTIONS, the browser blocks the request and you see 405.
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let the frontend read pagination cursors
+    expose_headers=["X-Next-Cursor"],
     # Ensure preflight responses include required headers.
     max_age=600,
 )
 
+# Compress larger responses sent in one piece (streamed responses pass through)
+app.add_middleware(StreamingGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -11,7 +11,7 @@ from app.models.roadmap import (
 )
 from app.models.scoring import (
     ScoringModelVersion, ScoringDimension, ScoringCriteria, InitiativeScore,
-    ScenarioSimulation, InitiativeComparison, DimensionType, CriteriaType
+    ScenarioSimulation, InitiativeComparison, DimensionType, CriteriaType, SimulationStatus
 )
 from app.models.benefits import (
     KPIBaseline, KPIMeasurement, BenefitRealization, BenefitConfidenceScore,
@@ -64,6 +64,7 @@ __all__ = [
     "InitiativeComparison",
     "DimensionType",
     "CriteriaType",
+    "SimulationStatus",
     "KPIBaseline",
     "KPIMeasurement",
     "BenefitRealization",
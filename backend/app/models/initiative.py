@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Enum, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Enum, ForeignKey, JSON, Index, case, type_coerce
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -21,6 +22,10 @@ class AIType(str, enum.Enum):
 
 class Initiative(Base):
     __tablename__ = "initiatives"
+    __table_args__ = (
+        # Owner-scoped listings ordered by id
+        Index("ix_initiatives_owner_id_id", "owner_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False, index=True)
@@ -65,6 +70,19 @@ class Initiative(Base):
     roadmap_quarter = Column(String(10), nullable=True)  # e.g., "Q1 2024"
     roadmap_position = Column(String(20), nullable=True)  # "now", "next", "later"
     
+    @hybrid_property
+    def ai_type_value(self):
+        """AI type as its string value (e.g. "genai"), or None."""
+        return self.ai_type.value if self.ai_type else None
+    
+    @ai_type_value.expression
+    def ai_type_value(cls):
+        # The column stores enum names; map them to values in SQL
+        return case(
+            {member.name: member.value for member in AIType},
+            value=type_coerce(cls.ai_type, String)
+        )
+    
     # Relationships
     owner = relationship("User", back_populates="initiatives")
     metrics = relationship("InitiativeMetric", back_populates="initiative", cascade="all, delete-orphan")
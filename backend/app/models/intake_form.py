@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Enum, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Enum, JSON, Index
 from datetime import datetime
 import enum
 from app.core.database import Base
@@ -25,6 +25,10 @@ class AIType(str, enum.Enum):
 
 class IntakeFormTemplate(Base):
     __tablename__ = "intake_form_templates"
+    __table_args__ = (
+        # Active templates filtered by business unit and/or AI type
+        Index("ix_intake_form_templates_active_unit_type", "is_active", "business_unit", "ai_type"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
@@ -1,7 +1,7 @@
 """
 Reporting models for Module 6 - CAIO & Board Reporting
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, ForeignKey, JSON, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, ForeignKey, JSON, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -84,6 +84,10 @@ class ExecutiveDashboard(Base):
 class BoardReport(Base):
     """Generated board reports with metadata"""
     __tablename__ = "board_reports"
+    __table_args__ = (
+        # Newest-first listing, paged by (created_at, id) cursor
+        Index("ix_board_reports_created_at_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(300), nullable=False)
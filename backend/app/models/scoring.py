@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, ForeignKey, JSON, Enum
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, ForeignKey, JSON, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -19,9 +19,20 @@ class CriteriaType(str, enum.Enum):
     CALCULATED = "calculated"  # Derived from other fields
 
 
+class SimulationStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    ERROR = "error"
+
+
 class ScoringModelVersion(Base):
     """Versioned scoring models for historical tracking and comparison."""
     __tablename__ = "scoring_model_versions"
+    __table_args__ = (
+        # Active-model lookup and the deactivation on activate
+        Index("ix_scoring_model_versions_is_active", "is_active"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
@@ -102,6 +113,12 @@ class ScoringCriteria(Base):
 class InitiativeScore(Base):
     """Calculated scores for initiatives with historical tracking."""
     __tablename__ = "initiative_scores"
+    __table_args__ = (
+        # One score per initiative and model version (the scoring service upserts)
+        Index("ix_initiative_scores_initiative_id_model_version_id", "initiative_id", "model_version_id", unique=True),
+        # Portfolio rankings: a model's scores in descending order
+        Index("ix_initiative_scores_model_version_id_overall_score", "model_version_id", "overall_score"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     initiative_id = Column(Integer, ForeignKey("initiatives.id"), nullable=False)
@@ -169,6 +186,10 @@ class ScenarioSimulation(Base):
     trade_offs = Column(JSON)  # List of trade-offs made
     alternative_scenarios = Column(JSON)  # Alternative recommendations
     
+    # Background optimization progress
+    status = Column(Enum(SimulationStatus), default=SimulationStatus.QUEUED)
+    error_message = Column(Text)
+    
     # Metadata
     created_by_id = Column(Integer, ForeignKey("users.id"))
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -181,6 +202,10 @@ class ScenarioSimulation(Base):
 class InitiativeComparison(Base):
     """Store initiative comparisons and AI justifications."""
     __tablename__ = "initiative_comparisons"
+    __table_args__ = (
+        # Existing-comparison lookup when comparing a pair again
+        Index("ix_initiative_comparisons_initiative_a_id_initiative_b_id", "initiative_a_id", "initiative_b_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     initiative_a_id = Column(Integer, ForeignKey("initiatives.id"), nullable=False)
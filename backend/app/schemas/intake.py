@@ -18,9 +18,9 @@ class ValidateIntakeRequest(BaseModel):
 
 
 class ValidateIntakeResponse(BaseModel):
-    success: bool
-    missing_fields: List[Dict[str, str]]
-    completeness_score: int
+    success: bool = True
+    missing_fields: List[Dict[str, str]] = []
+    completeness_score: int = 0
     suggestions: Optional[List[str]] = None
 
 
@@ -32,7 +32,7 @@ class ClassifyUseCaseRequest(BaseModel):
 
 
 class ClassifyUseCaseResponse(BaseModel):
-    success: bool
+    success: bool = True
     ai_type: Optional[Dict[str, Any]] = None
     strategic_domain: Optional[Dict[str, Any]] = None
     business_function: Optional[Dict[str, Any]] = None
@@ -101,6 +101,24 @@ class BoardReport(BoardReportBase):
         from_attributes = True
 
 
+class BoardReportSummary(BaseModel):
+    """Board report listing entry, without the report body"""
+    id: int
+    title: str
+    report_type: ReportType
+    status: ReportStatus
+    period_start: Optional[datetime] = None
+    period_end: Optional[datetime] = None
+    generated_by: int
+    generated_at: Optional[datetime] = None
+    ai_generated: bool
+    export_format: Optional[ExportFormat] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 # ============================================================================
 # Strategy Brief Schemas
 # ============================================================================
@@ -401,6 +419,16 @@ class PortfolioHealthData(BaseModel):
     key_metrics: Dict[str, Any]
 
 
+class DashboardOverview(BaseModel):
+    """All dashboard data in a single response"""
+    value_pipeline: ValuePipelineData
+    delivered_value: DeliveredValueData
+    risk_exposure: RiskExposureData
+    stage_distribution: StageDistributionData
+    bottlenecks: BottleneckData
+    portfolio_health: PortfolioHealthData
+
+
 # ============================================================================
 # AI Agent Request/Response Schemas
 # ============================================================================
@@ -416,11 +444,11 @@ class GenerateNarrativeRequest(BaseModel):
 
 class GenerateNarrativeResponse(BaseModel):
     """Response with generated narrative"""
-    narrative: str
-    key_points: List[str]
-    chart_recommendations: List[Dict[str, Any]]
-    confidence_score: float
-    word_count: int
+    narrative: str = ""
+    key_points: List[str] = []
+    chart_recommendations: List[Dict[str, Any]] = []
+    confidence_score: float = 0.0
+    word_count: int = 0
 
 
 class ExplainTradeoffsRequest(BaseModel):
@@ -432,10 +460,10 @@ class ExplainTradeoffsRequest(BaseModel):
 
 class ExplainTradeoffsResponse(BaseModel):
     """Response with trade-off explanation"""
-    explanation: str
-    key_tradeoffs: List[Dict[str, Any]]
-    recommendation: str
-    confidence_score: float
+    explanation: str = ""
+    key_tradeoffs: List[Dict[str, Any]] = []
+    recommendation: str = ""
+    confidence_score: float = 0.0
 
 
 class GenerateTalkingPointsRequest(BaseModel):
@@ -447,9 +475,9 @@ class GenerateTalkingPointsRequest(BaseModel):
 
 class GenerateTalkingPointsResponse(BaseModel):
     """Response with talking points"""
-    talking_points: List[str]
-    supporting_data: Dict[str, Any]
-    anticipated_questions: List[str]
+    talking_points: List[str] = []
+    supporting_data: Dict[str, Any] = {}
+    anticipated_questions: List[str] = []
 
 
 class GenerateBoardSummaryRequest(BaseModel):
@@ -462,11 +490,11 @@ class GenerateBoardSummaryRequest(BaseModel):
 
 class GenerateBoardSummaryResponse(BaseModel):
     """Response with board summary"""
-    summary: str
-    highlights: List[str]
-    concerns: List[str]
-    recommendations: List[str]
-    confidence_score: float
+    summary: str = ""
+    highlights: List[str] = []
+    concerns: List[str] = []
+    recommendations: List[str] = []
+    confidence_score: float = 0.0
 
 
 class GenerateRecommendationsRequest(BaseModel):
@@ -478,10 +506,10 @@ class GenerateRecommendationsRequest(BaseModel):
 
 class GenerateRecommendationsResponse(BaseModel):
     """Response with recommendations"""
-    recommendations: List[Dict[str, Any]]
-    rationale: Dict[str, str]
-    priority_order: List[int]
-    estimated_impact: Dict[str, Any]
+    recommendations: List[Dict[str, Any]] = []
+    rationale: Dict[str, str] = {}
+    priority_order: List[int] = []
+    estimated_impact: Dict[str, Any] = {}
 
 
 # ============================================================================
@@ -132,6 +132,18 @@ class ScoringModelVersion(ScoringModelVersionBase):
         from_attributes = True
 
 
+class ScoringModelVersionSummary(BaseModel):
+    """Scoring model listing entry, without dimensions and criteria"""
+    id: int
+    name: str
+    version: str
+    is_active: bool
+    activated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 # Initiative Score Schemas
 class InitiativeScoreBase(BaseModel):
     overall_score: float = Field(..., ge=0, le=10)
@@ -200,6 +212,13 @@ class ScenarioSimulationUpdate(BaseModel):
     risk_tolerance: Optional[str] = None
 
 
+class SimulationStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    ERROR = "error"
+
+
 class ScenarioSimulation(ScenarioSimulationBase):
     id: int
     selected_initiatives: Optional[List[int]] = []
@@ -210,6 +229,8 @@ class ScenarioSimulation(ScenarioSimulationBase):
     optimization_strategy: Optional[str] = None
     trade_offs: Optional[List[str]] = []
     alternative_scenarios: Optional[List[Dict[str, Any]]] = []
+    status: Optional[SimulationStatus] = None
+    error_message: Optional[str] = None
     created_by_id: Optional[int] = None
     created_at: datetime
     updated_at: datetime
@@ -218,6 +239,16 @@ class ScenarioSimulation(ScenarioSimulationBase):
         from_attributes = True
 
 
+class ScenarioSimulationStatus(BaseModel):
+    id: int
+    status: Optional[SimulationStatus] = None
+    error_message: Optional[str] = None
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 # Initiative Comparison Schemas
 class InitiativeComparisonBase(BaseModel):
     initiative_a_id: int
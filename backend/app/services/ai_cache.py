@@ -0,0 +1,199 @@
+"""
+AI Response Cache
+
+Two-tier cache for agent responses that depend only on their input:
+
+- Exact tier: keyed on the call name and a hash of the canonicalized
+  payload, so repeated submissions (and key-order/whitespace variants)
+  skip the OpenAI round trip.
+- Semantic tier: payloads whose numbers, keys and structure match exactly
+  but whose free text is only reworded reuse a previous response when the
+  text embeddings are close enough. Only prose counts as free text: short
+  or single-word strings (dates, periods, enum values, statuses) and the
+  numbers inside prose must match exactly, so a narrative is never served
+  for different figures or a different period.
+
+Concurrent misses for the same payload are coalesced: the first caller
+makes the OpenAI call and the others await its result, so a burst of
+identical requests (dashboard refreshes across tabs) costs one call.
+
+Entries live in process memory (see app.core.cache.TTLCache).
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import logging
+import re
+import time
+
+import numpy as np
+import orjson
+
+from app.core.cache import TTLCache
+from app.services.semantic_search_service import semantic_search_service
+
+logger = logging.getLogger(__name__)
+
+# Cosine similarity a reworded payload needs to reuse a cached response
+SEMANTIC_SIMILARITY_THRESHOLD = 0.97
+# Payloads with less free text than this only use the exact tier
+MIN_SEMANTIC_TEXT_CHARS = 40
+# Cached responses kept per payload structure for the semantic tier
+SEMANTIC_ENTRIES_PER_STRUCTURE = 32
+# Strings shorter than this, or without whitespace, are matched exactly
+# rather than treated as free text
+MIN_FREE_TEXT_CHARS = 32
+
+# Numbers inside free text, including dates and times ("2024-03-31", "Q2")
+_NUMBER = re.compile(r"\d+(?:[.,:/-]\d+)*")
+
+
+def _digest(value: Any) -> str:
+    """Stable hash of a JSON-like value (key order and whitespace do not matter)."""
+    return hashlib.blake2b(
+        orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str),
+        digest_size=16
+    ).hexdigest()
+
+
+def _is_free_text(value: str) -> bool:
+    return len(value) >= MIN_FREE_TEXT_CHARS and any(char.isspace() for char in value.strip())
+
+
+def _split_text(payload: Any) -> Tuple[Any, List[str]]:
+    """
+    Separate a payload into its structure and its free text.
+
+    Free text strings are replaced in the structure by the numbers they
+    contain; all other strings are kept in the structure as they are.
+    """
+    texts: List[str] = []
+
+    def walk(value: Any) -> Any:
+        if isinstance(value, str):
+            if not _is_free_text(value):
+                return value
+            texts.append(value)
+            return ["<text>", *_NUMBER.findall(value)]
+        if isinstance(value, dict):
+            return {key: walk(value[key]) for key in sorted(value, key=str)}
+        if isinstance(value, (list, tuple)):
+            return [walk(item) for item in value]
+        return value
+
+    return walk(payload), texts
+
+
+class AIResponseCache:
+    """Exact + semantic cache in front of deterministic agent calls."""
+
+    def __init__(self, ttl_seconds: float = 86400, maxsize: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self._exact = TTLCache(ttl_seconds=ttl_seconds, maxsize=maxsize)
+        # (name, structure digest) -> [(expires_at, unit embedding, response)]
+        self._semantic = TTLCache(ttl_seconds=ttl_seconds, maxsize=maxsize)
+        # exact key -> task resolving a miss that is currently in flight
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    async def get_or_call(
+        self,
+        name: str,
+        payload: Any,
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+        semantic: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Return the cached response for ``payload`` or make ``call`` and cache it.
+
+        Only successful responses are cached. With ``semantic`` the call is
+        also matched against previous payloads of the same structure by the
+        similarity of their free text. Callers that miss while the same
+        payload is already being resolved share that call's result.
+        """
+        exact_key = (name, _digest(payload))
+        cached = self._exact.get(exact_key)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(exact_key)
+        if task is None:
+            task = asyncio.ensure_future(self._resolve(exact_key, payload, call, semantic))
+            self._inflight[exact_key] = task
+            task.add_done_callback(lambda done: self._finish(exact_key, done))
+        # Shielded so one caller disconnecting does not cancel the shared call
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._exact.clear()
+        self._semantic.clear()
+
+    def _finish(self, key: Tuple[str, str], task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark a failure as retrieved in case every caller has gone away
+            task.exception()
+
+    async def _resolve(
+        self,
+        exact_key: Tuple[str, str],
+        payload: Any,
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+        semantic: bool
+    ) -> Dict[str, Any]:
+        """Serve a miss from the semantic tier or make the call, and cache the result."""
+        name = exact_key[0]
+        semantic_key = None
+        vector = None
+        if semantic:
+            structure, texts = _split_text(payload)
+            text = "\n".join(texts)
+            if len(text) >= MIN_SEMANTIC_TEXT_CHARS:
+                semantic_key = (name, _digest(structure))
+                vector = await self._embed(text)
+                cached = self._semantic_lookup(semantic_key, vector)
+                if cached is not None:
+                    self._exact.set(exact_key, cached)
+                    return cached
+
+        result = await call()
+        if result.get("success"):
+            self._exact.set(exact_key, result)
+            if semantic_key is not None and vector is not None:
+                self._semantic_store(semantic_key, vector, result)
+        return result
+
+    async def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Unit-length embedding of ``text``, or None if embeddings are unavailable."""
+        try:
+            vector = np.asarray(await semantic_search_service.generate_embedding(text), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup skipped, embedding failed: {e}")
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def _semantic_lookup(self, key: Tuple[str, str], vector: Optional[np.ndarray]) -> Optional[Dict[str, Any]]:
+        if vector is None:
+            return None
+        now = time.monotonic()
+        best, best_score = None, SEMANTIC_SIMILARITY_THRESHOLD
+        for expires_at, cached_vector, response in self._semantic.get(key, []):
+            if expires_at < now:
+                continue
+            score = float(cached_vector @ vector)
+            if score >= best_score:
+                best, best_score = response, score
+        return best
+
+    def _semantic_store(self, key: Tuple[str, str], vector: np.ndarray, response: Dict[str, Any]) -> None:
+        now = time.monotonic()
+        entries = [entry for entry in self._semantic.get(key, []) if entry[0] >= now]
+        entries.append((now + self.ttl_seconds, vector, response))
+        self._semantic.set(key, entries[-SEMANTIC_ENTRIES_PER_STRUCTURE:])
+
+
+# Singleton instance
+ai_response_cache = AIResponseCache()
@@ -37,7 +37,7 @@ class AIProjectService:
     ) -> BusinessUnderstanding:
         """Create business understanding for an initiative"""
         db_business_understanding = BusinessUnderstanding(
-            **business_understanding.dict(),
+            **business_understanding.model_dump(),
             created_by=user_id
         )
         db.add(db_business_understanding)
@@ -69,7 +69,7 @@ class AIProjectService:
         if not db_business_understanding:
             return None
         
-        update_data = business_understanding_update.dict(exclude_unset=True)
+        update_data = business_understanding_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_business_understanding, field, value)
         
@@ -112,7 +112,7 @@ class AIProjectService:
     ) -> DataUnderstanding:
         """Create data understanding record"""
         db_data_understanding = DataUnderstanding(
-            **data_understanding.dict(),
+            **data_understanding.model_dump(),
             created_by=user_id
         )
         db.add(db_data_understanding)
@@ -154,7 +154,7 @@ class AIProjectService:
         if not db_data_understanding:
             return None
         
-        update_data = data_understanding_update.dict(exclude_unset=True)
+        update_data = data_understanding_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_data_understanding, field, value)
         
@@ -172,7 +172,7 @@ class AIProjectService:
     ) -> DataPreparation:
         """Create data preparation step"""
         db_data_preparation = DataPreparation(
-            **data_preparation.dict(),
+            **data_preparation.model_dump(),
             created_by=user_id
         )
         db.add(db_data_preparation)
@@ -214,7 +214,7 @@ class AIProjectService:
         if not db_data_preparation:
             return None
         
-        update_data = data_preparation_update.dict(exclude_unset=True)
+        update_data = data_preparation_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_data_preparation, field, value)
         
@@ -232,7 +232,7 @@ class AIProjectService:
     ) -> ModelDevelopment:
         """Create model development record"""
         db_model = ModelDevelopment(
-            **model.dict(),
+            **model.model_dump(),
             created_by=user_id
         )
         db.add(db_model)
@@ -274,7 +274,7 @@ class AIProjectService:
         if not db_model:
             return None
         
-        update_data = model_update.dict(exclude_unset=True)
+        update_data = model_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_model, field, value)
         
@@ -338,7 +338,7 @@ class AIProjectService:
     ) -> ModelEvaluation:
         """Create model evaluation"""
         db_evaluation = ModelEvaluation(
-            **evaluation.dict(),
+            **evaluation.model_dump(),
             created_by=user_id
         )
         db.add(db_evaluation)
@@ -380,7 +380,7 @@ class AIProjectService:
         if not db_evaluation:
             return None
         
-        update_data = evaluation_update.dict(exclude_unset=True)
+        update_data = evaluation_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_evaluation, field, value)
         
@@ -420,7 +420,7 @@ class AIProjectService:
     ) -> ModelDeployment:
         """Create model deployment"""
         db_deployment = ModelDeployment(
-            **deployment.dict(),
+            **deployment.model_dump(),
             deployed_by=user_id
         )
         db.add(db_deployment)
@@ -462,7 +462,7 @@ class AIProjectService:
         if not db_deployment:
             return None
         
-        update_data = deployment_update.dict(exclude_unset=True)
+        update_data = deployment_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_deployment, field, value)
         
@@ -543,7 +543,7 @@ class AIProjectService:
         monitoring: ModelMonitoringCreate
     ) -> ModelMonitoring:
         """Record monitoring data"""
-        db_monitoring = ModelMonitoring(**monitoring.dict())
+        db_monitoring = ModelMonitoring(**monitoring.model_dump())
         db.add(db_monitoring)
         db.commit()
         db.refresh(db_monitoring)
@@ -580,7 +580,7 @@ class AIProjectService:
         """Get project overview dashboard"""
         from app.models.initiative import Initiative
         
-        initiative = db.query(Initiative).filter(Initiative.id == initiative_id).first()
+        initiative = db.get(Initiative, initiative_id)
         if not initiative:
             return None
         
@@ -302,7 +302,7 @@ class BenefitsService:
     @staticmethod
     def get_initiative_dashboard(db: Session, initiative_id: int) -> Optional[InitiativeDashboard]:
         """Get comprehensive dashboard for an initiative"""
-        initiative = db.query(Initiative).filter(Initiative.id == initiative_id).first()
+        initiative = db.get(Initiative, initiative_id)
         if not initiative:
             return None
         
@@ -9,6 +9,7 @@ from app.models.governance import (
 )
 from app.models.initiative import Initiative
 from app.models.risk import Risk
+from app.core.database import insert_returning
 from app.schemas.governance import (
     GovernanceWorkflowCreate, GovernanceWorkflowUpdate,
     WorkflowStageCreate, WorkflowStageUpdate,
@@ -23,6 +24,21 @@ from app.schemas.governance import (
 class GovernanceService:
     """Service for managing governance workflows and compliance"""
 
+    @staticmethod
+    def initiative_agent_data(initiative: Initiative) -> Dict[str, Any]:
+        """Initiative fields passed to the governance AI agents"""
+        ai_type = initiative.ai_type
+        return {
+            "title": initiative.title,
+            "description": initiative.description,
+            "ai_type": ai_type.value if ai_type else None,
+            "strategic_domain": initiative.strategic_domain,
+            "business_function": initiative.business_function,
+            "business_objective": initiative.business_objective,
+            "data_sources": initiative.data_sources,
+            "technologies": initiative.technologies
+        }
+
     # ========================================================================
     # Governance Workflow Management
     # ========================================================================
@@ -209,7 +225,7 @@ class GovernanceService:
     @staticmethod
     def get_workflow(db: Session, workflow_id: int) -> Optional[GovernanceWorkflow]:
         """Get workflow by ID"""
-        return db.query(GovernanceWorkflow).filter(GovernanceWorkflow.id == workflow_id).first()
+        return db.get(GovernanceWorkflow, workflow_id)
 
     @staticmethod
     def get_workflow_by_initiative(db: Session, initiative_id: int) -> Optional[GovernanceWorkflow]:
@@ -221,11 +237,11 @@ class GovernanceService:
     @staticmethod
     def update_workflow(db: Session, workflow_id: int, workflow_update: GovernanceWorkflowUpdate) -> Optional[GovernanceWorkflow]:
         """Update workflow"""
-        workflow = db.query(GovernanceWorkflow).filter(GovernanceWorkflow.id == workflow_id).first()
+        workflow = db.get(GovernanceWorkflow, workflow_id)
         if not workflow:
             return None
 
-        update_data = workflow_update.dict(exclude_unset=True)
+        update_data = workflow_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(workflow, field, value)
 
@@ -248,16 +264,16 @@ class GovernanceService:
     @staticmethod
     def get_stage(db: Session, stage_id: int) -> Optional[WorkflowStage]:
         """Get stage by ID"""
-        return db.query(WorkflowStage).filter(WorkflowStage.id == stage_id).first()
+        return db.get(WorkflowStage, stage_id)
 
     @staticmethod
     def update_stage(db: Session, stage_id: int, stage_update: WorkflowStageUpdate) -> Optional[WorkflowStage]:
         """Update workflow stage"""
-        stage = db.query(WorkflowStage).filter(WorkflowStage.id == stage_id).first()
+        stage = db.get(WorkflowStage, stage_id)
         if not stage:
             return None
 
-        update_data = stage_update.dict(exclude_unset=True)
+        update_data = stage_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(stage, field, value)
 
@@ -272,13 +288,13 @@ class GovernanceService:
         Advance workflow to next stage if current stage is approved.
         Returns updated workflow or None if cannot advance.
         """
-        workflow = db.query(GovernanceWorkflow).filter(GovernanceWorkflow.id == workflow_id).first()
+        workflow = db.get(GovernanceWorkflow, workflow_id)
         if not workflow:
             return None
 
         # Get current stage
         if workflow.current_stage_id:
-            current_stage = db.query(WorkflowStage).filter(WorkflowStage.id == workflow.current_stage_id).first()
+            current_stage = db.get(WorkflowStage, workflow.current_stage_id)
             if not current_stage or current_stage.status != WorkflowStatus.APPROVED:
                 return None  # Cannot advance if current stage not approved
 
@@ -314,7 +330,7 @@ class GovernanceService:
     @staticmethod
     def create_approval(db: Session, approval_create: WorkflowApprovalCreate) -> WorkflowApproval:
         """Create approval record"""
-        approval = WorkflowApproval(**approval_create.dict())
+        approval = WorkflowApproval(**approval_create.model_dump())
         db.add(approval)
         db.commit()
         db.refresh(approval)
@@ -333,7 +349,7 @@ class GovernanceService:
         Submit approval decision. 
         IMPORTANT: This requires human decision - AI never auto-approves.
         """
-        approval = db.query(WorkflowApproval).filter(WorkflowApproval.id == approval_id).first()
+        approval = db.get(WorkflowApproval, approval_id)
         if not approval:
             return None
 
@@ -346,7 +362,7 @@ class GovernanceService:
             approval.decision_date = datetime.utcnow()
 
             # Update stage status based on decision
-            stage = db.query(WorkflowStage).filter(WorkflowStage.id == approval.stage_id).first()
+            stage = db.get(WorkflowStage, approval.stage_id)
             if stage:
                 if decision == ApprovalDecision.APPROVED or decision == ApprovalDecision.APPROVED_WITH_CONDITIONS:
                     stage.status = WorkflowStatus.APPROVED
@@ -373,11 +389,7 @@ class GovernanceService:
     @staticmethod
     def create_evidence(db: Session, evidence_create: EvidenceDocumentCreate) -> EvidenceDocument:
         """Create evidence document"""
-        evidence = EvidenceDocument(**evidence_create.dict())
-        db.add(evidence)
-        db.commit()
-        db.refresh(evidence)
-        return evidence
+        return insert_returning(db, EvidenceDocument, evidence_create.model_dump())
 
     @staticmethod
     def get_initiative_evidence(db: Session, initiative_id: int) -> List[EvidenceDocument]:
@@ -389,11 +401,11 @@ class GovernanceService:
     @staticmethod
     def update_evidence(db: Session, evidence_id: int, evidence_update: EvidenceDocumentUpdate) -> Optional[EvidenceDocument]:
         """Update evidence document"""
-        evidence = db.query(EvidenceDocument).filter(EvidenceDocument.id == evidence_id).first()
+        evidence = db.get(EvidenceDocument, evidence_id)
         if not evidence:
             return None
 
-        update_data = evidence_update.dict(exclude_unset=True)
+        update_data = evidence_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(evidence, field, value)
 
@@ -405,7 +417,7 @@ class GovernanceService:
     @staticmethod
     def delete_evidence(db: Session, evidence_id: int) -> bool:
         """Delete evidence document"""
-        evidence = db.query(EvidenceDocument).filter(EvidenceDocument.id == evidence_id).first()
+        evidence = db.get(EvidenceDocument, evidence_id)
         if not evidence:
             return False
 
@@ -420,11 +432,7 @@ class GovernanceService:
     @staticmethod
     def create_mitigation(db: Session, mitigation_create: RiskMitigationCreate) -> RiskMitigation:
         """Create risk mitigation control"""
-        mitigation = RiskMitigation(**mitigation_create.dict())
-        db.add(mitigation)
-        db.commit()
-        db.refresh(mitigation)
-        return mitigation
+        return insert_returning(db, RiskMitigation, mitigation_create.model_dump())
 
     @staticmethod
     def get_risk_mitigations(db: Session, risk_id: int) -> List[RiskMitigation]:
@@ -434,11 +442,11 @@ class GovernanceService:
     @staticmethod
     def update_mitigation(db: Session, mitigation_id: int, mitigation_update: RiskMitigationUpdate) -> Optional[RiskMitigation]:
         """Update risk mitigation"""
-        mitigation = db.query(RiskMitigation).filter(RiskMitigation.id == mitigation_id).first()
+        mitigation = db.get(RiskMitigation, mitigation_id)
         if not mitigation:
             return None
 
-        update_data = mitigation_update.dict(exclude_unset=True)
+        update_data = mitigation_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(mitigation, field, value)
 
@@ -454,11 +462,7 @@ class GovernanceService:
     @staticmethod
     def create_policy(db: Session, policy_create: PolicyCreate) -> Policy:
         """Create policy"""
-        policy = Policy(**policy_create.dict())
-        db.add(policy)
-        db.commit()
-        db.refresh(policy)
-        return policy
+        return insert_returning(db, Policy, policy_create.model_dump())
 
     @staticmethod
     def get_policies(db: Session, policy_type: Optional[str] = None, status: Optional[str] = None) -> List[Policy]:
@@ -475,16 +479,16 @@ class GovernanceService:
     @staticmethod
     def get_policy(db: Session, policy_id: int) -> Optional[Policy]:
         """Get policy by ID"""
-        return db.query(Policy).filter(Policy.id == policy_id).first()
+        return db.get(Policy, policy_id)
 
     @staticmethod
     def update_policy(db: Session, policy_id: int, policy_update: PolicyUpdate) -> Optional[Policy]:
         """Update policy"""
-        policy = db.query(Policy).filter(Policy.id == policy_id).first()
+        policy = db.get(Policy, policy_id)
         if not policy:
             return None
 
-        update_data = policy_update.dict(exclude_unset=True)
+        update_data = policy_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(policy, field, value)
 
@@ -496,7 +500,7 @@ class GovernanceService:
     @staticmethod
     def delete_policy(db: Session, policy_id: int) -> bool:
         """Delete policy"""
-        policy = db.query(Policy).filter(Policy.id == policy_id).first()
+        policy = db.get(Policy, policy_id)
         if not policy:
             return False
 
@@ -511,7 +515,7 @@ class GovernanceService:
     @staticmethod
     def create_compliance_requirement(db: Session, requirement_create: ComplianceRequirementCreate) -> ComplianceRequirement:
         """Create compliance requirement"""
-        requirement = ComplianceRequirement(**requirement_create.dict())
+        requirement = ComplianceRequirement(**requirement_create.model_dump())
         db.add(requirement)
         db.commit()
         db.refresh(requirement)
@@ -534,11 +538,11 @@ class GovernanceService:
         requirement_update: ComplianceRequirementUpdate
     ) -> Optional[ComplianceRequirement]:
         """Update compliance requirement"""
-        requirement = db.query(ComplianceRequirement).filter(ComplianceRequirement.id == requirement_id).first()
+        requirement = db.get(ComplianceRequirement, requirement_id)
         if not requirement:
             return None
 
-        update_data = requirement_update.dict(exclude_unset=True)
+        update_data = requirement_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(requirement, field, value)
 
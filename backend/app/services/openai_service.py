@@ -5,14 +5,40 @@ This service acts as a facade/orchestrator for all AI agents.
 It maintains backward compatibility while delegating to specialized agent classes.
 """
 
-from openai import OpenAI
 from app.core.config import settings
-from typing import Optional, Dict, Any, List
+from app.core.openai_client import get_openai_client
+from app.services.ai_cache import ai_response_cache
+from typing import Optional, Dict, Any, Iterator, List, Callable, Awaitable
 
 import logging
+import orjson
+import threading
+import tiktoken
+import time
 
 logger = logging.getLogger(__name__)
 
+# Share of the model context window that initiative lists may fill, leaving
+# headroom for the prompt template and the completion.
+CONTEXT_BUDGET_RATIO = 0.75
+# Initiatives serializing to more tokens than this get their long text
+# fields cut to MAX_TEXT_FIELD_CHARS.
+MAX_INITIATIVE_TOKENS = 400
+MAX_TEXT_FIELD_CHARS = 600
+TRUNCATED_FIELDS = ("description", "business_objective")
+
+# Context window sizes by model name prefix (most specific first)
+MODEL_CONTEXT_TOKENS = {
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4-1106": 128000,
+    "gpt-4-0125": 128000,
+    "gpt-4-32k": 32768,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+}
+DEFAULT_CONTEXT_TOKENS = 8192
+
 # Import all agents
 from app.agents import (
     IntakeAgent,
@@ -23,6 +49,104 @@ from app.agents import (
 )
 
 
+# Seconds to wait before retrying a tiktoken encoding that failed to load
+ENCODING_RETRY_SECONDS = 300
+
+# Loaded tiktoken encodings by model; failures are not stored, so a
+# transient download error is retried
+_token_encodings: Dict[str, tiktoken.Encoding] = {}
+# Model -> monotonic time its encoding load was last started
+_encoding_load_started: Dict[str, float] = {}
+_encoding_lock = threading.Lock()
+
+
+def _load_token_encoding(model: str) -> None:
+    """Load the tiktoken encoding for ``model`` (the BPE file is downloaded on first use)."""
+    try:
+        encoding_name = tiktoken.encoding_name_for_model(model)
+    except KeyError:
+        encoding_name = "cl100k_base"
+    try:
+        _token_encodings[model] = tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable for {model}, estimating token counts: {e}")
+
+
+def preload_token_encoding(model: str) -> None:
+    """
+    Start loading the encoding for ``model`` in a background thread.
+    
+    Does nothing if it is already loaded, or if a load was started less
+    than ENCODING_RETRY_SECONDS ago. Called at startup so requests never
+    wait for the download.
+    """
+    if model in _token_encodings:
+        return
+    with _encoding_lock:
+        started = _encoding_load_started.get(model)
+        if started is not None and time.monotonic() - started < ENCODING_RETRY_SECONDS:
+            return
+        _encoding_load_started[model] = time.monotonic()
+    threading.Thread(target=_load_token_encoding, args=(model,), name="tiktoken-load", daemon=True).start()
+
+
+def count_tokens(text: str, model: str) -> int:
+    """Count the tokens ``text`` takes up for ``model`` (estimated until its encoding is loaded)."""
+    encoding = _token_encodings.get(model)
+    if encoding is None:
+        preload_token_encoding(model)
+        return len(text) // 4 + 1
+    return len(encoding.encode(text))
+
+
+def fit_initiatives_to_context(
+    initiatives: List[Dict[str, Any]],
+    model: str,
+    rank_by: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Trim a list of initiative dicts so it fits the model's token budget.
+    
+    Initiatives are taken in order (highest ``rank_by`` first when given)
+    until CONTEXT_BUDGET_RATIO of the context window is used. Oversized
+    records have their long text fields truncated first. Token counts are
+    taken on ``str(record)``, which is how the agents embed the lists in
+    their prompts.
+    """
+    context_tokens = next(
+        (tokens for prefix, tokens in MODEL_CONTEXT_TOKENS.items() if model.startswith(prefix)),
+        DEFAULT_CONTEXT_TOKENS
+    )
+    budget = int(context_tokens * CONTEXT_BUDGET_RATIO)
+    
+    if rank_by:
+        initiatives = sorted(initiatives, key=lambda item: item.get(rank_by) or 0, reverse=True)
+    
+    fitted = []
+    used = 0
+    for initiative in initiatives:
+        tokens = count_tokens(str(initiative), model)
+        if tokens > MAX_INITIATIVE_TOKENS:
+            initiative = {
+                **initiative,
+                **{
+                    field: initiative[field][:MAX_TEXT_FIELD_CHARS] + "..."
+                    for field in TRUNCATED_FIELDS
+                    if isinstance(initiative.get(field), str) and len(initiative[field]) > MAX_TEXT_FIELD_CHARS
+                }
+            }
+            tokens = count_tokens(str(initiative), model)
+        if used + tokens > budget:
+            logger.info(
+                f"Token budget of {budget} reached, sending {len(fitted)} of {len(initiatives)} initiatives"
+            )
+            break
+        fitted.append(initiative)
+        used += tokens
+    
+    return fitted
+
+
 class OpenAIService:
     """
     Service for interacting with OpenAI API for AI-powered features.
@@ -39,7 +163,7 @@ class OpenAIService:
             "your-openai-api-key-here" not in settings.openai_api_key
         )
 
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        self.client = get_openai_client()
         self.model = settings.OPENAI_MODEL
 
         if not self.api_key_configured:
@@ -55,6 +179,16 @@ class OpenAIService:
         self.governance_agent = GovernanceAgent(self.client, self.model)
         self.executive_agent = ExecutiveAgent(self.client, self.model)
     
+    async def _memoized(
+        self,
+        name: str,
+        payload: Any,
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+        semantic: bool = False
+    ) -> Dict[str, Any]:
+        """Serve a deterministic agent call from the AI response cache (see app.services.ai_cache)."""
+        return await ai_response_cache.get_or_call(f"{name}:{self.model}", payload, call, semantic=semantic)
+    
     # ========================================================================
     # Legacy Methods (for backward compatibility)
     # ========================================================================
@@ -76,8 +210,7 @@ class OpenAIService:
             max_paragraphs=3
         )
         if result.get("success"):
-            import json
-            data = json.loads(result["data"])
+            data = orjson.loads(result["data"])
             return data.get("summary", "")
         return f"Error generating summary: {result.get('error', 'Unknown error')}"
     
@@ -97,7 +230,7 @@ class OpenAIService:
     # Module 1: Intake Agent Methods
     # ========================================================================
     
-    async def parse_unstructured_intake(self, text: str) -> Dict[str, Any]:
+    async def parse_unstructured_intake(self, text: str, user_id: Optional[int] = None) -> Dict[str, Any]:
         """Parse unstructured text into structured initiative data."""
         if not self.api_key_configured:
             return {
@@ -105,9 +238,11 @@ class OpenAIService:
                 "error": "OpenAI API key not configured. Set OPEN_API_KEY in backend/.env.",
                 "agent": "OpenAIService",
             }
-        return await self.intake_agent.parse_unstructured_intake(text)
+        return await self._memoized(
+            "parse_unstructured_intake", text, lambda: self.intake_agent.parse_unstructured_intake(text, user_id=user_id)
+        )
     
-    async def detect_missing_fields(self, initiative_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def detect_missing_fields(self, initiative_data: Dict[str, Any], user_id: Optional[int] = None) -> Dict[str, Any]:
         """Detect missing required fields and generate follow-up questions."""
         if not self.api_key_configured:
             return {
@@ -115,9 +250,11 @@ class OpenAIService:
                 "error": "OpenAI API key not configured. Set OPEN_API_KEY in backend/.env.",
                 "agent": "OpenAIService",
             }
-        return await self.intake_agent.detect_missing_fields(initiative_data)
+        return await self._memoized(
+            "detect_missing_fields", initiative_data, lambda: self.intake_agent.detect_missing_fields(initiative_data, user_id=user_id)
+        )
     
-    async def classify_use_case(self, initiative_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def classify_use_case(self, initiative_data: Dict[str, Any], user_id: Optional[int] = None) -> Dict[str, Any]:
         """Automatically classify the AI use case."""
         if not self.api_key_configured:
             return {
@@ -125,7 +262,9 @@ class OpenAIService:
                 "error": "OpenAI API key not configured. Set OPEN_API_KEY in backend/.env.",
                 "agent": "OpenAIService",
             }
-        return await self.intake_agent.classify_use_case(initiative_data)
+        return await self._memoized(
+            "classify_use_case", initiative_data, lambda: self.intake_agent.classify_use_case(initiative_data, user_id=user_id)
+        )
     
     async def find_similar_initiatives(
         self, 
@@ -139,6 +278,7 @@ class OpenAIService:
                 "error": "OpenAI API key not configured. Set OPEN_API_KEY in backend/.env.",
                 "agent": "OpenAIService",
             }
+        existing_initiatives = fit_initiatives_to_context(existing_initiatives, self.model)
         return await self.intake_agent.find_similar_initiatives(initiative_data, existing_initiatives)
     
     # ========================================================================
@@ -165,7 +305,9 @@ class OpenAIService:
     
     async def analyze_portfolio_balance(self, portfolio_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze portfolio balance and provide rebalancing recommendations."""
-        return await self.portfolio_analyst.analyze_portfolio_balance(portfolio_data)
+        return await self._memoized(
+            "analyze_portfolio_balance", portfolio_data, lambda: self.portfolio_analyst.analyze_portfolio_balance(portfolio_data)
+        )
     
     async def optimize_portfolio_scenario(
         self, 
@@ -173,6 +315,7 @@ class OpenAIService:
         constraints: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Optimize portfolio selection under constraints."""
+        initiatives = fit_initiatives_to_context(initiatives, self.model, rank_by="overall_score")
         return await self.portfolio_analyst.optimize_portfolio_scenario(initiatives, constraints)
     
     # ========================================================================
@@ -186,7 +329,12 @@ class OpenAIService:
         constraints: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Suggest optimal sequencing for initiatives."""
-        return await self.roadmap_agent.suggest_initiative_sequencing(initiatives, dependencies, constraints)
+        return await self._memoized(
+            "suggest_initiative_sequencing",
+            {"initiatives": initiatives, "dependencies": dependencies, "constraints": constraints},
+            lambda: self.roadmap_agent.suggest_initiative_sequencing(initiatives, dependencies, constraints),
+            semantic=True
+        )
     
     async def detect_roadmap_bottlenecks(
         self, 
@@ -195,7 +343,12 @@ class OpenAIService:
         dependencies: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Detect bottlenecks in the roadmap."""
-        return await self.roadmap_agent.detect_roadmap_bottlenecks(roadmap_data, resource_allocations, dependencies)
+        return await self._memoized(
+            "detect_roadmap_bottlenecks",
+            {"roadmap_data": roadmap_data, "resource_allocations": resource_allocations, "dependencies": dependencies},
+            lambda: self.roadmap_agent.detect_roadmap_bottlenecks(roadmap_data, resource_allocations, dependencies),
+            semantic=True
+        )
     
     async def validate_timeline_feasibility(
         self, 
@@ -204,7 +357,12 @@ class OpenAIService:
         historical_data: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """Validate if a proposed timeline is realistic."""
-        return await self.roadmap_agent.validate_timeline_feasibility(initiative_data, proposed_timeline, historical_data)
+        return await self._memoized(
+            "validate_timeline_feasibility",
+            {"initiative_data": initiative_data, "proposed_timeline": proposed_timeline, "historical_data": historical_data},
+            lambda: self.roadmap_agent.validate_timeline_feasibility(initiative_data, proposed_timeline, historical_data),
+            semantic=True
+        )
     
     async def recommend_dependency_resolution(
         self, 
@@ -213,7 +371,12 @@ class OpenAIService:
         initiative_b: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Recommend strategies to resolve or work around a dependency."""
-        return await self.roadmap_agent.recommend_dependency_resolution(dependency_data, initiative_a, initiative_b)
+        return await self._memoized(
+            "recommend_dependency_resolution",
+            {"dependency_data": dependency_data, "initiative_a": initiative_a, "initiative_b": initiative_b},
+            lambda: self.roadmap_agent.recommend_dependency_resolution(dependency_data, initiative_a, initiative_b),
+            semantic=True
+        )
     
     # ========================================================================
     # Module 4: Governance Agent Methods
@@ -286,6 +449,39 @@ class OpenAIService:
             }
         return await self.governance_agent.generate_model_card(initiative_data, model_details)
     
+    def _require_api_key(self) -> None:
+        """Raise if the OpenAI API key is not configured (used by streaming methods)."""
+        if not self.api_key_configured:
+            raise RuntimeError("OpenAI API key not configured. Set OPEN_API_KEY in backend/.env.")
+    
+    def stream_compliance_completeness(
+        self, 
+        initiative_data: Dict[str, Any],
+        evidence_documents: List[Dict[str, Any]],
+        risk_tier: str
+    ) -> Iterator[str]:
+        """Stream the compliance completeness assessment as raw JSON text chunks."""
+        self._require_api_key()
+        return self.governance_agent.stream_compliance_completeness(initiative_data, evidence_documents, risk_tier)
+    
+    def stream_risk_statement(
+        self, 
+        risk_data: Dict[str, Any],
+        initiative_data: Dict[str, Any]
+    ) -> Iterator[str]:
+        """Stream drafted risk statements as raw JSON text chunks."""
+        self._require_api_key()
+        return self.governance_agent.stream_risk_statement(risk_data, initiative_data)
+    
+    def stream_model_card(
+        self, 
+        initiative_data: Dict[str, Any],
+        model_details: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """Stream a model card template as raw JSON text chunks."""
+        self._require_api_key()
+        return self.governance_agent.stream_model_card(initiative_data, model_details)
+    
     # ========================================================================
     # Module 6: Executive Agent Methods
     # ========================================================================
@@ -299,7 +495,32 @@ class OpenAIService:
         tone: str = "professional"
     ) -> Dict[str, Any]:
         """Generate narrative with charts for board/executive reporting."""
-        return await self.executive_agent.generate_executive_narrative(
+        return await self._memoized(
+            "generate_executive_narrative",
+            {
+                "portfolio_data": portfolio_data,
+                "report_type": report_type,
+                "audience": audience,
+                "include_charts": include_charts,
+                "tone": tone
+            },
+            lambda: self.executive_agent.generate_executive_narrative(
+                portfolio_data, report_type, audience, include_charts, tone
+            ),
+            semantic=True
+        )
+    
+    def stream_executive_narrative(
+        self,
+        portfolio_data: Dict[str, Any],
+        report_type: str,
+        audience: str = "board",
+        include_charts: bool = True,
+        tone: str = "professional"
+    ) -> Iterator[str]:
+        """Stream an executive narrative as raw JSON text chunks."""
+        self._require_api_key()
+        return self.executive_agent.stream_executive_narrative(
             portfolio_data, report_type, audience, include_charts, tone
         )
     
@@ -310,7 +531,12 @@ class OpenAIService:
         constraints: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Explain portfolio trade-offs and decision rationale."""
-        return await self.executive_agent.explain_trade_offs(decision_context, alternatives, constraints)
+        return await self._memoized(
+            "explain_trade_offs",
+            {"decision_context": decision_context, "alternatives": alternatives, "constraints": constraints},
+            lambda: self.executive_agent.explain_trade_offs(decision_context, alternatives, constraints),
+            semantic=True
+        )
     
     async def prepare_talking_points(
         self,
@@ -319,7 +545,12 @@ class OpenAIService:
         max_points: int = 10
     ) -> Dict[str, Any]:
         """Generate talking points for presentations."""
-        return await self.executive_agent.prepare_talking_points(report_data, audience, max_points)
+        return await self._memoized(
+            "prepare_talking_points",
+            {"report_data": report_data, "audience": audience, "max_points": max_points},
+            lambda: self.executive_agent.prepare_talking_points(report_data, audience, max_points),
+            semantic=True
+        )
     
     async def generate_board_summary(
         self,
@@ -329,8 +560,18 @@ class OpenAIService:
         max_paragraphs: int = 3
     ) -> Dict[str, Any]:
         """Generate board-level summary (2-3 paragraphs)."""
-        return await self.executive_agent.generate_board_summary(
-            portfolio_data, period_start, period_end, max_paragraphs
+        return await self._memoized(
+            "generate_board_summary",
+            {
+                "portfolio_data": portfolio_data,
+                "period_start": period_start,
+                "period_end": period_end,
+                "max_paragraphs": max_paragraphs
+            },
+            lambda: self.executive_agent.generate_board_summary(
+                portfolio_data, period_start, period_end, max_paragraphs
+            ),
+            semantic=True
         )
     
     async def generate_strategic_recommendations(
@@ -340,7 +581,12 @@ class OpenAIService:
         gaps: List[str]
     ) -> Dict[str, Any]:
         """Generate strategic recommendations based on portfolio analysis."""
-        return await self.executive_agent.generate_strategic_recommendations(portfolio_analysis, trends, gaps)
+        return await self._memoized(
+            "generate_strategic_recommendations",
+            {"portfolio_analysis": portfolio_analysis, "trends": trends, "gaps": gaps},
+            lambda: self.executive_agent.generate_strategic_recommendations(portfolio_analysis, trends, gaps),
+            semantic=True
+        )
 
 
 # Singleton instance
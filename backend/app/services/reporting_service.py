@@ -1,12 +1,15 @@
 """
 Service layer for Module 6 - CAIO & Board Reporting
 """
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import func, and_, or_
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
-import json
+import asyncio
+import logging
 
+from app.core.cache import TTLCache, invalidate_on_write
+from app.core.database import run_in_new_session, safe_query
 from app.models.reporting import (
     ExecutiveDashboard, BoardReport, StrategyBrief, QuarterlyReport,
     ReportingMetric, NarrativeTemplate, ReportSchedule,
@@ -15,12 +18,33 @@ from app.models.reporting import (
 from app.models.initiative import Initiative
 from app.models.benefits import BenefitRealization, ValueLeakage, KPIBaseline
 from app.models.risk import Risk
-from app.models.governance import GovernanceWorkflow, WorkflowStage
+from app.models.governance import GovernanceWorkflow, WorkflowStage, RiskMitigation
 from app.schemas.reporting import (
     ValuePipelineData, DeliveredValueData, RiskExposureData,
     StageDistributionData, BottleneckData, PortfolioHealthData
 )
 
+logger = logging.getLogger(__name__)
+
+# Computed dashboard data keyed by dashboard name. Dashboards aggregate the
+# whole portfolio and are not user-specific. A background task recomputes
+# every dashboard each DASHBOARD_REFRESH_SECONDS, and committing changes to
+# any model they read clears the cache so the next request recomputes.
+DASHBOARD_REFRESH_SECONDS = 60
+dashboard_cache = TTLCache(ttl_seconds=2 * DASHBOARD_REFRESH_SECONDS, maxsize=32)
+
+# Serialized board report pages and details for the report endpoints.
+# Cleared whenever board reports are written, so the TTL only bounds how
+# stale other worker processes can be.
+REPORT_CACHE_SECONDS = 300
+report_cache = TTLCache(ttl_seconds=REPORT_CACHE_SECONDS, maxsize=256)
+
+invalidate_on_write(
+    dashboard_cache,
+    Initiative, BenefitRealization, ValueLeakage, Risk, RiskMitigation, GovernanceWorkflow, WorkflowStage
+)
+invalidate_on_write(report_cache, BoardReport)
+
 
 class ReportingService:
     """Service for reporting and dashboard operations"""
@@ -34,7 +58,7 @@ class ReportingService:
         """Calculate value pipeline dashboard data"""
         
         # Get all initiatives with expected ROI
-        initiatives = db.query(Initiative).filter(
+        initiatives = safe_query(db, Initiative).filter(
             Initiative.expected_roi.isnot(None)
         ).all()
         
@@ -105,7 +129,7 @@ class ReportingService:
         """Calculate delivered value dashboard data"""
         
         # Get all benefit realizations
-        benefits = db.query(BenefitRealization).all()
+        benefits = safe_query(db, BenefitRealization).all()
         
         # Total delivered value
         total_delivered = sum(b.realized_value or 0 for b in benefits)
@@ -122,7 +146,7 @@ class ReportingService:
         
         # By initiative
         by_initiative = []
-        initiatives = db.query(Initiative).all()
+        initiatives = safe_query(db, Initiative).all()
         for init in initiatives:
             init_benefits = [b for b in benefits if b.initiative_id == init.id]
             if init_benefits:
@@ -147,7 +171,7 @@ class ReportingService:
         }
         
         # Value leakage summary
-        leakages = db.query(ValueLeakage).all()
+        leakages = safe_query(db, ValueLeakage).all()
         value_leakage_summary = {
             "total_leakages": len(leakages),
             "total_impact": sum(l.estimated_impact or 0 for l in leakages),
@@ -172,8 +196,8 @@ class ReportingService:
     def calculate_risk_exposure(db: Session) -> RiskExposureData:
         """Calculate risk exposure dashboard data"""
         
-        # Get all risks
-        risks = db.query(Risk).all()
+        # Get all risks (mitigations are needed for the coverage figure)
+        risks = safe_query(db, Risk, selectinload(Risk.mitigations)).all()
         
         # Total risk score
         total_risk_score = sum(r.likelihood * r.impact for r in risks)
@@ -195,7 +219,7 @@ class ReportingService:
         
         # High risk initiatives
         high_risk_initiatives = []
-        initiatives = db.query(Initiative).all()
+        initiatives = safe_query(db, Initiative).all()
         for init in initiatives:
             init_risks = [r for r in risks if r.initiative_id == init.id]
             high_risks = [r for r in init_risks if r.severity.value in ["critical", "high"]]
@@ -232,7 +256,7 @@ class ReportingService:
         """Calculate stage distribution dashboard data"""
         
         # Get all initiatives
-        initiatives = db.query(Initiative).all()
+        initiatives = safe_query(db, Initiative).all()
         
         # By stage (status removed)
         by_stage = {}
@@ -299,7 +323,7 @@ class ReportingService:
         
         # Dependency bottlenecks
         dependency_bottlenecks = []
-        initiatives = db.query(Initiative).all()
+        initiatives = safe_query(db, Initiative).all()
         # Would analyze initiative dependencies here
         
         # Approval bottlenecks (pending approvals > 30 days)
@@ -343,14 +367,14 @@ class ReportingService:
         """Calculate overall portfolio health"""
         
         # Get all initiatives
-        initiatives = db.query(Initiative).all()
+        initiatives = safe_query(db, Initiative).all()
         active_initiatives = initiatives
         
         # Total budget
         total_budget = sum(i.budget_allocated or 0 for i in initiatives)
         
         # Total value delivered
-        benefits = db.query(BenefitRealization).all()
+        benefits = safe_query(db, BenefitRealization).all()
         total_value_delivered = sum(b.realized_value or 0 for b in benefits)
         
         # Average ROI
@@ -361,7 +385,7 @@ class ReportingService:
         )
         
         # Risk score
-        risks = db.query(Risk).all()
+        risks = safe_query(db, Risk).all()
         risk_score = sum(r.likelihood * r.impact for r in risks) / len(risks) if risks else 0
         
         # Compliance score (mock - would calculate from governance data)
@@ -411,17 +435,17 @@ class ReportingService:
         """Generate board-ready slides"""
         
         # Gather data
-        portfolio_health = ReportingService.calculate_portfolio_health(db)
-        value_pipeline = ReportingService.calculate_value_pipeline(db)
-        delivered_value = ReportingService.calculate_delivered_value(db)
-        risk_exposure = ReportingService.calculate_risk_exposure(db)
+        portfolio_health = cached_dashboard("portfolio_health", db)
+        value_pipeline = cached_dashboard("value_pipeline", db)
+        delivered_value = cached_dashboard("delivered_value", db)
+        risk_exposure = cached_dashboard("risk_exposure", db)
         
         # Create report data structure
         report_data = {
-            "portfolio_health": portfolio_health.dict(),
-            "value_pipeline": value_pipeline.dict(),
-            "delivered_value": delivered_value.dict(),
-            "risk_exposure": risk_exposure.dict()
+            "portfolio_health": portfolio_health.model_dump(),
+            "value_pipeline": value_pipeline.model_dump(),
+            "delivered_value": delivered_value.model_dump(),
+            "risk_exposure": risk_exposure.model_dump()
         }
         
         # Create key metrics
@@ -463,7 +487,7 @@ class ReportingService:
         """Generate one-page AI strategy brief"""
         
         # Calculate portfolio health
-        portfolio_health = ReportingService.calculate_portfolio_health(db)
+        portfolio_health = cached_dashboard("portfolio_health", db)
         
         # Get top achievements (mock)
         top_achievements = [
@@ -473,7 +497,7 @@ class ReportingService:
         ]
         
         # Get top risks
-        risk_data = ReportingService.calculate_risk_exposure(db)
+        risk_data = cached_dashboard("risk_exposure", db)
         top_risks = [
             f"{init['title']}: {init['risk_count']} high risks"
             for init in risk_data.high_risk_initiatives[:3]
@@ -527,9 +551,9 @@ class ReportingService:
         """Generate quarterly AI impact report"""
         
         # Calculate metrics
-        portfolio_health = ReportingService.calculate_portfolio_health(db)
-        value_data = ReportingService.calculate_delivered_value(db)
-        risk_data = ReportingService.calculate_risk_exposure(db)
+        portfolio_health = cached_dashboard("portfolio_health", db)
+        value_data = cached_dashboard("delivered_value", db)
+        risk_data = cached_dashboard("risk_exposure", db)
         
         # Create report sections
         portfolio_performance = {
@@ -584,3 +608,41 @@ class ReportingService:
 
 # Singleton instance
 reporting_service = ReportingService()
+
+DASHBOARD_CALCULATIONS = {
+    "value_pipeline": ReportingService.calculate_value_pipeline,
+    "delivered_value": ReportingService.calculate_delivered_value,
+    "risk_exposure": ReportingService.calculate_risk_exposure,
+    "stage_distribution": ReportingService.calculate_stage_distribution,
+    "bottlenecks": ReportingService.identify_bottlenecks,
+    "portfolio_health": ReportingService.calculate_portfolio_health,
+}
+
+
+def cached_dashboard(name: str, db: Session):
+    """Return cached dashboard data, calculating and caching it on a miss."""
+    data = dashboard_cache.get(name)
+    if data is None:
+        generation = dashboard_cache.generation
+        data = DASHBOARD_CALCULATIONS[name](db)
+        dashboard_cache.set(name, data, generation)
+    return data
+
+
+def refresh_dashboard_cache(db: Session) -> None:
+    """Recompute every dashboard and store the results in dashboard_cache."""
+    for name, calculate in DASHBOARD_CALCULATIONS.items():
+        # A write committed while calculating clears the cache; keep that
+        # invalidation rather than storing a result that may predate it
+        generation = dashboard_cache.generation
+        dashboard_cache.set(name, calculate(db), generation)
+
+
+async def refresh_dashboards_periodically() -> None:
+    """Keep dashboard_cache warm; runs for the lifetime of the app."""
+    while True:
+        try:
+            await asyncio.to_thread(run_in_new_session, refresh_dashboard_cache)
+        except Exception as e:
+            logger.warning(f"Dashboard refresh failed: {e}", exc_info=True)
+        await asyncio.sleep(DASHBOARD_REFRESH_SECONDS)
@@ -3,8 +3,8 @@ Roadmap Service for Module 3
 Handles roadmap timeline management, dependency resolution, and capacity planning
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
-from typing import List, Dict, Any, Optional
+from sqlalchemy import String, and_, cast, func, or_, select
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
 
@@ -29,7 +29,7 @@ class RoadmapService:
     def create_roadmap_timeline(db: Session, roadmap: RoadmapTimelineCreate, user_id: int) -> RoadmapTimeline:
         """Create a new roadmap timeline"""
         db_roadmap = RoadmapTimeline(
-            **roadmap.dict(),
+            **roadmap.model_dump(),
             created_by=user_id
         )
         db.add(db_roadmap)
@@ -43,9 +43,19 @@ class RoadmapService:
         return db.query(RoadmapTimeline).filter(RoadmapTimeline.id == roadmap_id).first()
     
     @staticmethod
-    def get_all_roadmap_timelines(db: Session, skip: int = 0, limit: int = 100) -> List[RoadmapTimeline]:
-        """Get all roadmap timelines"""
-        return db.query(RoadmapTimeline).offset(skip).limit(limit).all()
+    def get_all_roadmap_timelines(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
+    ) -> Tuple[List[RoadmapTimeline], bool]:
+        """Get a page of roadmap timelines in id order, and whether more follow"""
+        query = db.query(RoadmapTimeline)
+        if after_id is not None:
+            query = query.filter(RoadmapTimeline.id > after_id)
+        # Fetch one extra row to detect a next page instead of counting
+        rows = query.order_by(RoadmapTimeline.id).offset(skip).limit(limit + 1).all()
+        return rows[:limit], len(rows) > limit
     
     @staticmethod
     def update_roadmap_timeline(db: Session, roadmap_id: int, roadmap: RoadmapTimelineUpdate) -> Optional[RoadmapTimeline]:
@@ -54,7 +64,7 @@ class RoadmapService:
         if not db_roadmap:
             return None
         
-        update_data = roadmap.dict(exclude_unset=True)
+        update_data = roadmap.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_roadmap, field, value)
         
@@ -82,7 +92,7 @@ class RoadmapService:
             raise ValueError("Creating this dependency would create a circular dependency")
         
         db_dependency = InitiativeDependency(
-            **dependency.dict(),
+            **dependency.model_dump(),
             created_by=user_id
         )
         db.add(db_dependency)
@@ -111,7 +121,7 @@ class RoadmapService:
         if not db_dependency:
             return None
         
-        update_data = dependency.dict(exclude_unset=True)
+        update_data = dependency.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_dependency, field, value)
         
@@ -211,6 +221,22 @@ class RoadmapService:
             "circular_dependencies": circular_deps
         }
     
+    @staticmethod
+    def get_dependency_edges_as_dicts(db: Session, roadmap_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Dependency edges as plain dicts, shaped by the database in one query"""
+        query = select(
+            InitiativeDependency.initiative_id.label("from_initiative_id"),
+            InitiativeDependency.depends_on_id.label("to_initiative_id"),
+            # Enum columns store the member name; every DependencyType value is its lowercased name
+            func.lower(cast(InitiativeDependency.dependency_type, String)).label("dependency_type"),
+            InitiativeDependency.is_blocking
+        )
+        if roadmap_id:
+            query = query.where(InitiativeDependency.initiative_id.in_(
+                select(Initiative.id).where(Initiative.roadmap_timeline_id == roadmap_id)
+            ))
+        return [dict(row) for row in db.execute(query).mappings()]
+    
     @staticmethod
     def _find_critical_path(initiatives: List[Initiative], dependencies: List[InitiativeDependency]) -> List[int]:
         """Find the critical path through the dependency graph"""
@@ -288,7 +314,7 @@ class RoadmapService:
     def create_resource_allocation(db: Session, allocation: ResourceAllocationCreate, user_id: int) -> ResourceAllocation:
         """Create a new resource allocation"""
         db_allocation = ResourceAllocation(
-            **allocation.dict(),
+            **allocation.model_dump(),
             created_by=user_id
         )
         db.add(db_allocation)
@@ -304,6 +330,22 @@ class RoadmapService:
             query = query.filter(ResourceAllocation.initiative_id == initiative_id)
         return query.all()
     
+    @staticmethod
+    def get_allocations_as_dicts(db: Session, initiative_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Resource allocations as plain dicts (dates as text), shaped by the database in one query"""
+        query = select(
+            ResourceAllocation.id,
+            ResourceAllocation.initiative_id,
+            ResourceAllocation.resource_type,
+            ResourceAllocation.resource_name,
+            ResourceAllocation.allocated_amount,
+            cast(ResourceAllocation.start_date, String).label("start_date"),
+            cast(ResourceAllocation.end_date, String).label("end_date")
+        )
+        if initiative_id:
+            query = query.where(ResourceAllocation.initiative_id == initiative_id)
+        return [dict(row) for row in db.execute(query).mappings()]
+    
     @staticmethod
     def update_resource_allocation(db: Session, allocation_id: int, allocation: ResourceAllocationUpdate) -> Optional[ResourceAllocation]:
         """Update a resource allocation"""
@@ -311,7 +353,7 @@ class RoadmapService:
         if not db_allocation:
             return None
         
-        update_data = allocation.dict(exclude_unset=True)
+        update_data = allocation.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_allocation, field, value)
         
@@ -372,7 +414,7 @@ class RoadmapService:
     @staticmethod
     def create_stage_gate(db: Session, stage_gate: StageGateCreate) -> StageGate:
         """Create a new stage gate"""
-        db_stage_gate = StageGate(**stage_gate.dict())
+        db_stage_gate = StageGate(**stage_gate.model_dump())
         db.add(db_stage_gate)
         db.commit()
         db.refresh(db_stage_gate)
@@ -392,7 +434,7 @@ class RoadmapService:
         if not db_stage_gate:
             return None
         
-        update_data = stage_gate.dict(exclude_unset=True)
+        update_data = stage_gate.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_stage_gate, field, value)
         
@@ -1,31 +1,82 @@
-from sqlalchemy.orm import Session
-from typing import Dict, Any, List, Optional
+from sqlalchemy import func, insert, inspect, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
+from typing import Dict, Any, AsyncIterator, List, Mapping, Optional
 from app.models.scoring import (
     ScoringModelVersion, ScoringDimension, ScoringCriteria, 
     InitiativeScore, DimensionType
 )
+from app.core.cache import TTLCache, invalidate_on_write
+from app.core.database import AsyncSessionLocal, safe_select
 from app.models.initiative import Initiative
+from app.schemas.scoring import (
+    InitiativeScore as InitiativeScoreSchema,
+    ScoringCriteria as ScoringCriteriaSchema,
+    ScoringDimension as ScoringDimensionSchema,
+    ScoringModelVersion as ScoringModelVersionSchema
+)
 from app.services.openai_service import openai_service
-import json
+import asyncio
+import orjson
 from datetime import datetime
 
+# The active scoring model; usable with sync and async sessions alike
+ACTIVE_SCORING_MODEL = select(ScoringModelVersion).where(ScoringModelVersion.is_active == True)
+
+# Eager-load a model's dimensions and their criteria. Async sessions cannot
+# lazy-load, and scoring and the model schemas read both levels.
+WITH_DIMENSIONS = selectinload(ScoringModelVersion.dimensions).selectinload(ScoringDimension.criteria)
+
+# The active model with its dimensions and criteria, read on every score
+# calculation. Cleared when scoring models are written, so the TTL only
+# bounds how stale other worker processes can be.
+ACTIVE_MODEL_CACHE_SECONDS = 30
+active_model_cache = TTLCache(ttl_seconds=ACTIVE_MODEL_CACHE_SECONDS, maxsize=1)
+invalidate_on_write(active_model_cache, ScoringModelVersion, ScoringDimension, ScoringCriteria)
+
+# Initiatives scored at once by calculate_all_scores; each holds a database
+# connection (of the async engine's pool of 20 + 40) and an AI request
+SCORE_CONCURRENCY = 8
+
+# Score history rows fetched (and held in memory) at a time while streaming
+SCORE_HISTORY_BATCH_SIZE = 100
+
+# Whether initiative_scores has its unique (initiative_id, model_version_id)
+# index, which score upserts rely on. Checked once per process; databases
+# created before the index get it from
+# app.core.migrations.add_initiative_scores_unique_index
+_unique_score_index: Optional[bool] = None
+
 
 class ScoringService:
     """Service for calculating initiative scores and managing scoring models."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def get_active_scoring_model(self) -> Optional[ScoringModelVersion]:
-        """Get the currently active scoring model."""
-        return self.db.query(ScoringModelVersion).filter(
-            ScoringModelVersion.is_active == True
-        ).first()
+    async def get_active_scoring_model(self) -> Optional[ScoringModelVersionSchema]:
+        """
+        Get the currently active scoring model with its dimensions and criteria.
+        
+        Returns a validated schema rather than an ORM object so one cached
+        copy can be shared by requests on different sessions.
+        """
+        model = active_model_cache.get("active")
+        if model is None:
+            active = (await self.db.scalars(ACTIVE_SCORING_MODEL.options(WITH_DIMENSIONS, raiseload("*")))).first()
+            if not active:
+                return None
+            model = ScoringModelVersionSchema.model_validate(active)
+            active_model_cache.set("active", model)
+        return model
     
     def calculate_dimension_score(
         self, 
         initiative: Initiative, 
-        dimension: ScoringDimension,
+        dimension: ScoringDimensionSchema,
         ai_insights: Optional[Dict[str, Any]] = None
     ) -> float:
         """
@@ -60,7 +111,7 @@ class ScoringService:
     def _calculate_criteria_score(
         self, 
         initiative: Initiative, 
-        criteria: ScoringCriteria,
+        criteria: ScoringCriteriaSchema,
         ai_insights: Optional[Dict[str, Any]] = None
     ) -> float:
         """Calculate score for a specific criteria."""
@@ -96,7 +147,8 @@ class ScoringService:
         initiative_id: int,
         user_id: int,
         use_ai: bool = True,
-        manual_scores: Optional[Dict[str, float]] = None
+        manual_scores: Optional[Dict[str, float]] = None,
+        update_rankings: bool = True
     ) -> InitiativeScore:
         """
         Calculate comprehensive score for an initiative.
@@ -106,17 +158,19 @@ class ScoringService:
             user_id: ID of the user performing calculation
             use_ai: Whether to use AI for scoring assistance
             manual_scores: Optional manual score overrides
+            update_rankings: Re-rank all scores under the model afterwards
+                (batch callers rank once at the end instead)
             
         Returns:
             InitiativeScore object
         """
         # Get initiative
-        initiative = self.db.query(Initiative).filter(Initiative.id == initiative_id).first()
+        initiative = await self.db.get(Initiative, initiative_id, options=[raiseload("*")])
         if not initiative:
             raise ValueError(f"Initiative {initiative_id} not found")
         
         # Get active scoring model
-        model = self.get_active_scoring_model()
+        model = await self.get_active_scoring_model()
         if not model:
             raise ValueError("No active scoring model found")
         
@@ -131,7 +185,7 @@ class ScoringService:
         if use_ai:
             ai_result = await self._get_ai_scoring_insights(initiative, model)
             if ai_result.get("success"):
-                data = json.loads(ai_result["data"])
+                data = orjson.loads(ai_result["data"])
                 ai_insights = data.get("scores", {})
                 ai_justification = data.get("justification", "")
                 strengths = data.get("strengths", [])
@@ -172,61 +226,114 @@ class ScoringService:
         overall_score = round(overall_score, 2)
         
         # Create or update score record
-        existing_score = self.db.query(InitiativeScore).filter(
-            InitiativeScore.initiative_id == initiative_id,
-            InitiativeScore.model_version_id == model.id
-        ).first()
-        
-        if existing_score:
-            # Update existing
-            existing_score.overall_score = overall_score
-            existing_score.value_score = dimension_scores.get("value", 0.0)
-            existing_score.feasibility_score = dimension_scores.get("feasibility", 0.0)
-            existing_score.risk_score = dimension_scores.get("risk", 0.0)
-            existing_score.strategic_alignment_score = dimension_scores.get("strategic_alignment", 0.0)
-            existing_score.criteria_scores = criteria_scores
-            existing_score.score_justification = ai_justification
-            existing_score.strengths = strengths
-            existing_score.weaknesses = weaknesses
-            existing_score.recommendations = recommendations
-            existing_score.confidence_score = confidence
-            existing_score.calculation_method = "ai" if use_ai else "manual"
-            existing_score.calculated_at = datetime.utcnow()
-            existing_score.calculated_by_id = user_id
-            score_record = existing_score
-        else:
-            # Create new
-            score_record = InitiativeScore(
-                initiative_id=initiative_id,
-                model_version_id=model.id,
-                overall_score=overall_score,
-                value_score=dimension_scores.get("value", 0.0),
-                feasibility_score=dimension_scores.get("feasibility", 0.0),
-                risk_score=dimension_scores.get("risk", 0.0),
-                strategic_alignment_score=dimension_scores.get("strategic_alignment", 0.0),
-                criteria_scores=criteria_scores,
-                score_justification=ai_justification,
-                strengths=strengths,
-                weaknesses=weaknesses,
-                recommendations=recommendations,
-                confidence_score=confidence,
-                calculation_method="ai" if use_ai else "manual",
-                calculated_by_id=user_id
-            )
-            self.db.add(score_record)
-        
-        self.db.commit()
-        self.db.refresh(score_record)
-        
-        # Update rankings
-        self._update_rankings(model.id)
+        score_record = await self._upsert_score({
+            "initiative_id": initiative_id,
+            "model_version_id": model.id,
+            "overall_score": overall_score,
+            "value_score": dimension_scores.get("value", 0.0),
+            "feasibility_score": dimension_scores.get("feasibility", 0.0),
+            "risk_score": dimension_scores.get("risk", 0.0),
+            "strategic_alignment_score": dimension_scores.get("strategic_alignment", 0.0),
+            "criteria_scores": criteria_scores,
+            "score_justification": ai_justification,
+            "strengths": strengths,
+            "weaknesses": weaknesses,
+            "recommendations": recommendations,
+            "confidence_score": confidence,
+            "calculation_method": "ai" if use_ai else "manual",
+            "calculated_at": datetime.utcnow(),
+            "calculated_by_id": user_id
+        })
+        
+        if not update_rankings:
+            await self.db.commit()
+            return score_record
+        
+        # Update rankings (committed together with the score)
+        await self._update_rankings(model.id)
         
         return score_record
     
+    async def _upsert_score(self, values: Dict[str, Any]) -> InitiativeScore:
+        """
+        Insert an initiative's score for a model version, or overwrite the
+        existing one, in a single statement keyed on the unique
+        (initiative_id, model_version_id) index. Concurrent calculations of
+        the same initiative cannot race into a duplicate-key error. Without
+        the index (a database not yet migrated) it falls back to
+        ``_write_score``.
+        """
+        keys = ("initiative_id", "model_version_id")
+        updated = [column for column in values if column not in keys]
+        
+        if not await self._has_unique_score_index():
+            return await self._write_score(values, updated)
+        
+        # The update side refers back to the row being inserted rather than
+        # binding every value (JSON columns included) a second time
+        if self.db.get_bind().dialect.name == "mysql":
+            # MySQL has no RETURNING; read the row back after the upsert
+            stmt = mysql_insert(InitiativeScore).values(**values)
+            await self.db.execute(stmt.on_duplicate_key_update(
+                {column: stmt.inserted[column] for column in updated}
+            ))
+            return (await self.db.scalars(
+                safe_select(InitiativeScore).where(
+                    InitiativeScore.initiative_id == values["initiative_id"],
+                    InitiativeScore.model_version_id == values["model_version_id"]
+                ),
+                execution_options={"populate_existing": True}
+            )).one()
+        
+        dialect_insert = sqlite_insert if self.db.get_bind().dialect.name == "sqlite" else postgresql_insert
+        stmt = dialect_insert(InitiativeScore).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={column: stmt.excluded[column] for column in updated}
+        ).returning(InitiativeScore)
+        return (await self.db.scalars(stmt, execution_options={"populate_existing": True})).one()
+    
+    async def _has_unique_score_index(self) -> bool:
+        global _unique_score_index
+        if _unique_score_index is None:
+            indexes = await self.db.run_sync(
+                lambda session: inspect(session.connection()).get_indexes("initiative_scores")
+            )
+            _unique_score_index = any(
+                index["unique"] and index["column_names"] == ["initiative_id", "model_version_id"]
+                for index in indexes
+            )
+        return _unique_score_index
+    
+    async def _write_score(self, values: Dict[str, Any], updated: List[str]) -> InitiativeScore:
+        """
+        Select-then-write fallback for ``_upsert_score`` on databases without
+        the unique index. Updates the latest existing score, if any.
+        """
+        score_id = await self.db.scalar(
+            select(InitiativeScore.id).where(
+                InitiativeScore.initiative_id == values["initiative_id"],
+                InitiativeScore.model_version_id == values["model_version_id"]
+            ).order_by(InitiativeScore.id.desc()).limit(1)
+        )
+        if score_id is None:
+            result = await self.db.execute(insert(InitiativeScore).values(**values))
+            score_id = result.inserted_primary_key[0]
+        else:
+            await self.db.execute(
+                update(InitiativeScore)
+                .where(InitiativeScore.id == score_id)
+                .values({column: values[column] for column in updated})
+            )
+        return (await self.db.scalars(
+            safe_select(InitiativeScore).where(InitiativeScore.id == score_id),
+            execution_options={"populate_existing": True}
+        )).one()
+    
     async def _get_ai_scoring_insights(
         self, 
         initiative: Initiative, 
-        model: ScoringModelVersion
+        model: ScoringModelVersionSchema
     ) -> Dict[str, Any]:
         """Get AI-powered scoring insights for an initiative."""
         initiative_data = {
@@ -267,75 +374,105 @@ class ScoringService:
             dimensions_info
         )
     
-    def _update_rankings(self, model_version_id: int):
-        """Update priority rankings for all initiatives using this model."""
-        scores = self.db.query(InitiativeScore).filter(
+    async def _update_rankings(self, model_version_id: int) -> Dict[int, int]:
+        """Update priority rankings for all initiatives using this model; returns initiative id -> rank."""
+        scores = (await self.db.scalars(safe_select(InitiativeScore).where(
             InitiativeScore.model_version_id == model_version_id
-        ).order_by(InitiativeScore.overall_score.desc()).all()
+        ).order_by(InitiativeScore.overall_score.desc(), InitiativeScore.id))).all()
         
         for rank, score in enumerate(scores, start=1):
             score.priority_rank = rank
         
-        self.db.commit()
+        await self.db.commit()
+        return {score.initiative_id: score.priority_rank for score in scores}
     
     async def calculate_all_scores(self, user_id: int, use_ai: bool = True):
-        """Recalculate scores for all initiatives."""
-        initiatives = self.db.query(Initiative).all()
-        results = []
+        """
+        Recalculate scores for all initiatives.
         
-        for initiative in initiatives:
-            try:
-                score = await self.calculate_initiative_score(
-                    initiative.id, 
-                    user_id, 
-                    use_ai=use_ai
+        Initiatives are scored concurrently (at most SCORE_CONCURRENCY at a
+        time, each on a session of its own) so their AI calls overlap, then
+        ranked once.
+        """
+        initiative_ids = (await self.db.scalars(select(Initiative.id))).all()
+        # End the read so this session holds no connection while scoring runs
+        await self.db.commit()
+        
+        semaphore = asyncio.Semaphore(SCORE_CONCURRENCY)
+        
+        async def score_one(initiative_id: int) -> InitiativeScoreSchema:
+            async with semaphore, AsyncSessionLocal() as db:
+                score = await ScoringService(db).calculate_initiative_score(
+                    initiative_id,
+                    user_id,
+                    use_ai=use_ai,
+                    update_rankings=False
                 )
-                results.append({"initiative_id": initiative.id, "success": True, "score": score})
-            except Exception as e:
-                results.append({"initiative_id": initiative.id, "success": False, "error": str(e)})
+                return InitiativeScoreSchema.model_validate(score)
+        
+        outcomes = await asyncio.gather(
+            *(score_one(initiative_id) for initiative_id in initiative_ids),
+            return_exceptions=True
+        )
+        
+        model = await self.get_active_scoring_model()
+        ranks = await self._update_rankings(model.id) if model else {}
+        
+        results = []
+        for initiative_id, outcome in zip(initiative_ids, outcomes):
+            if isinstance(outcome, Exception):
+                results.append({"initiative_id": initiative_id, "success": False, "error": str(outcome)})
+            else:
+                outcome.priority_rank = ranks.get(initiative_id)
+                results.append({"initiative_id": initiative_id, "success": True, "score": outcome})
         
         return results
     
-    def get_initiative_score_history(self, initiative_id: int) -> List[InitiativeScore]:
-        """Get score history for an initiative."""
-        return self.db.query(InitiativeScore).filter(
-            InitiativeScore.initiative_id == initiative_id
-        ).order_by(InitiativeScore.calculated_at.desc()).all()
+    async def get_initiative_score_history(self, initiative_id: int) -> AsyncIterator[InitiativeScore]:
+        """Stream score history for an initiative, newest first, fetching 100 rows at a time."""
+        scores = await self.db.stream_scalars(
+            safe_select(InitiativeScore).where(
+                InitiativeScore.initiative_id == initiative_id
+            ).order_by(InitiativeScore.calculated_at.desc()),
+            execution_options={"yield_per": SCORE_HISTORY_BATCH_SIZE}
+        )
+        async for score in scores:
+            yield score
     
-    def get_portfolio_rankings(
+    async def get_portfolio_rankings(
         self, 
         model_version_id: Optional[int] = None,
         limit: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Mapping[str, Any]]:
         """Get ranked list of initiatives."""
         if not model_version_id:
-            model = self.get_active_scoring_model()
+            model = await self.get_active_scoring_model()
             if not model:
                 return []
             model_version_id = model.id
         
-        query = self.db.query(InitiativeScore, Initiative).join(
+        # Ranked in SQL from the live scores, so only the requested top rows
+        # leave the database; rows come back as plain mappings keyed like
+        # RankingResponse, with no ORM objects (or relationship loads) involved
+        query = select(
+            Initiative.id.label("initiative_id"),
+            Initiative.title,
+            func.row_number().over(
+                order_by=(InitiativeScore.overall_score.desc(), InitiativeScore.id)
+            ).label("rank"),
+            InitiativeScore.overall_score,
+            InitiativeScore.value_score,
+            InitiativeScore.feasibility_score,
+            InitiativeScore.risk_score,
+            InitiativeScore.strategic_alignment_score,
+            InitiativeScore.score_justification.label("justification")
+        ).join(
             Initiative, InitiativeScore.initiative_id == Initiative.id
-        ).filter(
+        ).where(
             InitiativeScore.model_version_id == model_version_id
-        ).order_by(InitiativeScore.priority_rank.asc())
+        ).order_by(InitiativeScore.overall_score.desc(), InitiativeScore.id)
         
         if limit:
             query = query.limit(limit)
         
-        results = []
-        for score, initiative in query.all():
-            results.append({
-                "initiative_id": initiative.id,
-                "title": initiative.title,
-                "rank": score.priority_rank,
-                "overall_score": score.overall_score,
-                "value_score": score.value_score,
-                "feasibility_score": score.feasibility_score,
-                "risk_score": score.risk_score,
-                "strategic_alignment_score": score.strategic_alignment_score,
-                "justification": score.score_justification,
-                "ai_type": initiative.ai_type.value if initiative.ai_type else None
-            })
-        
-        return results
+        return (await self.db.execute(query)).mappings().all()
@@ -4,13 +4,13 @@ Provides semantic search capabilities using OpenAI embeddings for initiative mat
 Stores embeddings in JSON file for simplicity and portability.
 """
 
+import asyncio
 import json
 import os
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-from openai import OpenAI
-from app.core.config import settings
+from app.core.openai_client import get_openai_client, run_openai_call
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,7 +23,7 @@ class SemanticSearchService:
     """
     
     def __init__(self):
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        self.client = get_openai_client()
         self.embedding_model = "text-embedding-3-small"  # 1536 dimensions, cost-effective
         self.embedding_dimension = 1536
         self.embeddings_file = os.path.join(
@@ -34,6 +34,12 @@ class SemanticSearchService:
         self.embeddings_cache = None
         self.cache_loaded = False
         
+        # Concurrent embedding requests are coalesced into one API call
+        self.embedding_batch_size = 16
+        self.embedding_batch_window = 0.02  # seconds to wait for more requests
+        self._embedding_queue: Optional[asyncio.Queue] = None
+        self._embedding_worker: Optional[asyncio.Task] = None
+        
         # Ensure data directory exists
         os.makedirs(os.path.dirname(self.embeddings_file), exist_ok=True)
         
@@ -105,13 +111,10 @@ class SemanticSearchService:
             if not text:
                 raise ValueError("Text cannot be empty")
             
-            # Generate embedding
-            response = self.client.embeddings.create(
-                model=self.embedding_model,
-                input=text
-            )
-            
-            embedding = response.data[0].embedding
+            # Generate embedding (batched with any concurrent requests)
+            future = asyncio.get_running_loop().create_future()
+            await self._get_embedding_queue().put((text, future))
+            embedding = await future
             logger.debug(f"Generated embedding of dimension {len(embedding)}")
             
             return embedding
@@ -119,6 +122,53 @@ class SemanticSearchService:
             logger.error(f"Error generating embedding: {e}")
             raise
     
+    def _get_embedding_queue(self) -> asyncio.Queue:
+        """Return the embedding request queue, starting its worker on the current loop if needed."""
+        loop = asyncio.get_running_loop()
+        worker = self._embedding_worker
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            self._embedding_queue = asyncio.Queue()
+            self._embedding_worker = loop.create_task(self._embedding_batch_worker(self._embedding_queue))
+        return self._embedding_queue
+    
+    async def _embedding_batch_worker(self, queue: asyncio.Queue):
+        """
+        Drain queued embedding requests and send them to OpenAI in batches.
+        
+        Waits up to embedding_batch_window after the first request for more to
+        arrive (up to embedding_batch_size), then issues a single embeddings
+        call and resolves each request's future with its vector.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[str, asyncio.Future]] = [await queue.get()]
+            deadline = loop.time() + self.embedding_batch_window
+            while len(batch) < self.embedding_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                response = await run_openai_call(
+                    self.client.embeddings.create,
+                    model=self.embedding_model,
+                    input=[text for text, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            items = sorted(response.data, key=lambda item: item.index)
+            for item, (_, future) in zip(items, batch):
+                if not future.done():
+                    future.set_result(item.embedding)
+    
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Calculate cosine similarity between two vectors."""
         vec1_np = np.array(vec1)
@@ -192,6 +242,23 @@ class SemanticSearchService:
             logger.error(f"Error storing initiative embedding: {e}")
             raise
     
+    async def add_or_update_initiative_embedding(self, initiative: Dict[str, Any]):
+        """
+        Create or replace the stored embedding for an initiative.
+        
+        Args:
+            initiative: Initiative data dict with id, title, description and
+                optional business_objective, ai_pattern and status
+        """
+        await self.store_initiative_embedding(
+            initiative_id=initiative["id"],
+            title=initiative.get("title", ""),
+            description=initiative.get("description", ""),
+            business_objective=initiative.get("business_objective", ""),
+            ai_pattern=initiative.get("ai_pattern", ""),
+            status=initiative.get("status", "")
+        )
+    
     async def find_similar_initiatives(
         self,
         query_text: str,
@@ -395,16 +462,12 @@ class SemanticSearchService:
                 }
             }
             
-            # Generate embeddings for each initiative
-            for initiative in initiatives:
-                await self.store_initiative_embedding(
-                    initiative_id=initiative["id"],
-                    title=initiative.get("title", ""),
-                    description=initiative.get("description", ""),
-                    business_objective=initiative.get("business_objective", ""),
-                    ai_pattern=initiative.get("ai_pattern", ""),
-                    status=initiative.get("status", "")
-                )
+            # Generate embeddings for all initiatives concurrently so the
+            # requests are sent to OpenAI in batches
+            await asyncio.gather(*(
+                self.add_or_update_initiative_embedding(initiative)
+                for initiative in initiatives
+            ))
             
             logger.info(f"Successfully rebuilt {len(initiatives)} embeddings")
         except Exception as e:
@@ -0,0 +1,31 @@
+import threading
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.endpoints.reporting import _stream_agent_events
+from app.main import StreamingGZipMiddleware
+
+
+def test_agent_events_stream_uncompressed_and_read_on_openai_pool():
+    reader_threads = []
+
+    def deltas():
+        for chunk in ['{"title": "', "x" * 2000, '", "points": [1, 2]}']:
+            reader_threads.append(threading.current_thread().name)
+            yield chunk
+
+    app = FastAPI()
+    app.add_middleware(StreamingGZipMiddleware, minimum_size=1024, compresslevel=5)
+
+    @app.get("/stream")
+    async def stream():
+        return await _stream_agent_events(deltas, lambda data: {"points": data["points"]})
+
+    response = TestClient(app).get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "identity"
+    events = response.content.split(b"\n\n")
+    assert events[0].startswith(b'data: {"path":["title"]')
+    assert b'event: done\ndata: {"points":[1,2]}' in events
+    assert reader_threads and all(name.startswith("openai") for name in reader_threads)
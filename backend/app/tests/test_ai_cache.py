@@ -0,0 +1,62 @@
+import asyncio
+
+from app.services.ai_cache import AIResponseCache, _split_text
+
+
+def test_concurrent_identical_calls_share_one_request():
+    cache = AIResponseCache()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"success": True, "data": "{}"}
+
+    async def burst():
+        return await asyncio.gather(*(
+            cache.get_or_call("summary", {"period": "Q1", "values": [1, 2]}, call) for _ in range(5)
+        ))
+
+    results = asyncio.run(burst())
+
+    assert len(calls) == 1
+    assert all(result == {"success": True, "data": "{}"} for result in results)
+    assert cache._inflight == {}
+
+
+def test_failed_calls_are_shared_but_not_cached():
+    cache = AIResponseCache()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"success": False, "error": "rate limited"}
+
+    async def burst():
+        return await asyncio.gather(*(cache.get_or_call("summary", {"period": "Q1"}, call) for _ in range(3)))
+
+    assert [result["error"] for result in asyncio.run(burst())] == ["rate limited"] * 3
+    assert len(calls) == 1
+
+    asyncio.run(burst())
+    assert len(calls) == 2
+
+
+def test_only_prose_is_free_text():
+    narrative = "Portfolio delivery stayed on track with two initiatives launched"
+    structure, texts = _split_text({
+        "period_start": "2024-01-01",
+        "period_end": "2024-03-31",
+        "audience": "board",
+        "risk_tier": "High Risk",
+        "notes": narrative,
+        "summary": "Budget grew 12% in Q1 2024 across all business units",
+    })
+
+    assert texts == [narrative, "Budget grew 12% in Q1 2024 across all business units"]
+    assert structure["period_end"] == "2024-03-31"
+    assert structure["risk_tier"] == "High Risk"
+    assert _split_text({"summary": "Budget grew 15% in Q2 2024 across all business units"})[0] != _split_text(
+        {"summary": "Budget grew 12% in Q1 2024 across all business units"}
+    )[0]
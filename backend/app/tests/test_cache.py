@@ -0,0 +1,36 @@
+from app.core.cache import TTLCache
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(ttl_seconds=10)
+
+    cache.set("key", {"value": 1})
+    assert cache.get("key") == {"value": 1}
+
+    now[0] += 11
+    assert cache.get("key") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(ttl_seconds=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_drops_values_computed_before_a_clear():
+    cache = TTLCache(ttl_seconds=60)
+    generation = cache.generation
+    cache.clear()
+    cache.set("dashboard", "stale", generation)
+    assert cache.get("dashboard") is None
+
+    cache.set("dashboard", "fresh", cache.generation)
+    assert cache.get("dashboard") == "fresh"
@@ -0,0 +1,40 @@
+import asyncio
+import gzip
+
+from app.main import StreamingGZipMiddleware
+
+HEADERS = [(b"accept-encoding", b"gzip, deflate")]
+
+
+async def _send_through_gzip(body_messages, content_type=b"text/event-stream"):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", content_type)]})
+        for message in body_messages:
+            await send({"type": "http.response.body", **message})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = StreamingGZipMiddleware(app, minimum_size=1024, compresslevel=5)
+    await middleware({"type": "http", "headers": HEADERS}, None, send)
+    return sent
+
+
+def test_streamed_chunks_are_sent_uncompressed_as_they_arrive():
+    events = [b"data: " + b"x" * 2000 + b"\n\n", b"data: done\n\n"]
+    sent = asyncio.run(_send_through_gzip(
+        [{"body": event, "more_body": True} for event in events] + [{"body": b"", "more_body": False}]
+    ))
+
+    assert b"content-encoding" not in dict(sent[0]["headers"])
+    assert [message["body"] for message in sent[1:]] == events + [b""]
+
+
+def test_single_body_responses_are_still_compressed():
+    body = b'{"narrative": "' + b"y" * 4000 + b'"}'
+    sent = asyncio.run(_send_through_gzip([{"body": body}], content_type=b"application/json"))
+
+    assert dict(sent[0]["headers"])[b"content-encoding"] == b"gzip"
+    assert gzip.decompress(sent[1]["body"]) == body
@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base, insert_returning
+from app.models.governance import Policy
+
+
+@pytest.fixture()
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize("returning", [True, False])
+def test_insert_returning_populates_detached_object(engine, monkeypatch, returning):
+    # returning=False stands in for MySQL, which has no INSERT ... RETURNING
+    monkeypatch.setattr(engine.dialect, "insert_returning", returning)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    db = sessionmaker(bind=engine)()
+
+    policy = insert_returning(db, Policy, {"title": "Ethics", "description": "d", "content": "c"})
+
+    inserts = [statement for statement in statements if statement.startswith("INSERT")]
+    assert len(inserts) == 1
+    assert ("RETURNING" in inserts[0]) == returning
+    assert inspect(policy).detached
+    assert policy.id is not None
+    assert (policy.title, policy.version, policy.status) == ("Ethics", "1.0", "active")
+    assert db.get(Policy, policy.id).title == "Ethics"
+    db.close()
@@ -0,0 +1,43 @@
+import orjson
+
+from app.core.json_stream import StreamingJsonParser
+
+
+def _feed_in_chunks(text, size):
+    parser = StreamingJsonParser()
+    events = []
+    for start in range(0, len(text), size):
+        events.extend(parser.feed(text[start:start + size]))
+    return events
+
+
+def test_parser_reports_fields_as_they_complete():
+    document = {
+        "narrative": 'A "strong" quarter, {mostly} \\ on track',
+        "key_points": ["growth", "risk, reduced", "next]"],
+        "chart_recommendations": [{"chart_type": "bar", "values": [1, 2]}],
+        "confidence_score": 0.85,
+        "word_count": -3,
+        "draft": False,
+        "notes": None,
+    }
+    text = orjson.dumps(document, option=orjson.OPT_INDENT_2).decode()
+
+    for size in (1, 3, 7, len(text)):
+        events = _feed_in_chunks(text, size)
+
+        assert events[0] == (("narrative",), document["narrative"])
+        assert (("key_points", 1), "risk, reduced") in events
+        assert events.index((("key_points", 2), "next]")) < events.index((("key_points",), document["key_points"]))
+        assert (("chart_recommendations", 0), document["chart_recommendations"][0]) in events
+        assert (("word_count",), -3) in events
+        assert (("notes",), None) in events
+        assert events[-1] == ((), document)
+
+
+def test_parser_waits_for_incomplete_values():
+    parser = StreamingJsonParser()
+
+    assert list(parser.feed('{"narrative": "unfinished')) == []
+    assert list(parser.feed('", "word_count": 25')) == [(("narrative",), "unfinished")]
+    assert list(parser.feed("0}")) == [(("word_count",), 250), ((), {"narrative": "unfinished", "word_count": 250})]
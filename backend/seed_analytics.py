@@ -2,8 +2,11 @@
 """
 Standalone script to seed analytics test data.
 Run this from the backend directory: python seed_analytics.py
+Existing seeded rows are kept; pass --force to delete all initiatives and
+risks first: python seed_analytics.py --force
 """
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -15,10 +18,14 @@ from app.core.database import SessionLocal
 from app.core.seed_analytics_data import seed_analytics_data
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--force", action="store_true", help="Delete existing initiatives and risks before seeding")
+    args = parser.parse_args()
+    
     print("Starting analytics data seeding...")
     db = SessionLocal()
     try:
-        seed_analytics_data(db)
+        seed_analytics_data(db, force=args.force)
         print("\n✅ Analytics data seeding completed successfully!")
     except Exception as e:
         print(f"\n❌ Error during seeding: {str(e)}")
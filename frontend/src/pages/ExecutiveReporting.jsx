@@ -5,12 +5,13 @@ import {
   fetchPortfolioHealth,
   fetchValuePipeline,
   fetchDeliveredValue,
-  fetchRiskExposure
+  fetchRiskExposure,
+  streamNarrative
 } from '../store/slices/reportingSlice';
 
 const ExecutiveReporting = () => {
   const dispatch = useDispatch();
-  const { dashboards, loading, error } = useSelector((state) => state.reporting);
+  const { dashboards, loading, error, aiResults } = useSelector((state) => state.reporting);
 
   useEffect(() => {
     dispatch(fetchPortfolioHealth());
@@ -23,6 +24,16 @@ const ExecutiveReporting = () => {
   const valuePipeline = dashboards.valuePipeline;
   const deliveredValue = dashboards.deliveredValue;
   const riskExposure = dashboards.riskExposure;
+  const narrative = aiResults.narrative;
+
+  const handleGenerateNarrative = () => {
+    // Fields render as they stream in (see narrativeFieldReceived)
+    dispatch(streamNarrative({
+      portfolio_data: { portfolioHealth, valuePipeline, deliveredValue, riskExposure },
+      report_type: 'executive_summary',
+      audience: 'board'
+    }));
+  };
 
   const getHealthColor = (score) => {
     if (score >= 80) return 'text-green-600';
@@ -193,6 +204,43 @@ const ExecutiveReporting = () => {
         </Link>
       </div>
 
+      {/* Executive Narrative */}
+      <div className="bg-white rounded-lg shadow p-6 mb-6">
+        <div className="flex items-center justify-between mb-4">
+          <h2 className="text-xl font-semibold">Executive Narrative</h2>
+          <button
+            onClick={handleGenerateNarrative}
+            disabled={loading.aiNarrative || !portfolioHealth}
+            className="px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 disabled:opacity-50"
+          >
+            {loading.aiNarrative ? 'Generating...' : 'Generate Narrative'}
+          </button>
+        </div>
+        {error.aiNarrative && (
+          <div className="text-sm text-red-600 mb-2">{error.aiNarrative}</div>
+        )}
+        {narrative ? (
+          <div>
+            {narrative.narrative && (
+              <p className="text-gray-800 whitespace-pre-line mb-4">{narrative.narrative}</p>
+            )}
+            {narrative.key_points?.length > 0 && (
+              <ul className="list-disc list-inside space-y-1 text-gray-700">
+                {narrative.key_points.map((point, index) => (
+                  <li key={index}>{point}</li>
+                ))}
+              </ul>
+            )}
+          </div>
+        ) : (
+          !loading.aiNarrative && (
+            <div className="text-sm text-gray-600">
+              Summarize the dashboards above for a board audience with AI
+            </div>
+          )
+        )}
+      </div>
+
       {/* Quick Actions */}
       <div className="bg-white rounded-lg shadow p-6">
         <h2 className="text-xl font-semibold mb-4">Quick Actions</h2>
@@ -1,6 +1,10 @@
 import { createSlice, createAsyncThunk } from '@reduxjs/toolkit';
 import axios from '../../api/axios';
 
+const SIMULATION_POLL_INTERVAL_MS = 1000;
+// Stop polling after this many status checks (about 5 minutes)
+const SIMULATION_POLL_MAX_ATTEMPTS = 300;
+
 // Async thunks for portfolio operations
 
 // Get portfolio balance
@@ -54,7 +58,25 @@ export const simulatePortfolioScenario = createAsyncThunk(
         scenario,
         initiative_ids: initiativeIds
       });
-      return response.data;
+      const simulationId = response.data.id;
+
+      // Optimization runs in the background; poll until it finishes
+      let { status, error_message: errorMessage } = response.data;
+      for (let attempt = 0; status === 'queued' || status === 'running'; attempt += 1) {
+        if (attempt >= SIMULATION_POLL_MAX_ATTEMPTS) {
+          return rejectWithValue('Simulation is taking longer than expected; check the saved simulations later');
+        }
+        await new Promise((resolve) => setTimeout(resolve, SIMULATION_POLL_INTERVAL_MS));
+        ({ data: { status, error_message: errorMessage } } = await axios.get(
+          `/portfolio/simulations/${simulationId}/status`
+        ));
+      }
+      if (status === 'error') {
+        return rejectWithValue(errorMessage || 'Failed to simulate portfolio scenario');
+      }
+
+      const result = await axios.get(`/portfolio/simulations/${simulationId}`);
+      return result.data;
     } catch (error) {
       return rejectWithValue(error.response?.data?.detail || 'Failed to simulate portfolio scenario');
     }
@@ -162,6 +162,54 @@ export const generateNarrative = createAsyncThunk(
   }
 );
 
+// Streams the narrative over Server-Sent Events so fields render as they are
+// generated. EventSource cannot POST a body or send the auth header, so the
+// event stream is read from fetch directly.
+export const streamNarrative = createAsyncThunk(
+  'reporting/streamNarrative',
+  async (data, { dispatch, rejectWithValue }) => {
+    try {
+      const token = localStorage.getItem('token');
+      const response = await fetch(`${axios.defaults.baseURL}/reporting/ai/generate-narrative/stream`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          ...(token ? { Authorization: `Bearer ${token}` } : {}),
+        },
+        body: JSON.stringify(data),
+      });
+      if (!response.ok) {
+        const error = await response.json().catch(() => ({}));
+        return rejectWithValue(error.detail || 'Failed to generate narrative');
+      }
+
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      for (;;) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+          const lines = buffer.slice(0, boundary).split('\n');
+          buffer = buffer.slice(boundary + 2);
+          const event = lines.find((line) => line.startsWith('event: '))?.slice(7) || 'message';
+          const payload = JSON.parse(lines.find((line) => line.startsWith('data: ')).slice(6));
+
+          if (event === 'done') return payload;
+          if (event === 'error') return rejectWithValue(payload.detail || 'Failed to generate narrative');
+          dispatch(narrativeFieldReceived(payload));
+        }
+      }
+      return rejectWithValue('Narrative stream ended unexpectedly');
+    } catch (error) {
+      return rejectWithValue(error.message || 'Failed to generate narrative');
+    }
+  }
+);
+
 export const explainTradeoffs = createAsyncThunk(
   'reporting/explainTradeoffs',
   async (data, { rejectWithValue }) => {
@@ -331,6 +379,21 @@ const reportingSlice = createSlice({
         recommendations: null,
       };
     },
+    narrativeFieldReceived: (state, action) => {
+      // Assign a streamed field (e.g. ['key_points', 2]) into the partial narrative
+      const { path, value } = action.payload;
+      if (!state.aiResults.narrative) {
+        state.aiResults.narrative = {};
+      }
+      let target = state.aiResults.narrative;
+      path.slice(0, -1).forEach((key, i) => {
+        if (target[key] == null) {
+          target[key] = typeof path[i + 1] === 'number' ? [] : {};
+        }
+        target = target[key];
+      });
+      target[path[path.length - 1]] = value;
+    },
     clearErrors: (state) => {
       state.error = {
         valuePipeline: null,
@@ -526,6 +589,19 @@ const reportingSlice = createSlice({
       .addCase(generateNarrative.rejected, (state, action) => {
         state.loading.aiNarrative = false;
         state.error.aiNarrative = action.payload;
+      })
+      .addCase(streamNarrative.pending, (state) => {
+        state.loading.aiNarrative = true;
+        state.error.aiNarrative = null;
+        state.aiResults.narrative = null;
+      })
+      .addCase(streamNarrative.fulfilled, (state, action) => {
+        state.loading.aiNarrative = false;
+        state.aiResults.narrative = action.payload;
+      })
+      .addCase(streamNarrative.rejected, (state, action) => {
+        state.loading.aiNarrative = false;
+        state.error.aiNarrative = action.payload;
       });
     
     // AI Tradeoffs
@@ -635,5 +711,5 @@ const reportingSlice = createSlice({
   },
 });
 
-export const { clearAiResults, clearErrors } = reportingSlice.actions;
+export const { clearAiResults, narrativeFieldReceived, clearErrors } = reportingSlice.actions;
 export default reportingSlice.reducer;